@@ -4,12 +4,6 @@ Octopus Ink Slime Game
 Main entry point for the game.
 """
 
-import sys
-import os
-
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
 from src.engine.game_engine import GameEngine
 from src.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, GAME_TITLE
 
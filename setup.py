@@ -6,11 +6,79 @@ This script installs required dependencies, sets up the game environment, and cr
 
 import os
 import sys
+import json
 import shutil
 import subprocess
 import platform
 from pathlib import Path
 
+# importlib.metadata is only available from Python 3.8
+try:
+    from importlib import metadata
+except ImportError:
+    metadata = None
+
+
+# Host platform, looked up once
+SYSTEM = platform.system()
+
+# Default contents of config.ini
+CONFIG_TEMPLATE = """\
+[Graphics]
+fullscreen = False
+resolution = 800x600
+vsync = True
+
+[Audio]
+music_volume = 0.7
+sound_volume = 1.0
+
+[Controls]
+move_up = UP
+move_down = DOWN
+move_left = LEFT
+move_right = RIGHT
+shoot = SPACE
+pause = ESCAPE
+debug = F3
+"""
+
+# Linux .desktop entry, formatted with the interpreter and game paths
+DESKTOP_ENTRY_TEMPLATE = """\
+[Desktop Entry]
+Type=Application
+Name=Octopus Ink Slime
+Exec={python} {main_path}
+Path={game_dir}
+Terminal=false
+Categories=Game;
+"""
+
+# macOS app bundle launcher script, formatted like the .desktop entry
+LAUNCHER_TEMPLATE = """\
+#!/bin/bash
+cd {game_dir}
+{python} {main_path}
+"""
+
+# macOS app bundle Info.plist
+INFO_PLIST = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
+<plist version="1.0">
+<dict>
+    <key>CFBundleExecutable</key>
+    <string>launcher.sh</string>
+    <key>CFBundleIdentifier</key>
+    <string>com.octopus.inkslime</string>
+    <key>CFBundleName</key>
+    <string>Octopus Ink Slime</string>
+    <key>CFBundlePackageType</key>
+    <string>APPL</string>
+</dict>
+</plist>
+"""
+
 
 def print_header(message):
     """Print a formatted header message."""
@@ -37,8 +105,41 @@ def check_python_version():
     return True
 
 
-def install_dependencies():
-    """Install required dependencies using pip."""
+def _version_tuple(version):
+    """Turn a version string into a tuple of its leading numeric parts."""
+    parts = []
+    for part in version.split("."):
+        digits = ""
+        for char in part:
+            if not char.isdigit():
+                break
+            digits += char
+        if not digits:
+            break
+        parts.append(int(digits))
+    return tuple(parts)
+
+
+def _is_satisfied(spec):
+    """Check whether a "name>=version" requirement is already installed."""
+    if metadata is None:
+        return False
+    
+    name, _, minimum = spec.partition(">=")
+    try:
+        installed = metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return False
+    
+    return _version_tuple(installed) >= _version_tuple(minimum)
+
+
+def install_dependencies(upgrade_pip=False):
+    """Install required dependencies using pip.
+    
+    Args:
+        upgrade_pip: Also upgrade pip itself (in the same pip invocation)
+    """
     print_step("Installing dependencies...")
     
     dependencies = [
@@ -48,9 +149,18 @@ def install_dependencies():
         "pillow>=8.0.0",  # For image processing
     ]
     
+    # Only hand pip what is not installed yet; pip takes a while to start
+    missing = [spec for spec in dependencies if not _is_satisfied(spec)]
+    if not missing and not upgrade_pip:
+        print("Dependencies already installed.")
+        return True
+    
+    command = [sys.executable, "-m", "pip", "install"]
+    if upgrade_pip:
+        command += ["--upgrade", "pip"]
+    
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "--upgrade", "pip"])
-        subprocess.check_call([sys.executable, "-m", "pip", "install"] + dependencies)
+        subprocess.check_call(command + missing)
         print("Dependencies installed successfully.")
         return True
     except subprocess.CalledProcessError as e:
@@ -58,6 +168,16 @@ def install_dependencies():
         return False
 
 
+def _mkdir_optimistic(path):
+    """Create a directory, only walking its parents if they are missing."""
+    try:
+        os.mkdir(path)
+    except FileExistsError:
+        pass
+    except FileNotFoundError:
+        os.makedirs(path, exist_ok=True)
+
+
 def create_directories():
     """Create necessary directories if they don't exist."""
     print_step("Creating directories...")
@@ -72,113 +192,125 @@ def create_directories():
         "data",
     ]
     
-    for directory in directories:
-        os.makedirs(directory, exist_ok=True)
+    # Shallow paths first so deeper ones only need a single mkdir
+    for directory in sorted(directories, key=lambda d: d.count("/")):
+        _mkdir_optimistic(directory)
         print(f"Created directory: {directory}")
     
     return True
 
 
-def create_desktop_shortcut():
-    """Create a desktop shortcut for the game."""
-    print_step("Creating desktop shortcut...")
+def _create_windows_shortcut(main_path, game_dir):
+    """Create a Windows .lnk shortcut on the desktop."""
+    desktop_path = os.path.join(os.path.expanduser("~"), "Desktop")
+    shortcut_path = os.path.join(desktop_path, "Octopus Ink Slime.lnk")
     
-    # Get the desktop path
-    if platform.system() == "Windows":
-        desktop_path = os.path.join(os.path.expanduser("~"), "Desktop")
-        shortcut_path = os.path.join(desktop_path, "Octopus Ink Slime.lnk")
+    try:
+        # Create a Windows shortcut
+        import winshell
+        from win32com.client import Dispatch
         
-        try:
-            # Create a Windows shortcut
-            import winshell
-            from win32com.client import Dispatch
-            
-            shell = Dispatch('WScript.Shell')
-            shortcut = shell.CreateShortCut(shortcut_path)
-            shortcut.Targetpath = sys.executable
-            shortcut.Arguments = os.path.abspath("main.py")
-            shortcut.WorkingDirectory = os.path.abspath(".")
-            shortcut.IconLocation = os.path.abspath("assets/images/icon.ico")
-            shortcut.save()
-            
-            print(f"Created desktop shortcut at: {shortcut_path}")
-            return True
-        except ImportError:
-            print("Could not create Windows shortcut. Please install pywin32 and winshell.")
-            return False
-        except Exception as e:
-            print(f"Error creating Windows shortcut: {e}")
-            return False
-    
-    elif platform.system() == "Linux":
-        desktop_path = os.path.join(os.path.expanduser("~"), "Desktop")
-        shortcut_path = os.path.join(desktop_path, "octopus-ink-slime.desktop")
+        shell = Dispatch('WScript.Shell')
+        shortcut = shell.CreateShortCut(shortcut_path)
+        shortcut.Targetpath = sys.executable
+        shortcut.Arguments = main_path
+        shortcut.WorkingDirectory = game_dir
+        shortcut.IconLocation = os.path.join(game_dir, "assets", "images", "icon.ico")
+        shortcut.save()
         
-        try:
-            # Create a Linux .desktop file
-            with open(shortcut_path, "w") as f:
-                f.write("[Desktop Entry]\n")
-                f.write("Type=Application\n")
-                f.write("Name=Octopus Ink Slime\n")
-                f.write(f"Exec={sys.executable} {os.path.abspath('main.py')}\n")
-                f.write(f"Path={os.path.abspath('.')}\n")
-                f.write("Terminal=false\n")
-                f.write("Categories=Game;\n")
-                
-            # Make the .desktop file executable
-            os.chmod(shortcut_path, 0o755)
+        print(f"Created desktop shortcut at: {shortcut_path}")
+        return True
+    except ImportError:
+        print("Could not create Windows shortcut. Please install pywin32 and winshell.")
+        return False
+    except Exception as e:
+        print(f"Error creating Windows shortcut: {e}")
+        return False
+
+
+def _create_linux_shortcut(main_path, game_dir):
+    """Create a Linux .desktop file on the desktop."""
+    desktop_path = os.path.join(os.path.expanduser("~"), "Desktop")
+    shortcut_path = os.path.join(desktop_path, "octopus-ink-slime.desktop")
+    
+    try:
+        # Create a Linux .desktop file
+        with open(shortcut_path, "w") as f:
+            f.write(DESKTOP_ENTRY_TEMPLATE.format(
+                python=sys.executable,
+                main_path=main_path,
+                game_dir=game_dir
+            ))
             
-            print(f"Created desktop shortcut at: {shortcut_path}")
-            return True
-        except Exception as e:
-            print(f"Error creating Linux shortcut: {e}")
-            return False
+        # Make the .desktop file executable
+        os.chmod(shortcut_path, 0o755)
+        
+        print(f"Created desktop shortcut at: {shortcut_path}")
+        return True
+    except Exception as e:
+        print(f"Error creating Linux shortcut: {e}")
+        return False
+
+
+def _create_macos_shortcut(main_path, game_dir):
+    """Create a macOS .app bundle on the desktop."""
+    desktop_path = os.path.join(os.path.expanduser("~"), "Desktop")
+    app_path = os.path.join(desktop_path, "Octopus Ink Slime.app")
+    macos_dir = os.path.join(app_path, "Contents", "MacOS")
+    launcher_path = os.path.join(macos_dir, "launcher.sh")
     
-    elif platform.system() == "Darwin":  # macOS
-        desktop_path = os.path.join(os.path.expanduser("~"), "Desktop")
-        app_path = os.path.join(desktop_path, "Octopus Ink Slime.app")
+    try:
+        # Create a macOS .app bundle
+        os.makedirs(macos_dir, exist_ok=True)
         
-        try:
-            # Create a macOS .app bundle
-            os.makedirs(os.path.join(app_path, "Contents", "MacOS"), exist_ok=True)
+        # Create the launcher script
+        with open(launcher_path, "w") as f:
+            f.write(LAUNCHER_TEMPLATE.format(
+                python=sys.executable,
+                main_path=main_path,
+                game_dir=game_dir
+            ))
             
-            # Create the launcher script
-            with open(os.path.join(app_path, "Contents", "MacOS", "launcher.sh"), "w") as f:
-                f.write("#!/bin/bash\n")
-                f.write(f"cd {os.path.abspath('.')}\n")
-                f.write(f"{sys.executable} {os.path.abspath('main.py')}\n")
-                
-            # Make the launcher script executable
-            os.chmod(os.path.join(app_path, "Contents", "MacOS", "launcher.sh"), 0o755)
+        # Make the launcher script executable
+        os.chmod(launcher_path, 0o755)
+        
+        # Create the Info.plist file
+        with open(os.path.join(app_path, "Contents", "Info.plist"), "w") as f:
+            f.write(INFO_PLIST)
             
-            # Create the Info.plist file
-            with open(os.path.join(app_path, "Contents", "Info.plist"), "w") as f:
-                f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-                f.write('<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">\n')
-                f.write('<plist version="1.0">\n')
-                f.write('<dict>\n')
-                f.write('    <key>CFBundleExecutable</key>\n')
-                f.write('    <string>launcher.sh</string>\n')
-                f.write('    <key>CFBundleIdentifier</key>\n')
-                f.write('    <string>com.octopus.inkslime</string>\n')
-                f.write('    <key>CFBundleName</key>\n')
-                f.write('    <string>Octopus Ink Slime</string>\n')
-                f.write('    <key>CFBundlePackageType</key>\n')
-                f.write('    <string>APPL</string>\n')
-                f.write('</dict>\n')
-                f.write('</plist>\n')
-                
-            print(f"Created desktop shortcut at: {app_path}")
-            return True
-        except Exception as e:
-            print(f"Error creating macOS shortcut: {e}")
-            return False
-    
-    else:
-        print(f"Unsupported platform: {platform.system()}")
+        print(f"Created desktop shortcut at: {app_path}")
+        return True
+    except Exception as e:
+        print(f"Error creating macOS shortcut: {e}")
         return False
 
 
+def _unsupported_shortcut(main_path, game_dir):
+    """Report that shortcuts are not supported on this platform."""
+    print(f"Unsupported platform: {SYSTEM}")
+    return False
+
+
+# Shortcut creator for each platform.system() value
+SHORTCUT_CREATORS = {
+    "Windows": _create_windows_shortcut,
+    "Linux": _create_linux_shortcut,
+    "Darwin": _create_macos_shortcut,
+}
+
+
+def create_desktop_shortcut():
+    """Create a desktop shortcut for the game."""
+    print_step("Creating desktop shortcut...")
+    
+    # Resolve the game paths once for whichever platform needs them
+    game_dir = os.path.abspath(".")
+    main_path = os.path.join(game_dir, "main.py")
+    
+    creator = SHORTCUT_CREATORS.get(SYSTEM, _unsupported_shortcut)
+    return creator(main_path, game_dir)
+
+
 def setup_game():
     """Set up the game environment."""
     print_step("Setting up game environment...")
@@ -187,34 +319,15 @@ def setup_game():
     config_path = "config.ini"
     if not os.path.exists(config_path):
         with open(config_path, "w") as f:
-            f.write("[Graphics]\n")
-            f.write("fullscreen = False\n")
-            f.write("resolution = 800x600\n")
-            f.write("vsync = True\n")
-            f.write("\n")
-            f.write("[Audio]\n")
-            f.write("music_volume = 0.7\n")
-            f.write("sound_volume = 1.0\n")
-            f.write("\n")
-            f.write("[Controls]\n")
-            f.write("move_up = UP\n")
-            f.write("move_down = DOWN\n")
-            f.write("move_left = LEFT\n")
-            f.write("move_right = RIGHT\n")
-            f.write("shoot = SPACE\n")
-            f.write("pause = ESCAPE\n")
-            f.write("debug = F3\n")
+            f.write(CONFIG_TEMPLATE)
             
         print(f"Created configuration file: {config_path}")
     
     # Create a high scores file
     scores_path = "data/highscores.json"
     if not os.path.exists(scores_path):
-        os.makedirs(os.path.dirname(scores_path), exist_ok=True)
         with open(scores_path, "w") as f:
-            f.write("{\n")
-            f.write('    "scores": []\n')
-            f.write("}\n")
+            f.write(json.dumps({"scores": []}, indent=4) + "\n")
             
         print(f"Created high scores file: {scores_path}")
     
@@ -244,7 +357,7 @@ def main():
         sys.exit(1)
     
     # Install dependencies
-    if not install_dependencies():
+    if not install_dependencies(upgrade_pip="--upgrade-pip" in sys.argv[1:]):
         print("Warning: Some dependencies could not be installed.")
         
     # Create directories
@@ -254,7 +367,7 @@ def main():
     setup_game()
     
     # Make main.py executable
-    if platform.system() != "Windows":
+    if SYSTEM != "Windows":
         make_executable()
     
     # Create desktop shortcut
@@ -264,7 +377,7 @@ def main():
     print("\nYou can now run the game by executing:")
     print(f"  {sys.executable} main.py")
     
-    if platform.system() == "Windows":
+    if SYSTEM == "Windows":
         print("\nOr double-click on the desktop shortcut.")
     else:
         print("\nOr use the desktop shortcut.")
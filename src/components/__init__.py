@@ -1,19 +1,28 @@
-"""Components package for the Entity-Component System."""
-
-from src.components.component import Component
-from src.components.transform_component import TransformComponent
-from src.components.render_component import RenderComponent
-from src.components.physics_component import PhysicsComponent
-from src.components.input_component import InputComponent
-from src.components.ai_component import AIComponent
-from src.components.health_component import HealthComponent
-from src.components.weapon_component import WeaponComponent
-from src.components.animation_component import AnimationComponent
-from src.components.collision_component import CollisionComponent
-from src.components.ink_slime_component import InkSlimeComponent
-from src.components.ship_ink_load_component import ShipInkLoadComponent
-from src.components.captain_component import CaptainComponent
-from src.components.shield_component import ShieldComponent
+"""Components package for the Entity-Component System.
+
+Component classes are imported lazily on first access so importing one
+component does not load every component module.
+"""
+
+import importlib
+
+# Public name -> module inside this package
+_LAZY = {
+    'Component': 'component',
+    'TransformComponent': 'transform_component',
+    'RenderComponent': 'render_component',
+    'PhysicsComponent': 'physics_component',
+    'InputComponent': 'input_component',
+    'AIComponent': 'ai_component',
+    'HealthComponent': 'health_component',
+    'WeaponComponent': 'weapon_component',
+    'AnimationComponent': 'animation_component',
+    'CollisionComponent': 'collision_component',
+    'InkSlimeComponent': 'ink_slime_component',
+    'ShipInkLoadComponent': 'ship_ink_load_component',
+    'CaptainComponent': 'captain_component',
+    'ShieldComponent': 'shield_component',
+}
 
 __all__ = [
     'Component',
@@ -30,4 +39,19 @@ __all__ = [
     'ShipInkLoadComponent',
     'CaptainComponent',
     'ShieldComponent',
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import a component class on first access (PEP 562)."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{_LAZY[name]}")
+    attr = getattr(module, name)
+    globals()[name] = attr
+    return attr
+
+
+def __dir__():
+    """List the lazily exported names alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
@@ -5,6 +5,22 @@ import math
 from src.components.component import Component
 
 
+# Bound once to skip the module attribute lookups in the per-frame handlers
+_uniform = random.uniform
+_getrandbits = random.getrandbits
+_sin = math.sin
+_cos = math.cos
+_hypot = math.hypot
+
+# Unit vectors for fish wander directions, indexed with random.getrandbits
+_WANDER_TABLE_BITS = 10
+_WANDER_TABLE = [
+    (math.cos(2 * math.pi * i / (1 << _WANDER_TABLE_BITS)),
+     math.sin(2 * math.pi * i / (1 << _WANDER_TABLE_BITS)))
+    for i in range(1 << _WANDER_TABLE_BITS)
+]
+
+
 class AIComponent(Component):
     """Component that controls AI behavior for non-player entities."""
     
@@ -18,6 +34,8 @@ class AIComponent(Component):
         super().__init__("ai")
         
         self.ai_type: str = ai_type
+        self._update_fn = self._resolve_update_fn(ai_type)
+        self.has_behavior: bool = self._update_fn != self._noop
         self.target_entity = None
         self.patrol_points = []
         self.current_patrol_index = 0
@@ -43,41 +61,91 @@ class AIComponent(Component):
         self.wander_direction = [0.0, 0.0]
         self.wander_change_interval = kwargs.get('wander_change_interval', 2.0)
         
+        # Set while an AISystem drives this component in batch
+        self.batched = False
+        
+        # Cached sibling components (refreshed when the entity's components change)
+        self._physics = None
+        self._transform = None
+        self._shield = None
+        
+    def on_add(self) -> None:
+        """Cache sibling components when added to an entity."""
+        self._cache_components()
+        
+    def on_components_changed(self) -> None:
+        """Refresh cached sibling components."""
+        self._cache_components()
+        
+    def on_remove(self) -> None:
+        """Drop cached sibling components."""
+        self._physics = None
+        self._transform = None
+        self._shield = None
+        
+    def _cache_components(self) -> None:
+        """Look up the sibling components used by the AI handlers."""
+        entity = self.entity
+        if not entity:
+            return
+        self._physics = entity.get_component("physics")
+        self._transform = entity.get_component("transform")
+        self._shield = entity.get_component("shield")
+        
     def update(self, dt: float) -> None:
         """Update AI behavior.
         
         Args:
             dt: Delta time in seconds since the last update
         """
-        if not self.entity:
+        if not self.has_behavior or not self.entity or self.batched:
             return
             
         self.state_timer += dt
         
-        # Execute behavior based on AI type
-        if self.ai_type == "ship":
-            self._update_ship_ai(dt)
-        elif self.ai_type == "captain":
-            self._update_captain_ai(dt)
-        elif self.ai_type == "turtle":
-            self._update_turtle_ai(dt)
-        elif self.ai_type == "fish":
-            self._update_fish_ai(dt)
-        elif self.ai_type == "patrol":
-            self._update_patrol(dt)
-        elif self.ai_type == "wander":
-            self._update_wander(dt)
+        # Execute behavior bound for this AI type
+        self._update_fn(dt)
+        
+    def set_ai_type(self, ai_type: str) -> None:
+        """Change the AI behavior type.
+        
+        Args:
+            ai_type: Type of AI behavior ("ship", "captain", "turtle", "fish", etc.)
+        """
+        self.ai_type = ai_type
+        self._update_fn = self._resolve_update_fn(ai_type)
+        self.has_behavior = self._update_fn != self._noop
+        
+    def _resolve_update_fn(self, ai_type: str):
+        """Look up the bound update method for an AI type.
+        
+        Args:
+            ai_type: Type of AI behavior
             
+        Returns:
+            The matching ``_update_<ai_type>_ai`` method, or a no-op for
+            types without a handler
+        """
+        return getattr(self, f"_update_{ai_type}_ai", None) or self._noop
+        
+    def _noop(self, dt: float) -> None:
+        """Update handler for AI types without behavior.
+        
+        Captains use this too: following the ship is handled by the
+        attachment and panicking by the CaptainComponent.
+        """
+        pass
+        
     def _update_ship_ai(self, dt: float) -> None:
         """Update ship AI behavior - move horizontally and avoid obstacles."""
-        physics = self.entity.get_component("physics")
-        transform = self.entity.get_component("transform")
+        physics = self._physics
+        transform = self._transform
         
         if not physics or not transform:
             return
             
         # Basic horizontal movement
-        physics.velocity = (self.ship_speed * self.direction, 0)
+        physics.velocity.update(self.ship_speed * self.direction, 0)
         
         # Check screen boundaries and reverse direction
         if transform.position.x <= 50 and self.direction < 0:
@@ -87,25 +155,11 @@ class AIComponent(Component):
             
         # TODO: Add obstacle avoidance when collision system is ready
         
-    def _update_captain_ai(self, dt: float) -> None:
-        """Update captain AI behavior based on state."""
-        captain_comp = self.entity.get_component("captain")
-        
-        if not captain_comp:
-            return
-            
-        if captain_comp.state == "on_ship":
-            # Captain follows ship movement (handled by attachment)
-            pass
-        elif captain_comp.state == "floating":
-            # Panic behavior - handled by captain component
-            pass
-            
     def _update_turtle_ai(self, dt: float) -> None:
         """Update turtle AI behavior - defensive movement and shield behavior."""
-        physics = self.entity.get_component("physics")
-        transform = self.entity.get_component("transform")
-        shield = self.entity.get_component("shield")
+        physics = self._physics
+        transform = self._transform
+        shield = self._shield
         
         if not physics or not transform:
             return
@@ -114,9 +168,9 @@ class AIComponent(Component):
         if self.state == "idle":
             # Move slowly in a defensive pattern
             self.state_timer += dt
-            physics.velocity = (
-                math.sin(self.state_timer * 0.5) * 30,
-                math.cos(self.state_timer * 0.3) * 20
+            physics.velocity.update(
+                _sin(self.state_timer * 0.5) * 30,
+                _cos(self.state_timer * 0.3) * 20
             )
             
         # Keep shield active
@@ -125,8 +179,8 @@ class AIComponent(Component):
             
     def _update_fish_ai(self, dt: float) -> None:
         """Update fish AI behavior - wandering movement for bonus targets."""
-        physics = self.entity.get_component("physics")
-        transform = self.entity.get_component("transform")
+        physics = self._physics
+        transform = self._transform
         
         if not physics or not transform:
             return
@@ -137,15 +191,10 @@ class AIComponent(Component):
         # Change direction periodically
         if self.wander_timer >= self.wander_change_interval:
             self.wander_timer = 0.0
-            # Random direction
-            angle = random.uniform(0, 2 * math.pi)
-            self.wander_direction = [
-                math.cos(angle) * self.wander_speed,
-                math.sin(angle) * self.wander_speed
-            ]
+            self._choose_wander_direction()
             
         # Apply wandering velocity
-        physics.velocity = tuple(self.wander_direction)
+        physics.velocity.update(self.wander_direction)
         
         # Keep fish within screen bounds
         if transform.position.x < 50 or transform.position.x > 750:
@@ -153,13 +202,18 @@ class AIComponent(Component):
         if transform.position.y < 50 or transform.position.y > 550:
             self.wander_direction[1] *= -1
             
-    def _update_patrol(self, dt: float) -> None:
+    def _choose_wander_direction(self) -> None:
+        """Pick a random wander direction scaled by the wander speed."""
+        cx, cy = _WANDER_TABLE[_getrandbits(_WANDER_TABLE_BITS)]
+        self.wander_direction = [cx * self.wander_speed, cy * self.wander_speed]
+            
+    def _update_patrol_ai(self, dt: float) -> None:
         """Update patrol behavior."""
         if not self.patrol_points:
             return
             
-        physics = self.entity.get_component("physics")
-        transform = self.entity.get_component("transform")
+        physics = self._physics
+        transform = self._transform
         
         if not physics or not transform:
             return
@@ -168,17 +222,18 @@ class AIComponent(Component):
         target = self.patrol_points[self.current_patrol_index]
         dx = target[0] - transform.position.x
         dy = target[1] - transform.position.y
-        distance = math.sqrt(dx*dx + dy*dy)
+        distance = _hypot(dx, dy)
         
         if distance < 10:  # Reached patrol point
             self.current_patrol_index = (self.current_patrol_index + 1) % len(self.patrol_points)
         else:
             # Move towards target
-            physics.velocity = (dx/distance * 100, dy/distance * 100)
+            inv = 100.0 / distance
+            physics.velocity.update(dx * inv, dy * inv)
         
-    def _update_wander(self, dt: float) -> None:
+    def _update_wander_ai(self, dt: float) -> None:
         """Update wander behavior."""
-        physics = self.entity.get_component("physics")
+        physics = self._physics
         
         if not physics:
             return
@@ -186,9 +241,9 @@ class AIComponent(Component):
         # Random movement
         if self.state_timer > 1.0:
             self.state_timer = 0.0
-            physics.velocity = (
-                random.uniform(-50, 50),
-                random.uniform(-50, 50)
+            physics.velocity.update(
+                _uniform(-50, 50),
+                _uniform(-50, 50)
             )
         
     def set_target(self, target_entity) -> None:
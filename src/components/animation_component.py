@@ -15,8 +15,13 @@ class AnimationComponent(Component):
         self.animations: Dict[str, List[int]] = {}  # name -> list of frame indices
         self.frame_durations: Dict[str, float] = {}  # name -> duration per frame
         
+        # Frames and frame duration of the current animation, cached so
+        # update() does not look them up every frame
+        self._current_frames: List[int] = []
+        self._frame_duration: float = 0.1
+        
         # Current animation state
-        self.current_animation: Optional[str] = None
+        self._current_animation: Optional[str] = None
         self.current_frame: int = 0
         self.frame_timer: float = 0.0
         self.is_playing: bool = True
@@ -25,46 +30,74 @@ class AnimationComponent(Component):
         # Animation callbacks
         self.on_animation_complete = None
         
+    @property
+    def current_animation(self) -> Optional[str]:
+        """Name of the animation currently selected."""
+        return self._current_animation
+        
+    @current_animation.setter
+    def current_animation(self, animation_name: Optional[str]) -> None:
+        self._current_animation = animation_name
+        self._refresh_current()
+        
+    def _refresh_current(self) -> None:
+        """Cache the frames and frame duration of the current animation."""
+        name = self._current_animation
+        self._current_frames = self.animations.get(name, [])
+        self._frame_duration = self.frame_durations.get(name, 0.1)
+        
     def update(self, dt: float) -> None:
         """Update animation state.
         
+        Advances as many frames as fit into the elapsed time, so a long
+        frame catches up instead of falling behind.
+        
         Args:
             dt: Delta time in seconds since the last update
         """
-        if not self.is_playing or not self.current_animation:
+        if not self.is_playing or not self._current_animation:
             return
             
-        # Update frame timer
-        self.frame_timer += dt
-        
-        # Check if we need to advance to next frame
-        frame_duration = self.frame_durations.get(self.current_animation, 0.1)
-        if self.frame_timer >= frame_duration:
-            self.frame_timer -= frame_duration
-            self._advance_frame()
-            
-    def _advance_frame(self) -> None:
-        """Advance to the next frame in the current animation."""
-        if not self.current_animation:
+        frame_duration = self._frame_duration
+        frame_timer = self.frame_timer + dt
+
+        # Most updates stay within the current frame
+        if frame_timer < frame_duration:
+            self.frame_timer = frame_timer
             return
+
+        if frame_duration <= 0:
+            self._advance_frames(1)
+            return
+
+        # Advance by the number of whole frames elapsed
+        steps, self.frame_timer = divmod(frame_timer, frame_duration)
+        self._advance_frames(int(steps))
             
-        frames = self.animations.get(self.current_animation, [])
+    def _advance_frames(self, steps: int) -> None:
+        """Advance the current animation by a number of frames.
+        
+        Args:
+            steps: Number of frames to advance
+        """
+        frames = self._current_frames
         if not frames:
             return
             
-        self.current_frame += 1
+        frame_count = len(frames)
+        self.current_frame += steps
         
         # Check if animation is complete
-        if self.current_frame >= len(frames):
+        if self.current_frame >= frame_count:
             if self.loop:
-                self.current_frame = 0
+                self.current_frame %= frame_count
             else:
-                self.current_frame = len(frames) - 1
+                self.current_frame = frame_count - 1
                 self.is_playing = False
                 
                 # Trigger callback
                 if self.on_animation_complete:
-                    self.on_animation_complete(self.current_animation)
+                    self.on_animation_complete(self._current_animation)
                     
     def play(self, animation_name: str, loop: bool = True) -> None:
         """Play a specific animation.
@@ -106,6 +139,9 @@ class AnimationComponent(Component):
         self.animations[name] = frames
         self.frame_durations[name] = frame_duration
         
+        if name == self._current_animation:
+            self._refresh_current()
+        
     def get_current_frame_index(self) -> int:
         """Get the current frame index for the render component.
         
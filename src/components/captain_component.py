@@ -4,6 +4,10 @@ import random
 from src.components.component import Component
 
 
+# Bound once to skip the module attribute lookup in the per-frame update
+_uniform = random.uniform
+
+
 class CaptainComponent(Component):
     """Component that manages captain behavior and death effects."""
     
@@ -36,9 +40,9 @@ class CaptainComponent(Component):
             physics = self.entity.get_component("physics")
             if physics:
                 # Add some random movement to simulate floating
-                physics.velocity = (
-                    random.uniform(-20, 20),
-                    random.uniform(-10, 0)  # Mostly upward
+                physics.velocity.update(
+                    _uniform(-20, 20),
+                    _uniform(-10, 0)  # Mostly upward
                 )
             
             # Update explosion timer
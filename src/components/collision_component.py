@@ -1,13 +1,31 @@
 """Collision Component for managing entity collision detection."""
 
 import pygame
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
 from src.components.component import Component
 
 
 class CollisionComponent(Component):
     """Component that manages collision detection and response."""
     
+    __slots__ = (
+        'width',
+        'height',
+        'collision_type',
+        'is_trigger',
+        'collision_mask',
+        'on_collision_enter',
+        'on_collision_stay',
+        'on_collision_exit',
+        'offset',
+        '_transform',
+        '_cached_rect',
+        '_rect_key',
+    )
+    
+    # update does nothing, so entities skip this component
+    NEEDS_UPDATE = False
+    
     def __init__(self, width: float = 32, height: float = 32):
         """Initialize the CollisionComponent.
         
@@ -32,7 +50,31 @@ class CollisionComponent(Component):
         self.on_collision_exit: Optional[Callable] = None
         
         # Offset from entity position
-        self.offset: pygame.math.Vector2 = pygame.math.Vector2(0, 0)
+        self.offset: Tuple[float, float] = (0.0, 0.0)
+        
+        # Cached transform and world-space rectangle; the rectangle is
+        # rebuilt only when the (x, y, width, height) it was built from changes
+        self._transform = None
+        self._cached_rect: Optional[pygame.Rect] = None
+        self._rect_key: Optional[Tuple[float, float, float, float]] = None
+        
+    def on_add(self) -> None:
+        """Cache the transform when added to an entity."""
+        self._transform = self.entity.get_component("transform") if self.entity else None
+        self.mark_dirty()
+        
+    def on_components_changed(self) -> None:
+        """Refresh the cached transform."""
+        self.on_add()
+        
+    def on_remove(self) -> None:
+        """Drop the cached transform."""
+        self._transform = None
+        self.mark_dirty()
+        
+    def mark_dirty(self) -> None:
+        """Force the collision rectangle to be rebuilt on the next get_rect()."""
+        self._cached_rect = None
         
     def update(self, dt: float) -> None:
         """Update collision component.
@@ -46,27 +88,33 @@ class CollisionComponent(Component):
     def get_rect(self) -> pygame.Rect:
         """Get the collision rectangle in world space.
         
+        The rectangle is cached and shared between calls, so callers
+        should copy it before modifying it.
+        
         Returns:
             The collision rectangle
         """
-        if not self.entity:
-            return pygame.Rect(0, 0, self.width, self.height)
-            
-        transform = self.entity.get_component("transform")
+        transform = self._transform
         if not transform:
             return pygame.Rect(0, 0, self.width, self.height)
             
-        position = transform.get_world_position() + self.offset
-        
-        # Create rectangle centered on position
-        rect = pygame.Rect(
-            position.x - self.width / 2,
-            position.y - self.height / 2,
-            self.width,
-            self.height
-        )
+        position = transform.position if transform.parent is None else transform.get_world_position()
+        offset_x, offset_y = self.offset
+        x = position.x + offset_x
+        y = position.y + offset_y
         
-        return rect
+        key = (x, y, self.width, self.height)
+        if self._cached_rect is None or key != self._rect_key:
+            # Create rectangle centered on position
+            self._cached_rect = pygame.Rect(
+                x - self.width / 2,
+                y - self.height / 2,
+                self.width,
+                self.height
+            )
+            self._rect_key = key
+            
+        return self._cached_rect
         
     def check_collision(self, other: 'CollisionComponent') -> bool:
         """Check if this collision component overlaps with another.
@@ -87,4 +135,5 @@ class CollisionComponent(Component):
             height: New height
         """
         self.width = width
-        self.height = height
\ No newline at end of file
+        self.height = height
+        self.mark_dirty()
\ No newline at end of file
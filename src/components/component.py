@@ -1,5 +1,6 @@
 """Base Component class for the Entity-Component System."""
 
+import sys
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
@@ -15,13 +16,19 @@ class Component(ABC):
     base class and implement the update method.
     """
     
+    __slots__ = ('component_type', 'entity', 'enabled')
+    
+    # Set to False in subclasses whose update does nothing so entities skip them
+    NEEDS_UPDATE = True
+    
     def __init__(self, component_type: str):
         """Initialize the component.
         
         Args:
             component_type: A string identifier for this component type
         """
-        self.component_type = component_type
+        # Interned so entity lookups with a literal key match by identity
+        self.component_type = sys.intern(component_type)
         self.entity: 'Entity' = None
         self.enabled = True
         
@@ -45,6 +52,14 @@ class Component(ABC):
         """
         pass
     
+    def on_components_changed(self) -> None:
+        """Called when another component is added to or removed from the entity.
+        
+        Override this method to refresh any cached references to sibling
+        components.
+        """
+        pass
+    
     def on_remove(self) -> None:
         """Called when the component is removed from an entity.
         
@@ -3,19 +3,161 @@ Effect Component for the Octopus Ink Slime game.
 Handles visual effects like ink splatters, ship sinking animations, and explosions.
 """
 
+import heapq
 import pygame
 import random
-from typing import Dict, List, Tuple, Optional
+from itertools import count
+from typing import Dict, List, NamedTuple, Tuple, Optional
 from src.components.component import Component
+from src.engine.audio_manager import AudioManager
+
+# Try to import numpy, but make it optional
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Try to import numba, but make it optional
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Shared generator for drawing effect offsets in bulk
+_rng = np.random.default_rng() if NUMPY_AVAILABLE else None
+
+
+# Slack when comparing effect sequence trigger times against the clock
+_SCHEDULE_TOLERANCE = 1e-9
+
+# Sound effect played for each effect type
+_SOUND_MAP = {
+    "splatter_dark_blue": "ink_splat",
+    "splatter_purple": "ink_splat",
+    "splatter_green": "ink_splat",
+    "splatter_red": "ink_splat",
+    "splatter_rainbow": "ink_splat_special",
+    "ship_sinking_small": "ship_sink",
+    "ship_sinking_medium": "ship_sink",
+    "ship_sinking_large": "ship_sink",
+    "head_explosion": "head_explosion",
+    "small_explosion": "explosion",
+    "medium_explosion": "explosion",
+    "large_explosion": "explosion"
+}
+
+
+def _compact(items: list, keep) -> None:
+    """
+    Remove items from a list in place.
+    
+    Args:
+        items: The list to compact
+        keep: Iterable of booleans, True for each item to keep
+    """
+    kept = 0
+    for item, keep_item in zip(items, keep):
+        if keep_item:
+            items[kept] = item
+            kept += 1
+    del items[kept:]
+
+
+# Advances the effect timers and frames in place and returns the mask of
+# effects that still have frames left to show
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _advance_effects(timers, frame_times, current_frames, frame_counts, dt):
+        """Advance effect timers and frames, returning the effects to keep."""
+        n = timers.shape[0]
+        keep = np.empty(n, np.bool_)
+        for i in range(n):
+            timers[i] += dt
+            if timers[i] >= frame_times[i]:
+                timers[i] -= frame_times[i]
+                current_frames[i] += 1
+            keep[i] = current_frames[i] < frame_counts[i]
+        return keep
+
+elif NUMPY_AVAILABLE:
+    def _advance_effects(timers, frame_times, current_frames, frame_counts, dt):
+        """Advance effect timers and frames, returning the effects to keep."""
+        timers += dt
+        advance = timers >= frame_times
+        timers[advance] -= frame_times[advance]
+        current_frames[advance] += 1
+        return current_frames < frame_counts
+
+
+def warm_up_kernels() -> None:
+    """
+    Compile the Numba kernel, or load it from the cache, ahead of time.
+    
+    Numba compiles a kernel on its first call, which would otherwise stall
+    the first frame that shows an effect. Does nothing when Numba is
+    unavailable.
+    """
+    if NUMBA_AVAILABLE:
+        _advance_effects(np.zeros(1), np.ones(1), np.zeros(1, dtype=np.int32),
+                         np.ones(1, dtype=np.int32), 0.0)
+
+
+class ScreenShake(NamedTuple):
+    """Screen shake triggered by an effect."""
+    intensity: float
+    duration: float
+
+
+class ParticleSpec(NamedTuple):
+    """Particle burst spawned by an effect."""
+    count: int
+    colors: Tuple[Tuple[int, int, int], ...]
+    speed: float
+    lifetime: float
+
+
+class EffectTemplate(NamedTuple):
+    """Immutable description of an effect type."""
+    animation: str
+    frames: int
+    duration: float
+    frame_time: float
+    screen_shake: Optional[ScreenShake] = None
+    particles: Optional[ParticleSpec] = None
+    
+    @classmethod
+    def create(cls, animation: str, frames: int, duration: float,
+               screen_shake: Optional[ScreenShake] = None,
+               particles: Optional[ParticleSpec] = None) -> 'EffectTemplate':
+        """
+        Create a template, precomputing the time each frame is shown.
+        
+        Args:
+            animation: Path of the effect's sprite sheet
+            frames: Number of frames in the sprite sheet
+            duration: Total duration of the effect in seconds
+            screen_shake: Optional screen shake to trigger
+            particles: Optional particle burst to spawn
+            
+        Returns:
+            The effect template
+        """
+        return cls(animation, frames, duration, duration / frames, screen_shake, particles)
 
 
 class EffectManager:
     """
     Manages visual effects in the game.
-    Implements the singleton pattern for global access.
-    """
+    A single shared instance is created at import time as the module-level
+    ``effect_manager``; get_instance() returns it.
     
-    _instance = None
+    Active effects are stored as a structure of arrays: one column per
+    field, indexed by effect slot. With NumPy the numeric columns are
+    arrays and update() advances every effect with a few vector operations;
+    without it they are plain lists.
+    """
     
     @staticmethod
     def get_instance():
@@ -25,168 +167,142 @@ class EffectManager:
         Returns:
             The EffectManager instance
         """
-        if EffectManager._instance is None:
-            EffectManager._instance = EffectManager()
-        return EffectManager._instance
+        return effect_manager
+    
+    # Initial number of effect slots in the NumPy columns (doubled when full)
+    INITIAL_CAPACITY = 32
     
     def __init__(self):
         """Initialize the effect manager."""
-        self.effects = []
-        self.effect_templates = {
+        # Active effects, one column per field
+        self.effect_count = 0
+        self._types: List[str] = []
+        self._animations: List[str] = []
+        if NUMPY_AVAILABLE:
+            self._timers = np.zeros(self.INITIAL_CAPACITY)
+            self._frame_times = np.zeros(self.INITIAL_CAPACITY)
+            self._current_frames = np.zeros(self.INITIAL_CAPACITY, dtype=np.int32)
+            self._frame_counts = np.zeros(self.INITIAL_CAPACITY, dtype=np.int32)
+            self._positions = np.zeros((self.INITIAL_CAPACITY, 2))
+        else:
+            self._timers = []
+            self._frame_times = []
+            self._current_frames = []
+            self._frame_counts = []
+            self._positions = []
+            
+        self.effect_templates: Dict[str, EffectTemplate] = {
             # Ink splatter effects for different colors
-            "splatter_dark_blue": {
-                "animation": "animations/splatter_dark_blue.png",
-                "frames": 8,
-                "duration": 0.8
-            },
-            "splatter_purple": {
-                "animation": "animations/splatter_purple.png",
-                "frames": 8,
-                "duration": 0.8
-            },
-            "splatter_green": {
-                "animation": "animations/splatter_green.png",
-                "frames": 8,
-                "duration": 0.8
-            },
-            "splatter_red": {
-                "animation": "animations/splatter_red.png",
-                "frames": 8,
-                "duration": 0.8
-            },
-            "splatter_rainbow": {
-                "animation": "animations/splatter_rainbow.png",
-                "frames": 12,
-                "duration": 1.2,
-                "particles": {
-                    "count": 20,
-                    "colors": [(255, 0, 0), (255, 165, 0), (255, 255, 0), 
-                               (0, 255, 0), (0, 0, 255), (75, 0, 130), (238, 130, 238)],
-                    "speed": 100,
-                    "lifetime": 1.5
-                }
-            },
+            "splatter_dark_blue": EffectTemplate.create("animations/splatter_dark_blue.png", 8, 0.8),
+            "splatter_purple": EffectTemplate.create("animations/splatter_purple.png", 8, 0.8),
+            "splatter_green": EffectTemplate.create("animations/splatter_green.png", 8, 0.8),
+            "splatter_red": EffectTemplate.create("animations/splatter_red.png", 8, 0.8),
+            "splatter_rainbow": EffectTemplate.create(
+                "animations/splatter_rainbow.png", 12, 1.2,
+                particles=ParticleSpec(
+                    count=20,
+                    colors=((255, 0, 0), (255, 165, 0), (255, 255, 0),
+                            (0, 255, 0), (0, 0, 255), (75, 0, 130), (238, 130, 238)),
+                    speed=100,
+                    lifetime=1.5
+                )
+            ),
             
             # Ship sinking effects
-            "ship_sinking_small": {
-                "animation": "animations/ship_sinking_small.png",
-                "frames": 12,
-                "duration": 2.0,
-                "screen_shake": {
-                    "intensity": 5,
-                    "duration": 0.5
-                },
-                "particles": {
-                    "count": 15,
-                    "colors": [(150, 150, 255), (100, 100, 200)],
-                    "speed": 80,
-                    "lifetime": 1.0
-                }
-            },
-            "ship_sinking_medium": {
-                "animation": "animations/ship_sinking_medium.png",
-                "frames": 15,
-                "duration": 2.5,
-                "screen_shake": {
-                    "intensity": 8,
-                    "duration": 0.7
-                },
-                "particles": {
-                    "count": 25,
-                    "colors": [(150, 150, 255), (100, 100, 200)],
-                    "speed": 100,
-                    "lifetime": 1.2
-                }
-            },
-            "ship_sinking_large": {
-                "animation": "animations/ship_sinking_large.png",
-                "frames": 18,
-                "duration": 3.0,
-                "screen_shake": {
-                    "intensity": 12,
-                    "duration": 1.0
-                },
-                "particles": {
-                    "count": 40,
-                    "colors": [(150, 150, 255), (100, 100, 200)],
-                    "speed": 120,
-                    "lifetime": 1.5
-                }
-            },
+            "ship_sinking_small": EffectTemplate.create(
+                "animations/ship_sinking_small.png", 12, 2.0,
+                screen_shake=ScreenShake(intensity=5, duration=0.5),
+                particles=ParticleSpec(
+                    count=15,
+                    colors=((150, 150, 255), (100, 100, 200)),
+                    speed=80,
+                    lifetime=1.0
+                )
+            ),
+            "ship_sinking_medium": EffectTemplate.create(
+                "animations/ship_sinking_medium.png", 15, 2.5,
+                screen_shake=ScreenShake(intensity=8, duration=0.7),
+                particles=ParticleSpec(
+                    count=25,
+                    colors=((150, 150, 255), (100, 100, 200)),
+                    speed=100,
+                    lifetime=1.2
+                )
+            ),
+            "ship_sinking_large": EffectTemplate.create(
+                "animations/ship_sinking_large.png", 18, 3.0,
+                screen_shake=ScreenShake(intensity=12, duration=1.0),
+                particles=ParticleSpec(
+                    count=40,
+                    colors=((150, 150, 255), (100, 100, 200)),
+                    speed=120,
+                    lifetime=1.5
+                )
+            ),
             
             # Captain effects
-            "head_explosion": {
-                "animation": "animations/head_explosion.png",
-                "frames": 12,
-                "duration": 1.0,
-                "screen_shake": {
-                    "intensity": 10,
-                    "duration": 0.3
-                },
-                "particles": {
-                    "count": 30,
-                    "colors": [(255, 0, 0), (200, 0, 0)],
-                    "speed": 150,
-                    "lifetime": 0.8
-                }
-            },
+            "head_explosion": EffectTemplate.create(
+                "animations/head_explosion.png", 12, 1.0,
+                screen_shake=ScreenShake(intensity=10, duration=0.3),
+                particles=ParticleSpec(
+                    count=30,
+                    colors=((255, 0, 0), (200, 0, 0)),
+                    speed=150,
+                    lifetime=0.8
+                )
+            ),
             
             # Explosion effects
-            "small_explosion": {
-                "animation": "animations/small_explosion.png",
-                "frames": 8,
-                "duration": 0.6,
-                "screen_shake": {
-                    "intensity": 3,
-                    "duration": 0.2
-                },
-                "particles": {
-                    "count": 10,
-                    "colors": [(255, 200, 0), (255, 100, 0)],
-                    "speed": 80,
-                    "lifetime": 0.5
-                }
-            },
-            "medium_explosion": {
-                "animation": "animations/medium_explosion.png",
-                "frames": 10,
-                "duration": 0.8,
-                "screen_shake": {
-                    "intensity": 6,
-                    "duration": 0.4
-                },
-                "particles": {
-                    "count": 20,
-                    "colors": [(255, 200, 0), (255, 100, 0)],
-                    "speed": 100,
-                    "lifetime": 0.7
-                }
-            },
-            "large_explosion": {
-                "animation": "animations/large_explosion.png",
-                "frames": 12,
-                "duration": 1.0,
-                "screen_shake": {
-                    "intensity": 10,
-                    "duration": 0.6
-                },
-                "particles": {
-                    "count": 30,
-                    "colors": [(255, 200, 0), (255, 100, 0)],
-                    "speed": 120,
-                    "lifetime": 1.0
-                }
-            }
+            "small_explosion": EffectTemplate.create(
+                "animations/small_explosion.png", 8, 0.6,
+                screen_shake=ScreenShake(intensity=3, duration=0.2),
+                particles=ParticleSpec(
+                    count=10,
+                    colors=((255, 200, 0), (255, 100, 0)),
+                    speed=80,
+                    lifetime=0.5
+                )
+            ),
+            "medium_explosion": EffectTemplate.create(
+                "animations/medium_explosion.png", 10, 0.8,
+                screen_shake=ScreenShake(intensity=6, duration=0.4),
+                particles=ParticleSpec(
+                    count=20,
+                    colors=((255, 200, 0), (255, 100, 0)),
+                    speed=100,
+                    lifetime=0.7
+                )
+            ),
+            "large_explosion": EffectTemplate.create(
+                "animations/large_explosion.png", 12, 1.0,
+                screen_shake=ScreenShake(intensity=10, duration=0.6),
+                particles=ParticleSpec(
+                    count=30,
+                    colors=((255, 200, 0), (255, 100, 0)),
+                    speed=120,
+                    lifetime=1.0
+                )
+            )
         }
         
         # Cache for loaded effect images
         self.effect_images = {}
         
+        # Sprite sheets sliced into frames: path -> (frames, half width, half height)
+        self.effect_frames = {}
+        
+        # All effect sheets packed into one surface, and each sheet's region in it
+        self.effect_atlas: Optional[pygame.Surface] = None
+        self.effect_atlas_regions: Dict[str, pygame.Rect] = {}
+        
         # Particle system reference
         self.particle_system = None
         
         # Camera manager reference for screen shake
         self.camera_manager = None
+        
+        # Audio manager, looked up on the first effect with a sound
+        self._audio = None
     
     def set_particle_system(self, particle_system):
         """
@@ -214,9 +330,79 @@ class EffectManager:
             asset_manager: The asset manager instance
         """
         for effect_type, template in self.effect_templates.items():
-            animation_path = template["animation"]
+            animation_path = template.animation
             if animation_path not in self.effect_images:
                 self.effect_images[animation_path] = asset_manager.load_image(animation_path)
+            self._slice_frames(animation_path, template.frames)
+            
+        self.build_effect_atlas()
+    
+    def build_effect_atlas(self):
+        """
+        Pack the loaded effect sheets into a single atlas surface.
+        
+        Sheets are stacked vertically and their frames re-sliced as
+        subsurfaces of the atlas, so every effect frame shares one pixel
+        buffer that can be uploaded as a single texture. Sheets without
+        per-pixel alpha, or with a colorkey, keep their own frames.
+        """
+        sheets = [
+            (path, image) for path, image in self.effect_images.items()
+            if image is not None and image.get_flags() & pygame.SRCALPHA and image.get_colorkey() is None
+        ]
+        if not sheets:
+            return
+            
+        width = max(image.get_width() for _, image in sheets)
+        height = sum(image.get_height() for _, image in sheets)
+        atlas = pygame.Surface((width, height), pygame.SRCALPHA, 32)
+        
+        regions = {}
+        y = 0
+        for path, image in sheets:
+            # Copy the pixels as-is (max against the transparent atlas) instead of alpha blending
+            atlas.blit(image, (0, y), special_flags=pygame.BLEND_RGBA_MAX)
+            regions[path] = pygame.Rect(0, y, image.get_width(), image.get_height())
+            y += image.get_height()
+            
+        self.effect_atlas = atlas
+        self.effect_atlas_regions = regions
+        
+        # Re-slice the packed sheets from the atlas
+        for template in self.effect_templates.values():
+            if template.animation in regions:
+                self._slice_frames(template.animation, template.frames)
+    
+    def _slice_frames(self, animation_path: str, frame_count: int):
+        """
+        Slice a loaded sprite sheet into per-frame subsurfaces.
+        
+        Args:
+            animation_path: Path of the sprite sheet in effect_images
+            frame_count: Number of frames laid out horizontally in the sheet
+            
+        Returns:
+            Tuple of (frames, half frame width, half frame height), or None
+            if the sheet isn't loaded
+        """
+        region = self.effect_atlas_regions.get(animation_path)
+        if region is not None:
+            image = self.effect_atlas.subsurface(region)
+        else:
+            image = self.effect_images.get(animation_path)
+            if image is None:
+                return None
+            
+        frame_width = image.get_width() / frame_count
+        frame_height = image.get_height()
+        frames = [
+            image.subsurface(pygame.Rect(i * frame_width, 0, frame_width, frame_height))
+            for i in range(frame_count)
+        ]
+        
+        entry = (frames, frame_width / 2, frame_height / 2)
+        self.effect_frames[animation_path] = entry
+        return entry
     
     def create_effect(self, effect_type: str, position: Tuple[float, float]):
         """
@@ -228,58 +414,153 @@ class EffectManager:
         """
         if effect_type in self.effect_templates:
             template = self.effect_templates[effect_type]
-            effect = {
-                "type": effect_type,
-                "position": position,
-                "animation": template["animation"],
-                "frames": template["frames"],
-                "current_frame": 0,
-                "frame_time": template["duration"] / template["frames"],
-                "timer": 0,
-                "completed": False
-            }
-            self.effects.append(effect)
+            self._add_effect(effect_type, template, position)
             
             # Handle special effects
-            if "particles" in template and self.particle_system:
-                particle_config = template["particles"]
+            particle_config = template.particles
+            if particle_config and self.particle_system:
                 self.particle_system.create_particles(
                     position,
-                    particle_config["count"],
-                    particle_config["colors"],
-                    particle_config["speed"],
-                    particle_config["lifetime"]
+                    particle_config.count,
+                    particle_config.colors,
+                    particle_config.speed,
+                    particle_config.lifetime
                 )
             
-            if "screen_shake" in template and self.camera_manager:
-                shake_config = template["screen_shake"]
+            shake_config = template.screen_shake
+            if shake_config and self.camera_manager:
                 self.camera_manager.apply_shake(
-                    shake_config["intensity"],
-                    shake_config["duration"]
+                    shake_config.intensity,
+                    shake_config.duration
                 )
             
             # Play corresponding sound effect
-            from src.engine.audio_manager import AudioManager
-            audio_manager = AudioManager.get_instance()
+            self._play_effect_sound(effect_type)
+    
+    def create_effects_bulk(self, effect_type: str, positions):
+        """
+        Create several effects of the same type at once.
+        
+        The template is resolved once and the effects are appended to the
+        columns in one block. Particles are still spawned per position, but
+        the screen shake and the sound are triggered only once.
+        
+        Args:
+            effect_type: Type of effect to create
+            positions: Sequence of (x, y) positions, or an (N, 2) array
+        """
+        template = self.effect_templates.get(effect_type)
+        if template is None:
+            return
             
-            # Map effect types to sound effects
-            sound_mappings = {
-                "splatter_dark_blue": "ink_splat",
-                "splatter_purple": "ink_splat",
-                "splatter_green": "ink_splat",
-                "splatter_red": "ink_splat",
-                "splatter_rainbow": "ink_splat_special",
-                "ship_sinking_small": "ship_sink",
-                "ship_sinking_medium": "ship_sink",
-                "ship_sinking_large": "ship_sink",
-                "head_explosion": "head_explosion",
-                "small_explosion": "explosion",
-                "medium_explosion": "explosion",
-                "large_explosion": "explosion"
-            }
+        if NUMPY_AVAILABLE:
+            positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+            added = len(positions)
+            if not added:
+                return
+                
+            start = self.effect_count
+            end = start + added
+            while end > len(self._timers):
+                self._grow()
+            self._timers[start:end] = 0.0
+            self._frame_times[start:end] = template.frame_time
+            self._current_frames[start:end] = 0
+            self._frame_counts[start:end] = template.frames
+            self._positions[start:end] = positions
+            self.effect_count = end
+            positions = positions.tolist()
+        else:
+            positions = [tuple(position) for position in positions]
+            added = len(positions)
+            if not added:
+                return
+                
+            self._timers.extend([0.0] * added)
+            self._frame_times.extend([template.frame_time] * added)
+            self._current_frames.extend([0] * added)
+            self._frame_counts.extend([template.frames] * added)
+            self._positions.extend(positions)
+            self.effect_count += added
+            
+        self._types.extend([effect_type] * added)
+        self._animations.extend([template.animation] * added)
+        
+        # Handle special effects
+        particle_config = template.particles
+        if particle_config and self.particle_system:
+            for position in positions:
+                self.particle_system.create_particles(
+                    position,
+                    particle_config.count,
+                    particle_config.colors,
+                    particle_config.speed,
+                    particle_config.lifetime
+                )
+        
+        shake_config = template.screen_shake
+        if shake_config and self.camera_manager:
+            self.camera_manager.apply_shake(
+                shake_config.intensity,
+                shake_config.duration
+            )
+        
+        # Play corresponding sound effect
+        self._play_effect_sound(effect_type)
+    
+    def _play_effect_sound(self, effect_type: str):
+        """
+        Play the sound effect mapped to an effect type, if any.
+        
+        Args:
+            effect_type: Type of effect
+        """
+        sound = _SOUND_MAP.get(effect_type)
+        if sound:
+            if self._audio is None:
+                self._audio = AudioManager.get_instance()
+            self._audio.play_sound(sound)
+    
+    def _add_effect(self, effect_type: str, template: 'EffectTemplate', position: Tuple[float, float]):
+        """
+        Append an effect to the active effect columns.
+        
+        Args:
+            effect_type: Type of effect
+            template: The effect's template
+            position: Position (x, y) of the effect
+        """
+        index = self.effect_count
+        frames = template.frames
+        frame_time = template.frame_time
+        
+        if NUMPY_AVAILABLE:
+            if index == len(self._timers):
+                self._grow()
+            self._timers[index] = 0.0
+            self._frame_times[index] = frame_time
+            self._current_frames[index] = 0
+            self._frame_counts[index] = frames
+            self._positions[index] = position
+        else:
+            self._timers.append(0.0)
+            self._frame_times.append(frame_time)
+            self._current_frames.append(0)
+            self._frame_counts.append(frames)
+            self._positions.append(position)
             
-            if effect_type in sound_mappings:
-                audio_manager.play_sound(sound_mappings[effect_type])
+        self._types.append(effect_type)
+        self._animations.append(template.animation)
+        self.effect_count = index + 1
+    
+    def _grow(self):
+        """Double the capacity of the NumPy effect columns."""
+        capacity = len(self._timers) * 2
+        self._timers = np.resize(self._timers, capacity)
+        self._frame_times = np.resize(self._frame_times, capacity)
+        self._current_frames = np.resize(self._current_frames, capacity)
+        self._frame_counts = np.resize(self._frame_counts, capacity)
+        self._positions = np.resize(self._positions, (capacity, 2))
     
     def update(self, dt: float):
         """
@@ -288,17 +569,57 @@ class EffectManager:
         Args:
             dt: Time delta in seconds since last update
         """
-        # Update all active effects
-        for effect in self.effects:
-            effect["timer"] += dt
-            if effect["timer"] >= effect["frame_time"]:
-                effect["timer"] -= effect["frame_time"]
-                effect["current_frame"] += 1
-                if effect["current_frame"] >= effect["frames"]:
-                    effect["completed"] = True
-        
-        # Remove completed effects
-        self.effects = [e for e in self.effects if not e["completed"]]
+        count = self.effect_count
+        if not count:
+            return
+            
+        if NUMPY_AVAILABLE:
+            # Update all active effects
+            keep = _advance_effects(self._timers[:count], self._frame_times[:count],
+                                    self._current_frames[:count], self._frame_counts[:count], dt)
+            
+            # Remove completed effects
+            if not keep.all():
+                self._compact(keep)
+        else:
+            # Update all active effects
+            timers = self._timers
+            frame_times = self._frame_times
+            current_frames = self._current_frames
+            for i in range(count):
+                timers[i] += dt
+                if timers[i] >= frame_times[i]:
+                    timers[i] -= frame_times[i]
+                    current_frames[i] += 1
+                    
+            # Remove completed effects
+            keep = [frame < frames for frame, frames in zip(current_frames, self._frame_counts)]
+            if not all(keep):
+                self._compact(keep)
+    
+    def _compact(self, keep):
+        """
+        Drop effects from the active columns.
+        
+        Args:
+            keep: Boolean mask over the active effects, True for those to keep
+        """
+        if NUMPY_AVAILABLE:
+            count = self.effect_count
+            kept = int(keep.sum())
+            for column in (self._timers, self._frame_times, self._current_frames,
+                           self._frame_counts, self._positions):
+                column[:kept] = column[:count][keep]
+            keep = keep.tolist()
+            self.effect_count = kept
+        else:
+            for column in (self._timers, self._frame_times, self._current_frames,
+                           self._frame_counts, self._positions):
+                _compact(column, keep)
+            self.effect_count = len(self._timers)
+            
+        _compact(self._types, keep)
+        _compact(self._animations, keep)
     
     def render(self, surface: pygame.Surface):
         """
@@ -307,42 +628,56 @@ class EffectManager:
         Args:
             surface: Pygame surface to render to
         """
-        # Render all active effects
-        for effect in self.effects:
-            # Skip if the image isn't loaded
-            if effect["animation"] not in self.effect_images:
-                continue
-                
-            # Get the image
-            image = self.effect_images[effect["animation"]]
-            
-            # Calculate source rect based on current frame
-            frame_width = image.get_width() / effect["frames"]
-            frame_height = image.get_height()
-            src_rect = pygame.Rect(
-                effect["current_frame"] * frame_width, 0,
-                frame_width, frame_height
-            )
+        count = self.effect_count
+        current_frames = self._current_frames[:count]
+        frame_counts = self._frame_counts[:count]
+        positions = self._positions[:count]
+        if NUMPY_AVAILABLE:
+            current_frames = current_frames.tolist()
+            frame_counts = frame_counts.tolist()
+            positions = positions.tolist()
             
-            # Calculate destination rect
-            dest_rect = pygame.Rect(
-                effect["position"][0] - frame_width / 2,
-                effect["position"][1] - frame_height / 2,
-                frame_width, frame_height
+        # Collect the current frame of every active effect
+        effect_frames = self.effect_frames
+        blit_sequence = []
+        for animation, current_frame, frame_count, position in zip(
+                self._animations, current_frames, frame_counts, positions):
+            entry = effect_frames.get(animation)
+            if entry is None:
+                # Skip if the image isn't loaded
+                entry = self._slice_frames(animation, frame_count)
+                if entry is None:
+                    continue
+                    
+            frames, half_width, half_height = entry
+            blit_sequence.append(
+                (frames[current_frame], (position[0] - half_width, position[1] - half_height))
             )
             
-            # Draw the effect
-            surface.blit(image, dest_rect, src_rect)
+        # Draw all effects in a single call
+        if blit_sequence:
+            surface.blits(blit_sequence, False)
+
+
+# Shared effect manager instance
+effect_manager = EffectManager()
 
 
 class EffectComponent(Component):
     """Component for entities that can create visual effects."""
     
+    __slots__ = ('active_effects', 'effect_manager', '_clock', '_schedule', '_sequence_ids')
+    
     def __init__(self):
         """Initialize the effect component."""
         super().__init__("effect")
         self.active_effects = []
-        self.effect_manager = EffectManager.get_instance()
+        self.effect_manager = effect_manager
+        
+        # Time since creation, and a min-heap of (next trigger time, id, sequence)
+        self._clock = 0.0
+        self._schedule = []
+        self._sequence_ids = count()
     
     def create_effect(self, effect_type: str, offset: Tuple[float, float] = (0, 0)):
         """
@@ -390,14 +725,45 @@ class EffectComponent(Component):
             interval: Time interval between effects in seconds
             offset_range: Range for random offset (min_x, max_x, min_y, max_y)
         """
-        self.active_effects.append({
+        if count <= 0:
+            return
+            
+        sequence = {
             "type": effect_type,
             "count": count,
             "remaining": count,
             "interval": interval,
-            "timer": 0,
-            "offset_range": offset_range
-        })
+            "offset_range": offset_range,
+            "offsets": self._draw_offsets(count, offset_range)
+        }
+        self.active_effects.append(sequence)
+        heapq.heappush(self._schedule, (self._clock + interval, next(self._sequence_ids), sequence))
+    
+    @staticmethod
+    def _draw_offsets(count: int, offset_range: Tuple[float, float, float, float]) -> List[Tuple[float, float]]:
+        """
+        Draw random offsets for a sequence of effects up front.
+        
+        Args:
+            count: Number of offsets to draw
+            offset_range: Range for random offset (min_x, max_x, min_y, max_y)
+            
+        Returns:
+            List of (x, y) offsets
+        """
+        if _rng is not None:
+            offsets = _rng.uniform(
+                (offset_range[0], offset_range[2]),
+                (offset_range[1], offset_range[3]),
+                (count, 2)
+            )
+            return [tuple(offset) for offset in offsets.tolist()]
+            
+        return [
+            (random.uniform(offset_range[0], offset_range[1]),
+             random.uniform(offset_range[2], offset_range[3]))
+            for _ in range(count)
+        ]
     
     def update(self, dt: float):
         """
@@ -406,20 +772,33 @@ class EffectComponent(Component):
         Args:
             dt: Time delta in seconds since last update
         """
-        # Update effect sequences
-        for effect in self.active_effects:
+        self._clock += dt
+        schedule = self._schedule
+        
+        # Allow for rounding in the summed clock when dt divides the interval
+        now = self._clock + _SCHEDULE_TOLERANCE
+        
+        # Nothing to do until the earliest sequence is due
+        if not schedule or schedule[0][0] > now:
+            return
+            
+        # Take every due sequence; each creates at most one effect per update
+        due = []
+        while schedule and schedule[0][0] <= now:
+            due.append(heapq.heappop(schedule))
+            
+        finished = False
+        for trigger_time, sequence_id, effect in due:
+            # Create the effect with its pre-drawn random offset
+            offset = effect["offsets"][effect["count"] - effect["remaining"]]
+            effect["remaining"] -= 1
+            self.create_effect(effect["type"], offset)
+            
             if effect["remaining"] > 0:
-                effect["timer"] += dt
-                if effect["timer"] >= effect["interval"]:
-                    effect["timer"] -= effect["interval"]
-                    effect["remaining"] -= 1
-                    
-                    # Create the effect with random offset
-                    offset = (
-                        random.uniform(effect["offset_range"][0], effect["offset_range"][1]),
-                        random.uniform(effect["offset_range"][2], effect["offset_range"][3])
-                    )
-                    self.create_effect(effect["type"], offset)
+                heapq.heappush(schedule, (trigger_time + effect["interval"], sequence_id, effect))
+            else:
+                finished = True
         
         # Remove completed effect sequences
-        self.active_effects = [e for e in self.active_effects if e["remaining"] > 0]
\ No newline at end of file
+        if finished:
+            _compact(self.active_effects, [effect["remaining"] > 0 for effect in self.active_effects])
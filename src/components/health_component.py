@@ -6,6 +6,14 @@ from src.components.component import Component
 class HealthComponent(Component):
     """Component that manages health, damage, and death states."""
     
+    __slots__ = (
+        'max_health',
+        'current_health',
+        'is_invulnerable',
+        'invulnerability_time',
+        'batched',
+    )
+    
     def __init__(self, max_health: int = 100):
         """Initialize the HealthComponent.
         
@@ -19,13 +27,24 @@ class HealthComponent(Component):
         self.is_invulnerable: bool = False
         self.invulnerability_time: float = 0.0
         
+        # Set while a HealthSystem drives this component in batch
+        self.batched = False
+        
     def update(self, dt: float) -> None:
         """Update health component state.
         
         Args:
             dt: Delta time in seconds since the last update
         """
-        # Update invulnerability timer
+        if not self.batched:
+            self.update_invulnerability(dt)
+            
+    def update_invulnerability(self, dt: float) -> None:
+        """Count down the invulnerability timer.
+        
+        Args:
+            dt: Delta time in seconds since the last update
+        """
         if self.is_invulnerable and self.invulnerability_time > 0:
             self.invulnerability_time -= dt
             if self.invulnerability_time <= 0:
@@ -1,9 +1,17 @@
 """Ink Slime Component for managing ink projectile properties and effects."""
 
+import sys
 from typing import Optional
 from src.components.component import Component
 
 
+# Splatter effect name for each ink color, built once
+_SPLATTER_MAP = {
+    color: sys.intern(f"splatter_{color}")
+    for color in ("dark_blue", "purple", "green", "red", "rainbow")
+}
+
+
 class InkSlimeComponent(Component):
     """Component that manages ink slime projectile properties and collision effects.
     
@@ -11,6 +19,15 @@ class InkSlimeComponent(Component):
     hits ships or other targets.
     """
     
+    __slots__ = (
+        'ink_color',
+        'ink_damage',
+        'splatter_effect',
+        'lifetime',
+        'age',
+        'has_gravity',
+    )
+    
     def __init__(self, ink_color: str = "dark_blue", ink_damage: int = 10):
         """Initialize the InkSlimeComponent.
         
@@ -41,7 +58,10 @@ class InkSlimeComponent(Component):
         Returns:
             The name of the splatter effect to use
         """
-        return f"splatter_{ink_color}"
+        splatter_effect = _SPLATTER_MAP.get(ink_color)
+        if splatter_effect is None:
+            splatter_effect = _SPLATTER_MAP[ink_color] = sys.intern(f"splatter_{ink_color}")
+        return splatter_effect
         
     def update(self, dt: float) -> None:
         """Update the ink slime component.
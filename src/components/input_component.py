@@ -4,32 +4,109 @@ import pygame
 from src.components.component import Component
 
 
+# Key constants bound once so update reads module globals, not pygame attributes
+_K_LEFT, _K_RIGHT, _K_UP, _K_DOWN = pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN
+_K_A, _K_D, _K_W, _K_S = pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s
+_K_SPACE, _K_LALT, _K_RALT = pygame.K_SPACE, pygame.K_LALT, pygame.K_RALT
+
+# Positions of the input flags in InputComponent._flags
+(_MOVE_LEFT, _MOVE_RIGHT, _MOVE_UP, _MOVE_DOWN,
+ _SHOOT, _SHOOT_PRESSED, _WAS_SHOOTING,
+ _ROTATE_ARMS, _ROTATE_ARMS_PRESSED, _WAS_ROTATING) = range(10)
+
+
+def _direction(mask: int) -> tuple:
+    """Unit movement direction for a bitmask of held left/right/up/down keys."""
+    move_x = bool(mask & 2) - bool(mask & 1)
+    move_y = bool(mask & 8) - bool(mask & 4)
+    
+    # Normalize diagonal movement
+    if move_x != 0 and move_y != 0:
+        return (move_x * 0.707, move_y * 0.707)  # 1/sqrt(2)
+    return (move_x, move_y)
+
+
+# Movement direction for every combination of held keys, indexed by
+# left | right << 1 | up << 2 | down << 3
+_MOVE_DIRECTIONS = tuple(_direction(mask) for mask in range(16))
+
+
+def _flag(index: int, doc: str) -> property:
+    """Expose one entry of InputComponent._flags as a bool attribute."""
+    def getter(self) -> bool:
+        return bool(self._flags[index])
+        
+    def setter(self, value: bool) -> None:
+        self._flags[index] = bool(value)
+        
+    return property(getter, setter, doc=doc)
+
+
 class InputComponent(Component):
     """Component that handles player input for controllable entities."""
     
+    __slots__ = (
+        '_flags',
+        'move_speed',
+        'keys',
+        '_physics',
+        '_weapon',
+    )
+    
+    # Movement input
+    move_left = _flag(_MOVE_LEFT, "Whether left movement is held")
+    move_right = _flag(_MOVE_RIGHT, "Whether right movement is held")
+    move_up = _flag(_MOVE_UP, "Whether up movement is held")
+    move_down = _flag(_MOVE_DOWN, "Whether down movement is held")
+    
+    # Action input
+    shoot = _flag(_SHOOT, "Whether the shoot key is held")
+    shoot_pressed = _flag(_SHOOT_PRESSED, "Whether shoot was pressed this frame (single shot detection)")
+    was_shooting = _flag(_WAS_SHOOTING, "Previous shoot state")
+    
+    # Arm rotation input (Alt key)
+    rotate_arms = _flag(_ROTATE_ARMS, "Whether the rotate key is held")
+    rotate_arms_pressed = _flag(_ROTATE_ARMS_PRESSED, "Whether rotate was pressed this frame (single press detection)")
+    was_rotating = _flag(_WAS_ROTATING, "Previous rotate state")
+    
     def __init__(self):
         """Initialize the InputComponent."""
         super().__init__("input")
         
-        # Movement input
-        self.move_left: bool = False
-        self.move_right: bool = False
-        self.move_up: bool = False
-        self.move_down: bool = False
-        
-        # Action input
-        self.shoot: bool = False
-        self.shoot_pressed: bool = False  # For single shot detection
-        self.was_shooting: bool = False  # Track previous shoot state
-        
-        # Arm rotation input (Alt key)
-        self.rotate_arms: bool = False
-        self.rotate_arms_pressed: bool = False  # For single press detection
-        self.was_rotating: bool = False  # Track previous rotate state
+        # Input flags, written together once per update
+        self._flags = bytearray(10)
         
         # Input sensitivity
         self.move_speed: float = 300.0  # pixels per second
         
+        # Pressed-key snapshot pushed by an InputSystem (None polls pygame directly)
+        self.keys = None
+        
+        # Cached sibling components (refreshed when the entity's components change)
+        self._physics = None
+        self._weapon = None
+        
+    def on_add(self) -> None:
+        """Cache sibling components when added to an entity."""
+        self._cache_components()
+        
+    def on_components_changed(self) -> None:
+        """Refresh cached sibling components."""
+        self._cache_components()
+        
+    def on_remove(self) -> None:
+        """Drop cached sibling components."""
+        self._physics = None
+        self._weapon = None
+        
+    def _cache_components(self) -> None:
+        """Look up the sibling components driven by the input."""
+        entity = self.entity
+        if not entity:
+            return
+        self._physics = entity.get_component("physics")
+        self._weapon = entity.get_component("weapon")
+        
     def update(self, dt: float) -> None:
         """Process input and update entity based on input state.
         
@@ -40,69 +117,57 @@ class InputComponent(Component):
             return
             
         # Get keyboard state
-        keys = pygame.key.get_pressed()
+        keys = self.keys
+        if keys is None:
+            keys = pygame.key.get_pressed()
         
-        # Update movement flags
-        self.move_left = keys[pygame.K_LEFT] or keys[pygame.K_a]
-        self.move_right = keys[pygame.K_RIGHT] or keys[pygame.K_d]
-        self.move_up = keys[pygame.K_UP] or keys[pygame.K_w]
-        self.move_down = keys[pygame.K_DOWN] or keys[pygame.K_s]
+        # Read the new input state
+        flags = self._flags
+        move_left = keys[_K_LEFT] or keys[_K_A]
+        move_right = keys[_K_RIGHT] or keys[_K_D]
+        move_up = keys[_K_UP] or keys[_K_W]
+        move_down = keys[_K_DOWN] or keys[_K_S]
         
         # Update shoot flag
-        shoot_key = keys[pygame.K_SPACE]
-        self.shoot_pressed = shoot_key and not self.shoot
-        self.shoot = shoot_key
+        shoot = keys[_K_SPACE]
+        shoot_pressed = shoot and not flags[_SHOOT]
+        was_shooting = flags[_WAS_SHOOTING]
         
         # Update arm rotation flag (Alt key)
-        rotate_key = keys[pygame.K_LALT] or keys[pygame.K_RALT]
-        self.rotate_arms_pressed = rotate_key and not self.rotate_arms
-        self.rotate_arms = rotate_key
+        rotate_arms = keys[_K_LALT] or keys[_K_RALT]
+        rotate_arms_pressed = rotate_arms and not flags[_ROTATE_ARMS]
+        
+        # Store all flags at once; the previous states take this frame's values
+        flags[:] = (move_left, move_right, move_up, move_down,
+                    shoot, shoot_pressed, shoot,
+                    rotate_arms, rotate_arms_pressed, rotate_arms)
         
         # Apply movement to physics component
-        physics = self.entity.get_component("physics")
+        physics = self._physics
         if physics:
-            # Calculate movement direction
-            move_x = 0
-            move_y = 0
+            # Look up the movement direction for the held keys
+            move_x, move_y = _MOVE_DIRECTIONS[move_left | move_right << 1 | move_up << 2 | move_down << 3]
             
-            if self.move_left:
-                move_x -= 1
-            if self.move_right:
-                move_x += 1
-            if self.move_up:
-                move_y -= 1
-            if self.move_down:
-                move_y += 1
-                
-            # Normalize diagonal movement
-            if move_x != 0 and move_y != 0:
-                move_x *= 0.707  # 1/sqrt(2)
-                move_y *= 0.707
-                
             # Apply movement
-            physics.velocity.x = move_x * self.move_speed
-            physics.velocity.y = move_y * self.move_speed
+            move_speed = self.move_speed
+            physics.velocity.update(move_x * move_speed, move_y * move_speed)
             
         # Handle shooting with continuous fire support
-        weapon = self.entity.get_component("weapon")
+        weapon = self._weapon
         if weapon:
             # Start or stop continuous firing based on spacebar state
-            if self.shoot and not self.was_shooting:
+            if shoot and not was_shooting:
                 # Just started pressing spacebar
                 weapon.start_firing()
-            elif not self.shoot and self.was_shooting:
+            elif not shoot and was_shooting:
                 # Just released spacebar
                 weapon.stop_firing()
             
             # Handle arm rotation on Alt key press (not hold)
-            if self.rotate_arms_pressed:
+            if rotate_arms_pressed:
                 # Rotate arms to next position
                 weapon.rotate_arms()
                 
-        # Update previous states
-        self.was_shooting = self.shoot
-        self.was_rotating = self.rotate_arms
-        
     def set_move_speed(self, speed: float) -> None:
         """Set the movement speed.
         
@@ -1,9 +1,104 @@
 """Level Component for tracking level-specific entity properties."""
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from src.components.component import Component
 
 
+# Map level IDs to ink colors
+_INK_COLORS: Dict[int, str] = {
+    1: "dark_blue",
+    2: "purple",
+    3: "green",
+    4: "red",
+    5: "rainbow"
+}
+
+# Level-specific behavior parameters, shared by every LevelComponent
+_BEHAVIOR_PARAMS: Dict[int, Dict[str, Any]] = {
+    # Level 1: Dark Blue Ink
+    1: {
+        "weapon": {
+            "cooldown": 0.5,
+            "damage": 10
+        },
+        "ai": {
+            "aggression": 0.3,
+            "awareness": 0.5
+        },
+        "movement": {
+            "speed_multiplier": 1.0
+        }
+    },
+    # Level 2: Purple Ink
+    2: {
+        "weapon": {
+            "cooldown": 0.45,
+            "damage": 12
+        },
+        "ai": {
+            "aggression": 0.4,
+            "awareness": 0.6
+        },
+        "movement": {
+            "speed_multiplier": 1.1
+        }
+    },
+    # Level 3: Green Ink
+    3: {
+        "weapon": {
+            "cooldown": 0.4,
+            "damage": 15
+        },
+        "ai": {
+            "aggression": 0.5,
+            "awareness": 0.7
+        },
+        "movement": {
+            "speed_multiplier": 1.2
+        }
+    },
+    # Level 4: Red Ink
+    4: {
+        "weapon": {
+            "cooldown": 0.35,
+            "damage": 20
+        },
+        "ai": {
+            "aggression": 0.7,
+            "awareness": 0.8
+        },
+        "movement": {
+            "speed_multiplier": 1.3
+        }
+    },
+    # Level 5: Rainbow Ink
+    5: {
+        "weapon": {
+            "cooldown": 0.3,
+            "damage": 25
+        },
+        "ai": {
+            "aggression": 0.9,
+            "awareness": 0.9
+        },
+        "movement": {
+            "speed_multiplier": 1.5
+        }
+    }
+}
+
+
+def _freeze_params(params: Dict[str, Dict[str, Any]]) -> tuple:
+    """Flatten a behavior parameter table into a comparable tuple."""
+    return tuple(sorted((category, tuple(sorted(values.items()))) for category, values in params.items()))
+
+
+# Precomputed signatures so identical parameter sets can be detected with one comparison
+_PARAM_SIGNATURES: Dict[int, tuple] = {
+    level_id: _freeze_params(params) for level_id, params in _BEHAVIOR_PARAMS.items()
+}
+
+
 class LevelComponent(Component):
     """Component that tracks level-specific entity properties.
     
@@ -12,6 +107,17 @@ class LevelComponent(Component):
     behavior parameters, and scoring multipliers.
     """
     
+    __slots__ = (
+        'level_id',
+        'ink_color',
+        'scoring_multiplier',
+        'behavior_params',
+        '_applied_signature',
+    )
+    
+    # update does nothing, so entities skip this component
+    NEEDS_UPDATE = False
+    
     def __init__(self, level_id: int = 1):
         """Initialize the LevelComponent.
         
@@ -28,6 +134,9 @@ class LevelComponent(Component):
         # Level-specific behavior parameters
         self.behavior_params: Dict[str, Any] = self._get_behavior_params_for_level(level_id)
         
+        # Signature of the parameters last applied to the weapon and AI components
+        self._applied_signature: Optional[tuple] = None
+        
     def update(self, dt: float) -> None:
         """Update the level component.
         
@@ -37,6 +146,10 @@ class LevelComponent(Component):
         # This component doesn't need to do anything during update
         pass
         
+    def on_components_changed(self) -> None:
+        """Forget the applied parameters so new sibling components receive them."""
+        self._applied_signature = None
+        
     def set_level(self, level_id: int) -> None:
         """Set the current level and update all level-specific properties.
         
@@ -61,6 +174,12 @@ class LevelComponent(Component):
         if ink_slime:
             ink_slime.set_ink_color(self.ink_color)
             
+        # Skip the weapon and AI writes when the parameters are the ones already applied
+        signature = _PARAM_SIGNATURES.get(self.level_id, _PARAM_SIGNATURES[1])
+        if signature == self._applied_signature:
+            return
+        self._applied_signature = signature
+        
         # Update weapon component with level-specific parameters
         weapon = self.entity.get_component("weapon")
         if weapon and "weapon" in self.behavior_params:
@@ -88,16 +207,7 @@ class LevelComponent(Component):
         Returns:
             The ink color string for the level
         """
-        # Map level IDs to ink colors
-        ink_colors = {
-            1: "dark_blue",
-            2: "purple",
-            3: "green",
-            4: "red",
-            5: "rainbow"
-        }
-        
-        return ink_colors.get(level_id, "dark_blue")
+        return _INK_COLORS.get(level_id, "dark_blue")
         
     def _get_scoring_multiplier_for_level(self, level_id: int) -> float:
         """Get the scoring multiplier for a specific level.
@@ -123,81 +233,8 @@ class LevelComponent(Component):
         Returns:
             Dictionary of behavior parameters for the level
         """
-        # Define level-specific behavior parameters
-        behavior_params = {
-            # Level 1: Dark Blue Ink
-            1: {
-                "weapon": {
-                    "cooldown": 0.5,
-                    "damage": 10
-                },
-                "ai": {
-                    "aggression": 0.3,
-                    "awareness": 0.5
-                },
-                "movement": {
-                    "speed_multiplier": 1.0
-                }
-            },
-            # Level 2: Purple Ink
-            2: {
-                "weapon": {
-                    "cooldown": 0.45,
-                    "damage": 12
-                },
-                "ai": {
-                    "aggression": 0.4,
-                    "awareness": 0.6
-                },
-                "movement": {
-                    "speed_multiplier": 1.1
-                }
-            },
-            # Level 3: Green Ink
-            3: {
-                "weapon": {
-                    "cooldown": 0.4,
-                    "damage": 15
-                },
-                "ai": {
-                    "aggression": 0.5,
-                    "awareness": 0.7
-                },
-                "movement": {
-                    "speed_multiplier": 1.2
-                }
-            },
-            # Level 4: Red Ink
-            4: {
-                "weapon": {
-                    "cooldown": 0.35,
-                    "damage": 20
-                },
-                "ai": {
-                    "aggression": 0.7,
-                    "awareness": 0.8
-                },
-                "movement": {
-                    "speed_multiplier": 1.3
-                }
-            },
-            # Level 5: Rainbow Ink
-            5: {
-                "weapon": {
-                    "cooldown": 0.3,
-                    "damage": 25
-                },
-                "ai": {
-                    "aggression": 0.9,
-                    "awareness": 0.9
-                },
-                "movement": {
-                    "speed_multiplier": 1.5
-                }
-            }
-        }
-        
-        return behavior_params.get(level_id, behavior_params[1])
+        # Shared between components, so callers must treat it as read-only
+        return _BEHAVIOR_PARAMS.get(level_id, _BEHAVIOR_PARAMS[1])
         
     def get_ink_color(self) -> str:
         """Get the current ink color.
@@ -1,5 +1,6 @@
 """Physics Component for managing entity physics properties."""
 
+import math
 import pygame
 from src.components.component import Component
 
@@ -7,6 +8,19 @@ from src.components.component import Component
 class PhysicsComponent(Component):
     """Component that manages physics properties like velocity and acceleration."""
     
+    __slots__ = (
+        'velocity',
+        'acceleration',
+        'max_velocity',
+        'mass',
+        'friction',
+        'drag',
+        'use_gravity',
+        'gravity_scale',
+        'batched',
+        '_transform',
+    )
+    
     def __init__(self):
         """Initialize the PhysicsComponent."""
         super().__init__("physics")
@@ -21,6 +35,25 @@ class PhysicsComponent(Component):
         self.friction: float = 0.1
         self.use_gravity: bool = True
         self.gravity_scale: float = 1.0
+        self.drag: float = 1.0  # Damping factor set by some entity types
+        
+        # Set while a PhysicsSystem drives this component in batch
+        self.batched = False
+        
+        # Cached transform (refreshed when the entity's components change)
+        self._transform = None
+        
+    def on_add(self) -> None:
+        """Cache the transform when added to an entity."""
+        self._transform = self.entity.get_component("transform")
+        
+    def on_components_changed(self) -> None:
+        """Refresh the cached transform."""
+        self._transform = self.entity.get_component("transform")
+        
+    def on_remove(self) -> None:
+        """Drop the cached transform."""
+        self._transform = None
         
     def update(self, dt: float) -> None:
         """Update physics calculations.
@@ -28,25 +61,45 @@ class PhysicsComponent(Component):
         Args:
             dt: Delta time in seconds since the last update
         """
-        # Apply acceleration to velocity
-        self.velocity += self.acceleration * dt
+        if not self.batched:
+            self.integrate(dt)
+            
+    def integrate(self, dt: float) -> None:
+        """Apply acceleration, clamping and friction, then move the entity.
+        
+        Args:
+            dt: Delta time in seconds since the last update
+        """
+        velocity = self.velocity
+        acceleration = self.acceleration
+        max_velocity = self.max_velocity
+        
+        # Work on plain floats and write the velocity back once
+        vx = velocity.x + acceleration.x * dt
+        vy = velocity.y + acceleration.y * dt
         
         # Clamp velocity to max values
-        if abs(self.velocity.x) > self.max_velocity.x:
-            self.velocity.x = self.max_velocity.x if self.velocity.x > 0 else -self.max_velocity.x
-        if abs(self.velocity.y) > self.max_velocity.y:
-            self.velocity.y = self.max_velocity.y if self.velocity.y > 0 else -self.max_velocity.y
+        max_vx = max_velocity.x
+        max_vy = max_velocity.y
+        if abs(vx) > max_vx:
+            vx = max_vx if vx > 0 else -max_vx
+        if abs(vy) > max_vy:
+            vy = max_vy if vy > 0 else -max_vy
             
-        # Apply friction
-        if self.velocity.length() > 0:
-            friction_force = self.velocity.normalize() * self.friction * dt
-            if friction_force.length() > self.velocity.length():
-                self.velocity = pygame.math.Vector2(0, 0)
+        # Apply friction, only taking the square root when there is motion
+        speed_squared = vx * vx + vy * vy
+        if speed_squared > 0:
+            friction = self.friction * dt
+            if friction * friction > speed_squared:
+                vx = vy = 0.0
             else:
-                self.velocity -= friction_force
+                scale = 1.0 - friction / math.sqrt(speed_squared)
+                vx *= scale
+                vy *= scale
                 
+        velocity.update(vx, vy)
+        
         # Update position based on velocity
-        if self.entity:
-            transform = self.entity.get_component("transform")
-            if transform:
-                transform.translate(self.velocity.x * dt, self.velocity.y * dt)
\ No newline at end of file
+        transform = self._transform
+        if transform:
+            transform.translate(vx * dt, vy * dt)
\ No newline at end of file
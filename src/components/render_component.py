@@ -1,8 +1,48 @@
 """Render Component for rendering entities on screen."""
 
+import math
 import pygame
 from typing import Optional, Tuple, Dict, Any
 from src.components.component import Component
+from src.utils.asset_cache import AssetCache
+
+
+# Pre-drawn placeholder shapes: (shape, color, size...) -> Surface
+_PLACEHOLDERS: Dict[tuple, pygame.Surface] = {}
+
+# Scratch vectors the world transform queries write into while rendering;
+# their values are only valid until the next query
+_world_position = pygame.math.Vector2()
+_world_scale = pygame.math.Vector2()
+
+
+def _build_placeholder(key: tuple) -> pygame.Surface:
+    """Draw a filled placeholder shape with its border onto its own surface.
+    
+    Args:
+        key: ("circle", color, radius) or (shape, color, width, height)
+        
+    Returns:
+        The placeholder surface, transparent outside the shape
+    """
+    shape, color = key[0], key[1]
+    if shape == "circle":
+        radius = key[2]
+        extent = radius + 1
+        placeholder = pygame.Surface((2 * extent + 1, 2 * extent + 1), pygame.SRCALPHA)
+        pygame.draw.circle(placeholder, color, (extent, extent), radius)
+        pygame.draw.circle(placeholder, (0, 0, 0), (extent, extent), radius, 2)
+    elif shape == "ellipse":
+        rect = pygame.Rect(0, 0, key[2], key[3])
+        placeholder = pygame.Surface(rect.size, pygame.SRCALPHA)
+        pygame.draw.ellipse(placeholder, color, rect)
+        pygame.draw.ellipse(placeholder, (0, 0, 0), rect, 2)
+    else:
+        rect = pygame.Rect(0, 0, key[2], key[3])
+        placeholder = pygame.Surface(rect.size)
+        placeholder.fill(color)
+        pygame.draw.rect(placeholder, (0, 0, 0), rect, 2)
+    return placeholder
 
 
 class RenderComponent(Component):
@@ -12,6 +52,31 @@ class RenderComponent(Component):
     including sprites, colors, and rendering properties.
     """
     
+    __slots__ = (
+        'sprite_name',
+        'sprite',
+        'original_sprite',
+        'color',
+        'alpha',
+        'shape',
+        'size',
+        'visible',
+        'layer',
+        'offset',
+        'flip_x',
+        'flip_y',
+        'blend_mode',
+        'debug_draw',
+        'debug_color',
+        '_prep_key',
+        '_prep_surface',
+        '_prep_alpha',
+        '_prep_owned',
+    )
+    
+    # update does nothing, so entities skip this component
+    NEEDS_UPDATE = False
+    
     def __init__(self, sprite_name: Optional[str] = None):
         """Initialize the RenderComponent.
         
@@ -51,6 +116,12 @@ class RenderComponent(Component):
         self.debug_draw: bool = False
         self.debug_color: Tuple[int, int, int] = (255, 0, 255)  # Magenta
         
+        # Last prepared sprite and the state it was prepared from
+        self._prep_key: Optional[tuple] = None
+        self._prep_surface: Optional[pygame.Surface] = None
+        self._prep_alpha: int = 255
+        self._prep_owned: bool = False  # Whether _prep_surface belongs to this component
+        
     def update(self, dt: float) -> None:
         """Update the render component.
         
@@ -76,6 +147,7 @@ class RenderComponent(Component):
         # This would normally load from AssetManager
         # For now, we'll create a placeholder
         self.sprite_name = sprite_name
+        self._prep_key = None
         # TODO: Load actual sprite from AssetManager when available
         # self.sprite = asset_manager.get_sprite(sprite_name)
         
@@ -93,32 +165,66 @@ class RenderComponent(Component):
         if not transform:
             return
             
-        position = transform.get_world_position()
+        position = transform.get_world_position(_world_position)
         
         # Apply offset
         render_pos = position + self.offset
         
-        # Render sprite if available
-        if self.sprite:
-            sprite_to_render = self._prepare_sprite(transform)
-            
-            # Calculate sprite rect centered on position
-            sprite_rect = sprite_to_render.get_rect()
-            sprite_rect.center = (int(render_pos.x), int(render_pos.y))
-            
-            # Apply blend mode and render
-            if self.blend_mode != 0:
-                surface.blit(sprite_to_render, sprite_rect, special_flags=self.blend_mode)
+        # Skip all drawing work for entities entirely outside the surface
+        if self._is_on_surface(surface, render_pos, transform):
+            # Render sprite if available
+            if self.sprite:
+                sprite_to_render = self._prepare_sprite(transform)
+                
+                # Calculate sprite rect centered on position
+                sprite_rect = sprite_to_render.get_rect()
+                sprite_rect.center = (int(render_pos.x), int(render_pos.y))
+                
+                # Apply blend mode and render
+                if self.blend_mode != 0:
+                    surface.blit(sprite_to_render, sprite_rect, special_flags=self.blend_mode)
+                else:
+                    surface.blit(sprite_to_render, sprite_rect)
             else:
-                surface.blit(sprite_to_render, sprite_rect)
-        else:
-            # If no sprite, render a colored rectangle as placeholder
-            self._render_placeholder(surface, render_pos, transform)
-            
+                # If no sprite, render a colored rectangle as placeholder
+                self._render_placeholder(surface, render_pos, transform)
+                
         # Debug rendering
         if self.debug_draw:
             self._render_debug(surface, position, transform)
             
+    def _is_on_surface(self, surface: pygame.Surface, render_pos: pygame.math.Vector2,
+                       transform) -> bool:
+        """Check whether the entity's drawn bounds overlap the surface's clip area.
+        
+        The bounds are conservative: rotated sprites use their diagonal so any
+        rotation fits, and a small margin covers placeholder borders.
+        
+        Args:
+            surface: The surface to render to
+            render_pos: The center the entity is drawn at
+            transform: The entity's transform component
+            
+        Returns:
+            True if any part of the entity may be visible
+        """
+        if self.sprite:
+            width, height = self.sprite.get_size()
+        else:
+            width, height = self.size
+            
+        scale = transform.get_world_scale(_world_scale)
+        width *= abs(scale.x)
+        height *= abs(scale.y)
+        if self.sprite and transform.get_world_rotation() != 0:
+            width = height = math.hypot(width, height)
+            
+        half_width = width / 2 + 2
+        half_height = height / 2 + 2
+        clip = surface.get_clip()
+        return (render_pos.x + half_width >= clip.left and render_pos.x - half_width <= clip.right and
+                render_pos.y + half_height >= clip.top and render_pos.y - half_height <= clip.bottom)
+        
     def _prepare_sprite(self, transform) -> pygame.Surface:
         """Prepare the sprite for rendering with transformations applied.
         
@@ -129,37 +235,129 @@ class RenderComponent(Component):
             The prepared sprite surface
         """
         sprite = self.sprite
-        
-        # Apply scale if needed
-        scale = transform.get_world_scale()
-        if scale.x != 1.0 or scale.y != 1.0:
-            size = sprite.get_size()
-            new_size = (int(size[0] * abs(scale.x)), int(size[1] * abs(scale.y)))
-            sprite = pygame.transform.scale(sprite, new_size)
-            
-        # Apply rotation if needed
+        scale = transform.get_world_scale(_world_scale)
         rotation = transform.get_world_rotation()
-        if rotation != 0:
-            sprite = pygame.transform.rotate(sprite, -rotation)  # Negative for correct direction
+        
+        # Reuse the last prepared sprite while nothing affecting it has changed
+        key = (sprite, scale.x, scale.y, rotation, self.flip_x, self.flip_y, self.color)
+        if key == self._prep_key:
+            if self.alpha == self._prep_alpha:
+                return self._prep_surface
+                
+            # Only the alpha changed, so adjust a surface this component owns in place
+            if self._prep_owned:
+                self._prep_surface.set_alpha(self.alpha if self.alpha < 255 else None)
+                self._prep_alpha = self.alpha
+                return self._prep_surface
+                
+        # Apply color tint from the shared palette of pre-tinted sprites
+        if self.color != (255, 255, 255):
+            sprite = AssetCache.get_instance().get_tinted(sprite, self.color)
+        shared = True
+        
+        scaled = scale.x != 1.0 or scale.y != 1.0
+        if scaled and rotation != 0 and abs(scale.x) == abs(scale.y):
+            # Uniform scale and rotation in a single pass
+            sprite = pygame.transform.rotozoom(sprite, -rotation, abs(scale.x))  # Negative for correct direction
+            shared = False
+        else:
+            # Apply scale if needed
+            if scaled:
+                size = sprite.get_size()
+                new_size = (int(size[0] * abs(scale.x)), int(size[1] * abs(scale.y)))
+                sprite = pygame.transform.scale(sprite, new_size)
+                shared = False
+                
+            # Apply rotation if needed
+            if rotation != 0:
+                sprite = pygame.transform.rotate(sprite, -rotation)  # Negative for correct direction
+                shared = False
             
         # Apply flips
         if self.flip_x or self.flip_y:
             sprite = pygame.transform.flip(sprite, self.flip_x, self.flip_y)
+            shared = False
             
-        # Apply color tint
-        if self.color != (255, 255, 255):
-            sprite = sprite.copy()
-            color_surface = pygame.Surface(sprite.get_size())
-            color_surface.fill(self.color)
-            sprite.blit(color_surface, (0, 0), special_flags=pygame.BLEND_MULT)
-            
-        # Apply alpha
+        # Apply alpha, copying first if the surface is still shared
         if self.alpha < 255:
-            sprite = sprite.copy()
+            if shared:
+                sprite = sprite.copy()
+                shared = False
             sprite.set_alpha(self.alpha)
             
+        self._prep_key = key
+        self._prep_surface = sprite
+        self._prep_alpha = self.alpha
+        self._prep_owned = not shared
         return sprite
         
+    def get_placeholder_blit(self, surface: pygame.Surface) -> Optional[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Get the single blit this component's render would make, for batching.
+        
+        Args:
+            surface: The surface that will be rendered to
+            
+        Returns:
+            (placeholder surface, destination) when rendering amounts to
+            blitting a pre-drawn placeholder, None otherwise
+        """
+        if (not self.visible or not self.entity or self.sprite or self.debug_draw
+                or type(self).render is not RenderComponent.render):
+            return None
+            
+        transform = self.entity.get_component("transform")
+        if not transform:
+            return None
+            
+        render_pos = transform.get_world_position(_world_position)
+        render_pos += self.offset
+        if not self._is_on_surface(surface, render_pos, transform):
+            return None
+        return self._placeholder_blit(surface, render_pos, transform)
+        
+    def _placeholder_blit(self, surface: pygame.Surface, position: pygame.math.Vector2,
+                          transform) -> Optional[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Find the pre-drawn placeholder for this component and where it goes.
+        
+        Args:
+            surface: The surface that will be rendered to
+            position: The render position
+            transform: The entity's transform component
+            
+        Returns:
+            (placeholder surface, destination), or None for shapes that have
+            to be drawn directly
+        """
+        scale = transform.get_world_scale(_world_scale)
+        size_x = self.size[0] * scale.x
+        size_y = self.size[1] * scale.y
+        
+        if self.shape == "circle":
+            radius = int(min(size_x, size_y) / 2)
+            if radius <= 0:
+                return None
+            key = ("circle", self.color, radius)
+            extent = radius + 1
+            dest = (int(position.x) - extent, int(position.y) - extent)
+        else:
+            rect = pygame.Rect(position.x - size_x / 2, position.y - size_y / 2, size_x, size_y)
+            if rect.width <= 0 or rect.height <= 0:
+                return None
+                
+            shape = "ellipse" if self.shape == "ellipse" else "rect"
+            
+            # pygame draws a clipped rectangle's border along the clip edge, which a blit would not
+            if shape == "rect" and not surface.get_clip().contains(rect):
+                return None
+                
+            key = (shape, self.color, rect.width, rect.height)
+            dest = rect.topleft
+            
+        placeholder = _PLACEHOLDERS.get(key)
+        if placeholder is None:
+            placeholder = _PLACEHOLDERS[key] = _build_placeholder(key)
+        return placeholder, dest
+        
     def _render_placeholder(self, surface: pygame.Surface, position: pygame.math.Vector2,
                           transform) -> None:
         """Render a placeholder shape when no sprite is available.
@@ -169,11 +367,17 @@ class RenderComponent(Component):
             position: The render position
             transform: The entity's transform component
         """
+        # Blit the pre-drawn shape when there is one
+        blit = self._placeholder_blit(surface, position, transform)
+        if blit:
+            surface.blit(*blit)
+            return
+            
         # Use configured size
         size = pygame.math.Vector2(self.size[0], self.size[1])
         
         # Apply scale
-        scale = transform.get_world_scale()
+        scale = transform.get_world_scale(_world_scale)
         size.x *= scale.x
         size.y *= scale.y
         
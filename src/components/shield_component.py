@@ -1,11 +1,30 @@
 """Shield Component for blocking ink shots."""
 
+from typing import List, Sequence
+
 from src.components.component import Component
 
 
 class ShieldComponent(Component):
     """Component that provides shield functionality for entities like turtles."""
     
+    __slots__ = (
+        'max_health',
+        'current_health',
+        '_block_radius',
+        '_block_radius_sq',
+        'active',
+        'recharge_timer',
+        'recharge_delay',
+        'recharge_rate',
+        'hit_cooldown',
+        'hit_cooldown_duration',
+        'flash_timer',
+        'flash_duration',
+        'is_flashing',
+        '_transform',
+    )
+    
     def __init__(self, max_health: int = 3, block_radius: float = 40.0):
         """Initialize the ShieldComponent.
         
@@ -30,6 +49,31 @@ class ShieldComponent(Component):
         self.flash_duration = 0.2
         self.is_flashing = False
         
+        # Cached transform (refreshed when the entity's components change)
+        self._transform = None
+        
+    def on_add(self) -> None:
+        """Cache the transform when added to an entity."""
+        self._transform = self.entity.get_component("transform")
+        
+    def on_components_changed(self) -> None:
+        """Refresh the cached transform."""
+        self._transform = self.entity.get_component("transform")
+        
+    def on_remove(self) -> None:
+        """Drop the cached transform."""
+        self._transform = None
+        
+    @property
+    def block_radius(self) -> float:
+        """Radius around the entity where the shield blocks projectiles."""
+        return self._block_radius
+        
+    @block_radius.setter
+    def block_radius(self, value: float) -> None:
+        self._block_radius = value
+        self._block_radius_sq = value * value
+        
     def update(self, dt: float) -> None:
         """Update shield state.
         
@@ -109,16 +153,37 @@ class ShieldComponent(Component):
         if not self.active:
             return False
             
-        transform = self.entity.get_component("transform")
+        transform = self._transform
         if not transform:
             return False
             
         # Calculate distance from entity center to projectile
-        dx = projectile_position[0] - transform.position[0]
-        dy = projectile_position[1] - transform.position[1]
-        distance_squared = dx * dx + dy * dy
+        position = transform.position
+        dx = projectile_position[0] - position[0]
+        dy = projectile_position[1] - position[1]
         
-        return distance_squared <= self.block_radius * self.block_radius
+        return dx * dx + dy * dy <= self._block_radius_sq
+        
+    def can_block_many(self, projectile_positions: Sequence[tuple]) -> List[bool]:
+        """Check which of several projectile positions the shield can block.
+        
+        Args:
+            projectile_positions: Positions of the projectiles
+            
+        Returns:
+            Whether the shield can block each position, in order
+        """
+        transform = self._transform
+        if not self.active or not transform:
+            return [False] * len(projectile_positions)
+            
+        # Read the shield center once for the whole batch
+        cx, cy = transform.position
+        radius_sq = self._block_radius_sq
+        return [
+            (x - cx) * (x - cx) + (y - cy) * (y - cy) <= radius_sq
+            for x, y in projectile_positions
+        ]
         
     def activate(self) -> None:
         """Activate the shield."""
@@ -10,6 +10,21 @@ class ShipInkLoadComponent(Component):
     sink completely when the ink load reaches maximum capacity.
     """
     
+    __slots__ = (
+        'current_ink_load',
+        '_max_ink_load',
+        'sink_level',
+        'base_y_offset',
+        '_max_sink_offset',
+        '_sink_offset_per_ink',
+        'is_sinking',
+        'sink_timer',
+        'sink_duration',
+        '_render',
+        '_ai',
+        '_physics',
+    )
+    
     def __init__(self, max_ink_load: int = 100):
         """Initialize the ShipInkLoadComponent.
         
@@ -20,18 +35,73 @@ class ShipInkLoadComponent(Component):
         
         # Ink load properties
         self.current_ink_load: int = 0
-        self.max_ink_load: int = max_ink_load
+        self._max_ink_load: int = max_ink_load
         self.sink_level: float = 0.0  # 0 to 1, where 1 is fully sunk
         
         # Visual offset for sinking effect
         self.base_y_offset: float = 0.0
-        self.max_sink_offset: float = 20.0  # Maximum pixels to sink
+        self._max_sink_offset: float = 20.0  # Maximum pixels to sink
+        
+        # Sink offset per unit of ink, recomputed when either maximum changes
+        self._update_ink_factors()
         
         # Sinking state
         self.is_sinking: bool = False
         self.sink_timer: float = 0.0
         self.sink_duration: float = 2.0  # Time to fully sink
         
+        # Cached sibling components (refreshed when the entity's components change)
+        self._render = None
+        self._ai = None
+        self._physics = None
+        
+    def on_add(self) -> None:
+        """Cache sibling components when added to an entity."""
+        self._cache_components()
+        
+    def on_components_changed(self) -> None:
+        """Refresh cached sibling components."""
+        self._cache_components()
+        
+    def on_remove(self) -> None:
+        """Drop cached sibling components."""
+        self._render = None
+        self._ai = None
+        self._physics = None
+        
+    def _cache_components(self) -> None:
+        """Look up the sibling components affected by the ink load."""
+        entity = self.entity
+        if not entity:
+            return
+        self._render = entity.get_component("render")
+        self._ai = entity.get_component("ai")
+        self._physics = entity.get_component("physics")
+        
+    @property
+    def max_ink_load(self) -> int:
+        """Maximum ink the ship can take before sinking."""
+        return self._max_ink_load
+        
+    @max_ink_load.setter
+    def max_ink_load(self, value: int) -> None:
+        self._max_ink_load = value
+        self._update_ink_factors()
+        
+    @property
+    def max_sink_offset(self) -> float:
+        """Maximum pixels the ship sinks at full ink load."""
+        return self._max_sink_offset
+        
+    @max_sink_offset.setter
+    def max_sink_offset(self, value: float) -> None:
+        self._max_sink_offset = value
+        self._update_ink_factors()
+        
+    def _update_ink_factors(self) -> None:
+        """Precompute the sink offset added per unit of ink."""
+        self._sink_offset_per_ink = self._max_sink_offset / self._max_ink_load
+        
     def update(self, dt: float) -> None:
         """Update the ink load component.
         
@@ -56,8 +126,8 @@ class ShipInkLoadComponent(Component):
         # Increase ink load
         self.current_ink_load = min(self.current_ink_load + amount, self.max_ink_load)
         
-        # Calculate new sink level
-        self.sink_level = self.current_ink_load / self.max_ink_load
+        # Calculate new sink level (divided so a full load is exactly 1.0)
+        self.sink_level = self.current_ink_load / self._max_ink_load
         
         # Update ship's visual appearance based on sink level
         self._update_ship_appearance()
@@ -72,10 +142,10 @@ class ShipInkLoadComponent(Component):
             return
             
         # Update render component's Y offset to make ship appear lower in water
-        render = self.entity.get_component("render")
+        render = self._render
         if render:
             # Calculate visual sink offset
-            sink_offset = self.sink_level * self.max_sink_offset
+            sink_offset = self.current_ink_load * self._sink_offset_per_ink
             render.offset.y = self.base_y_offset + sink_offset
             
             # Optionally darken the ship based on ink load
@@ -90,11 +160,11 @@ class ShipInkLoadComponent(Component):
         self.sink_timer = 0.0
         
         # Disable ship's AI and movement
-        ai = self.entity.get_component("ai")
+        ai = self._ai
         if ai:
             ai.enabled = False
             
-        physics = self.entity.get_component("physics")
+        physics = self._physics
         if physics:
             # Slow down the ship dramatically
             physics.velocity.x *= 0.1
@@ -1,7 +1,8 @@
 """Transform Component for managing entity position, rotation, and scale."""
 
+import math
 import pygame
-from typing import Optional
+from typing import Optional, Tuple
 from src.components.component import Component
 
 
@@ -12,6 +13,16 @@ class TransformComponent(Component):
     where an entity exists in the game world and how it's oriented.
     """
     
+    __slots__ = (
+        'position',
+        'previous_position',
+        'rotation',
+        'scale',
+        'origin',
+        'parent',
+        'batched',
+    )
+    
     def __init__(self):
         """Initialize the TransformComponent."""
         super().__init__("transform")
@@ -34,6 +45,9 @@ class TransformComponent(Component):
         # Parent transform (for hierarchical transformations)
         self.parent: Optional['TransformComponent'] = None
         
+        # Set while a TransformSystem drives this component in batch
+        self.batched = False
+        
     def update(self, dt: float) -> None:
         """Update the transform component.
         
@@ -42,7 +56,11 @@ class TransformComponent(Component):
         Args:
             dt: Delta time in seconds since the last update
         """
-        self.previous_position = self.position.copy()
+        if self.batched:
+            return
+            
+        # Copy into the existing vector rather than allocating a new one
+        self.previous_position.update(self.position)
         
     def set_position(self, x: float, y: float) -> None:
         """Set the position of the transform.
@@ -70,9 +88,11 @@ class TransformComponent(Component):
         Args:
             angle: Angle to rotate in degrees
         """
-        self.rotation += angle
-        # Keep rotation in 0-360 range
-        self.rotation = self.rotation % 360
+        rotation = self.rotation + angle
+        # Keep rotation in 0-360 range, skipping the modulo when already inside
+        if not 0 <= rotation < 360:
+            rotation %= 360
+        self.rotation = rotation
         
     def set_rotation(self, angle: float) -> None:
         """Set the absolute rotation of the transform.
@@ -92,21 +112,38 @@ class TransformComponent(Component):
         self.scale.x = scale_x
         self.scale.y = scale_y if scale_y is not None else scale_x
         
-    def get_world_position(self) -> pygame.math.Vector2:
+    def get_world_position(self, out: Optional[pygame.math.Vector2] = None) -> pygame.math.Vector2:
         """Get the world position, taking parent transforms into account.
         
+        Args:
+            out: Vector to write the result into instead of returning a new one
+            
         Returns:
-            The world position as a Vector2
+            The world position as a Vector2 (``out`` itself when given)
+        """
+        if out is None:
+            if self.parent:
+                return self._get_world_position_and_rotation()[0]
+            return self.position.copy()
+            
+        out.update(self._get_world_position_and_rotation()[0] if self.parent else self.position)
+        return out
+        
+    def _get_world_position_and_rotation(self) -> Tuple[pygame.math.Vector2, float]:
+        """Get the world position and rotation in one walk up the parent chain.
+        
+        Returns:
+            The world position as a new Vector2 and the world rotation in degrees
         """
         if self.parent:
-            parent_pos = self.parent.get_world_position()
+            parent_pos, parent_rotation = self.parent._get_world_position_and_rotation()
             # Apply parent's rotation to this position
-            offset = self.position.rotate(self.parent.get_world_rotation())
+            offset = self.position.rotate(parent_rotation)
             # Apply parent's scale
             offset.x *= self.parent.scale.x
             offset.y *= self.parent.scale.y
-            return parent_pos + offset
-        return self.position.copy()
+            return parent_pos + offset, (self.rotation + parent_rotation) % 360
+        return self.position.copy(), self.rotation
         
     def get_world_rotation(self) -> float:
         """Get the world rotation, taking parent transforms into account.
@@ -118,19 +155,28 @@ class TransformComponent(Component):
             return (self.rotation + self.parent.get_world_rotation()) % 360
         return self.rotation
         
-    def get_world_scale(self) -> pygame.math.Vector2:
+    def get_world_scale(self, out: Optional[pygame.math.Vector2] = None) -> pygame.math.Vector2:
         """Get the world scale, taking parent transforms into account.
         
+        Args:
+            out: Vector to write the result into instead of returning a new one
+            
         Returns:
-            The world scale as a Vector2
+            The world scale as a Vector2 (``out`` itself when given)
         """
         if self.parent:
             parent_scale = self.parent.get_world_scale()
-            return pygame.math.Vector2(
-                self.scale.x * parent_scale.x,
-                self.scale.y * parent_scale.y
-            )
-        return self.scale.copy()
+            scale_x = self.scale.x * parent_scale.x
+            scale_y = self.scale.y * parent_scale.y
+            if out is None:
+                return pygame.math.Vector2(scale_x, scale_y)
+            out.update(scale_x, scale_y)
+            return out
+            
+        if out is None:
+            return self.scale.copy()
+        out.update(self.scale)
+        return out
         
     def look_at(self, target_x: float, target_y: float) -> None:
         """Rotate the transform to look at a target position.
@@ -139,10 +185,11 @@ class TransformComponent(Component):
             target_x: X coordinate of the target
             target_y: Y coordinate of the target
         """
-        direction = pygame.math.Vector2(target_x - self.position.x, 
-                                       target_y - self.position.y)
-        if direction.length() > 0:
-            self.rotation = direction.angle_to(pygame.math.Vector2(1, 0))
+        dx = target_x - self.position.x
+        dy = target_y - self.position.y
+        if dx or dy:
+            # Same angle as Vector2(dx, dy).angle_to(Vector2(1, 0))
+            self.rotation = -math.atan2(dy, dx) * 180 / math.pi
             
     def get_forward_vector(self) -> pygame.math.Vector2:
         """Get the forward direction vector based on current rotation.
@@ -151,8 +198,8 @@ class TransformComponent(Component):
             A normalized vector pointing in the forward direction
         """
         # In our coordinate system, 0 degrees points right
-        rad = pygame.math.Vector2(1, 0).rotate(self.rotation)
-        return rad.normalize()
+        rad = math.radians(self.rotation)
+        return pygame.math.Vector2(math.cos(rad), math.sin(rad))
         
     def get_right_vector(self) -> pygame.math.Vector2:
         """Get the right direction vector based on current rotation.
@@ -161,7 +208,8 @@ class TransformComponent(Component):
             A normalized vector pointing to the right
         """
         # Right vector is forward rotated 90 degrees clockwise
-        return self.get_forward_vector().rotate(90)
+        rad = math.radians(self.rotation + 90)
+        return pygame.math.Vector2(math.cos(rad), math.sin(rad))
         
     def distance_to(self, other_transform: 'TransformComponent') -> float:
         """Calculate the distance to another transform.
@@ -2,9 +2,45 @@
 
 import pygame
 import math
-from typing import List, Dict, Any
+from typing import List, Tuple
 from src.components.component import Component
 
+# Try to import numpy, but make it optional
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Try to import numba, but make it optional
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Counts the arm cooldowns down in place, stopping at zero. Without Numba the
+# cooldowns stay a list and are ticked in Python, which beats NumPy for the
+# handful of arms an octopus has
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _tick_cooldowns(cooldowns, dt):
+        """Count arm cooldowns down, stopping at zero."""
+        for i in range(cooldowns.shape[0]):
+            remaining = cooldowns[i] - dt
+            cooldowns[i] = remaining if remaining > 0 else 0.0
+
+
+def warm_up_kernels() -> None:
+    """Compile the Numba kernel, or load it from the cache, ahead of time.
+    
+    Numba compiles a kernel on its first call, which would otherwise stall
+    the first gameplay frame. Does nothing when Numba is unavailable.
+    """
+    if NUMBA_AVAILABLE:
+        _tick_cooldowns(np.zeros(1), 0.0)
+
 
 class WeaponComponent(Component):
     """Component that manages weapon and shooting mechanics.
@@ -14,6 +50,34 @@ class WeaponComponent(Component):
     slightly weaker shots.
     """
     
+    __slots__ = (
+        'projectile_speed',
+        'damage',
+        'center_damage_multiplier',
+        'side_damage_multiplier',
+        'ink_color',
+        'arm_count',
+        'base_cooldown',
+        '_arm_length',
+        'rotation_cooldown',
+        'rotation_cooldown_time',
+        'arm_angles',
+        'arm_pos_x',
+        'arm_pos_y',
+        'arm_cooldowns',
+        '_fire_directions',
+        '_fire_offsets',
+        '_left_of',
+        '_right_of',
+        '_active_arm_index',
+        '_active_indices',
+        'is_firing',
+        'fire_timer',
+        'fire_interval',
+        '_entity_factory',
+        '_transform',
+    )
+    
     def __init__(self, arm_count: int = 10, base_cooldown: float = 0.5):
         """Initialize the WeaponComponent.
         
@@ -32,45 +96,121 @@ class WeaponComponent(Component):
         
         # Arm system
         self.arm_count: int = arm_count
-        self.active_arm_index: int = 0  # Center/main arm index
         self.base_cooldown: float = base_cooldown
-        self.arm_length: float = 50.0  # Distance from center to arm tip
+        self.arm_length = 50.0  # Distance from center to arm tip
         
         # Rotation control
         self.rotation_cooldown: float = 0.0  # Cooldown for arm rotation
         self.rotation_cooldown_time: float = 0.1  # Seconds between allowed rotations
         
-        # Initialize arms with positions and individual cooldowns
-        self.arms: List[Dict[str, Any]] = []
+        # Per-arm state stored as parallel arrays (indexed by arm)
+        self.arm_angles = None
+        self.arm_pos_x = None  # Unit vector x component
+        self.arm_pos_y = None  # Unit vector y component
+        self.arm_cooldowns = None
+        self._fire_directions: List[pygame.math.Vector2] = []  # Shared, never modified
+        self._left_of: List[int] = []  # Neighboring arm indices, wrapping around
+        self._right_of: List[int] = []
         self._initialize_arms()
+        self.active_arm_index = 0  # Center/main arm index
         
         # Continuous firing state
         self.is_firing: bool = False
         self.fire_timer: float = 0.0
         self.fire_interval: float = 0.1  # Time between shots when holding fire
         
+        # Entity factory, looked up on the first shot
+        self._entity_factory = None
+        
+        # Cached transform (refreshed when the entity's components change)
+        self._transform = None
+        
+    def on_add(self) -> None:
+        """Cache the transform when added to an entity."""
+        self._transform = self.entity.get_component("transform")
+        
+    def on_components_changed(self) -> None:
+        """Refresh the cached transform."""
+        self._transform = self.entity.get_component("transform")
+        
+    def on_remove(self) -> None:
+        """Drop the cached transform."""
+        self._transform = None
+        
     def _initialize_arms(self) -> None:
         """Initialize arm positions in a circular pattern."""
-        for i in range(self.arm_count):
-            # Distribute arms evenly around the octopus
-            angle = (i / self.arm_count) * 2 * math.pi
-            self.arms.append({
-                "index": i,
-                "angle": angle,
-                "cooldown": 0.0,
-                "position": (math.cos(angle), math.sin(angle))  # Unit vector
-            })
+        # Distribute arms evenly around the octopus
+        if NUMPY_AVAILABLE:
+            self.arm_angles = np.arange(self.arm_count) / self.arm_count * 2 * math.pi
+            self.arm_pos_x = np.cos(self.arm_angles)
+            self.arm_pos_y = np.sin(self.arm_angles)
+        else:
+            self.arm_angles = [(i / self.arm_count) * 2 * math.pi for i in range(self.arm_count)]
+            self.arm_pos_x = [math.cos(angle) for angle in self.arm_angles]
+            self.arm_pos_y = [math.sin(angle) for angle in self.arm_angles]
+        if NUMBA_AVAILABLE:
+            self.arm_cooldowns = np.zeros(self.arm_count)
+        else:
+            self.arm_cooldowns = [0.0] * self.arm_count
             
+        self._fire_directions = [
+            pygame.math.Vector2(float(arm_x), float(arm_y))
+            for arm_x, arm_y in zip(self.arm_pos_x, self.arm_pos_y)
+        ]
+        self._fire_offsets = None
+        
+        count = self.arm_count
+        self._left_of = [(i - 1) % count for i in range(count)]
+        self._right_of = [(i + 1) % count for i in range(count)]
+        
+    @property
+    def arm_length(self) -> float:
+        """Distance from the entity center to each arm tip."""
+        return self._arm_length
+        
+    @arm_length.setter
+    def arm_length(self, value: float) -> None:
+        self._arm_length = value
+        # Firing offsets are rebuilt on the next shot
+        self._fire_offsets = None
+        
+    def _build_fire_offsets(self) -> List[Tuple[float, float]]:
+        """Scale each arm's unit vector by the arm length.
+        
+        Returns:
+            (x, y) offset from the entity center to each arm tip
+        """
+        arm_length = self._arm_length
+        return [
+            (float(arm_x) * arm_length, float(arm_y) * arm_length)
+            for arm_x, arm_y in zip(self.arm_pos_x, self.arm_pos_y)
+        ]
+        
+    @property
+    def active_arm_index(self) -> int:
+        """Index of the center (main) active arm."""
+        return self._active_arm_index
+        
+    @active_arm_index.setter
+    def active_arm_index(self, index: int) -> None:
+        self._active_arm_index = index
+        # Indices of the three active arms, in order (left, center, right)
+        self._active_indices = (self._left_of[index], index, self._right_of[index])
+        
     def update(self, dt: float) -> None:
         """Update weapon cooldowns and handle continuous firing.
         
         Args:
             dt: Delta time in seconds since the last update
         """
-        # Update individual arm cooldowns
-        for arm in self.arms:
-            if arm["cooldown"] > 0:
-                arm["cooldown"] -= dt
+        # Update individual arm cooldowns, stopping at zero
+        cooldowns = self.arm_cooldowns
+        if NUMBA_AVAILABLE:
+            _tick_cooldowns(cooldowns, dt)
+        else:
+            for i, cooldown in enumerate(cooldowns):
+                if cooldown > 0:
+                    cooldowns[i] = max(0.0, cooldown - dt)
         
         # Update rotation cooldown
         if self.rotation_cooldown > 0:
@@ -92,71 +232,64 @@ class WeaponComponent(Component):
         if not self.entity:
             return False
         
-        # Get the three active arms (center and two adjacent)
-        active_arms = self.get_active_arms()
-        shot_fired = False
-        
-        # Try to fire from each active arm
-        for i, arm in enumerate(active_arms):
-            if arm["cooldown"] <= 0:
-                # Determine if this is the center arm or a side arm
-                is_center = i == 1  # Index 1 is the center arm in the active_arms list
-                
-                # Fire from this arm with appropriate damage multiplier
-                if self._fire_from_arm(arm, is_center):
-                    # Set cooldown for this arm
-                    arm["cooldown"] = self.base_cooldown
-                    shot_fired = True
+        # Find the active arms (left, center, right) that are off cooldown
+        cooldowns = self.arm_cooldowns
+        ready = [
+            (arm_index, i == 1)  # Index 1 is the center arm in the active arms
+            for i, arm_index in enumerate(self._active_indices)
+            if cooldowns[arm_index] <= 0
+        ]
+        if not ready or not self._fire_from_arms(ready):
+            return False
+            
+        # Set cooldown for each arm that fired
+        for arm_index, _ in ready:
+            cooldowns[arm_index] = self.base_cooldown
         
-        return shot_fired
+        return True
         
-    def _fire_from_arm(self, arm: Dict[str, Any], is_center: bool = False) -> bool:
-        """Fire a projectile from a specific arm.
+    def _fire_from_arms(self, arms: List[Tuple[int, bool]]) -> bool:
+        """Fire one projectile from each of several arms.
         
         Args:
-            arm: The arm dictionary containing position and angle info
-            is_center: Whether this is the center (more powerful) arm
+            arms: (arm index, whether it is the center arm) for each arm to fire from
             
         Returns:
-            True if projectile was created successfully
+            True if the projectiles were created successfully
         """
         # Get entity position from transform component
-        transform = self.entity.get_component("transform")
+        transform = self._transform
         if not transform:
             return False
             
-        # Calculate firing position based on arm angle and entity position
+        # Calculate firing positions based on arm angle and entity position
+        offsets = self._fire_offsets
+        if offsets is None:
+            offsets = self._fire_offsets = self._build_fire_offsets()
         entity_pos = transform.position
-        firing_position = (
-            entity_pos.x + arm["position"][0] * self.arm_length,
-            entity_pos.y + arm["position"][1] * self.arm_length
-        )
-        
-        # Calculate firing direction (outward from the arm)
-        direction = pygame.math.Vector2(arm["position"][0], arm["position"][1])
-        
-        # Determine damage multiplier based on whether this is center or side arm
-        damage_multiplier = self.center_damage_multiplier if is_center else self.side_damage_multiplier
-        
-        # Create ink slime projectile using entity factory
-        from src.entities.entity_factory import EntityFactory
-        entity_factory = EntityFactory()
-        
-        # Create the projectile
-        projectile = entity_factory.create_ink_slime(
-            firing_position[0],
-            firing_position[1],
-            direction,
-            self.ink_color
-        )
-        
-        # Apply damage multiplier to the ink slime component
-        if projectile:
-            ink_slime_comp = projectile.get_component("ink_slime")
-            if ink_slime_comp:
-                # Apply the damage multiplier to the base ink damage
-                base_damage = ink_slime_comp.ink_damage
-                ink_slime_comp.ink_damage = int(base_damage * damage_multiplier)
+        positions = []
+        directions = []
+        damage_multipliers = []
+        for arm_index, is_center in arms:
+            offset_x, offset_y = offsets[arm_index]
+            positions.append((entity_pos.x + offset_x, entity_pos.y + offset_y))
+            
+            # Firing direction points outward from the arm
+            directions.append(self._fire_directions[arm_index])
+            
+            # Center arm shots are stronger than side arm shots
+            damage_multipliers.append(
+                self.center_damage_multiplier if is_center else self.side_damage_multiplier
+            )
+        
+        # Create ink slime projectiles using entity factory
+        entity_factory = self._entity_factory
+        if entity_factory is None:
+            # Imported here because the factory module imports this one
+            from src.entities.entity_factory import EntityFactory
+            entity_factory = self._entity_factory = EntityFactory()
+        
+        entity_factory.create_ink_slimes(positions, directions, self.ink_color, damage_multipliers)
         
         return True
         
@@ -196,51 +329,46 @@ class WeaponComponent(Component):
             return False
             
         # Rotate to next arm position
-        self.active_arm_index = (self.active_arm_index + 1) % self.arm_count
+        self.active_arm_index = self._right_of[self.active_arm_index]
         
         # Set rotation cooldown
         self.rotation_cooldown = self.rotation_cooldown_time
         
         return True
         
-    def get_active_arms(self) -> List[Dict[str, Any]]:
+    def get_active_arms(self) -> Tuple[int, int, int]:
         """Get the three currently active arms (center and two adjacent).
         
         Returns:
-            List of three arm dictionaries in order [left, center, right]
+            Indices of the three arms in order (left, center, right)
         """
-        # Calculate indices for the three active arms
-        center_idx = self.active_arm_index
-        left_idx = (center_idx - 1) % self.arm_count
-        right_idx = (center_idx + 1) % self.arm_count
-        
-        # Return the three arms in order [left, center, right]
-        return [self.arms[left_idx], self.arms[center_idx], self.arms[right_idx]]
+        return self._active_indices
         
-    def get_arm_positions(self) -> List[pygame.math.Vector2]:
+    def get_arm_positions(self) -> List[Tuple[float, float]]:
         """Get the world positions of all arms (useful for rendering).
         
         Returns:
-            List of arm tip positions in world coordinates
+            List of (x, y) arm tip positions in world coordinates
         """
         if not self.entity:
             return []
             
-        transform = self.entity.get_component("transform")
+        transform = self._transform
         if not transform:
             return []
             
         entity_pos = transform.position
-        positions = []
+        arm_length = self.arm_length
         
-        for arm in self.arms:
-            world_pos = pygame.math.Vector2(
-                entity_pos.x + arm["position"][0] * self.arm_length,
-                entity_pos.y + arm["position"][1] * self.arm_length
-            )
-            positions.append(world_pos)
+        if NUMPY_AVAILABLE:
+            xs = entity_pos.x + self.arm_pos_x * arm_length
+            ys = entity_pos.y + self.arm_pos_y * arm_length
+            return list(zip(xs.tolist(), ys.tolist()))
             
-        return positions
+        return [
+            (entity_pos.x + arm_x * arm_length, entity_pos.y + arm_y * arm_length)
+            for arm_x, arm_y in zip(self.arm_pos_x, self.arm_pos_y)
+        ]
         
     def is_arm_active(self, arm_index: int) -> bool:
         """Check if an arm is currently active.
@@ -251,11 +379,7 @@ class WeaponComponent(Component):
         Returns:
             True if the arm is one of the three active arms
         """
-        active_arms = self.get_active_arms()
-        for arm in active_arms:
-            if arm["index"] == arm_index:
-                return True
-        return False
+        return arm_index in self._active_indices
         
     def get_arm_role(self, arm_index: int) -> str:
         """Get the role of an arm (center, side, or inactive).
@@ -269,9 +393,7 @@ class WeaponComponent(Component):
         if arm_index == self.active_arm_index:
             return "center"
             
-        active_arms = self.get_active_arms()
-        for arm in active_arms:
-            if arm["index"] == arm_index:
-                return "side"
-                
+        if arm_index in self._active_indices:
+            return "side"
+            
         return "inactive"
\ No newline at end of file
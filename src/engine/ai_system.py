@@ -0,0 +1,250 @@
+"""AI system that batches AIComponent updates across all entities."""
+
+from typing import Dict, List
+
+# Try to import numpy, but make it optional
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Try to import numba, but make it optional
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+from src.components.ai_component import AIComponent
+
+
+# Per-frame numeric kernels. Each takes the gathered arrays for one AI type
+# and returns new velocities plus direction flips (-1/1, 0 = unchanged).
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _ship_step(speed, direction, pos_x):
+        """Compute ship velocities and edge reversals."""
+        n = pos_x.shape[0]
+        vel_x = np.empty(n)
+        flip = np.zeros(n, np.int8)
+        for i in range(n):
+            vel_x[i] = speed[i] * direction[i]
+            if pos_x[i] <= 50 and direction[i] < 0:
+                flip[i] = 1
+            elif pos_x[i] >= 750 and direction[i] > 0:
+                flip[i] = -1
+        return vel_x, flip
+
+    @njit(cache=True, fastmath=True)
+    def _turtle_step(timer):
+        """Compute the defensive sway velocity of idle turtles."""
+        n = timer.shape[0]
+        vel_x = np.empty(n)
+        vel_y = np.empty(n)
+        for i in range(n):
+            vel_x[i] = np.sin(timer[i] * 0.5) * 30
+            vel_y[i] = np.cos(timer[i] * 0.3) * 20
+        return vel_x, vel_y
+
+    @njit(cache=True, fastmath=True)
+    def _fish_step(timer, interval, pos_x, pos_y):
+        """Reset due wander timers in place and find fish outside the bounds."""
+        n = timer.shape[0]
+        due = np.zeros(n, np.bool_)
+        flip_x = np.zeros(n, np.bool_)
+        flip_y = np.zeros(n, np.bool_)
+        for i in range(n):
+            if timer[i] >= interval[i]:
+                timer[i] = 0.0
+                due[i] = True
+            flip_x[i] = pos_x[i] < 50 or pos_x[i] > 750
+            flip_y[i] = pos_y[i] < 50 or pos_y[i] > 550
+        return due, flip_x, flip_y
+
+elif NUMPY_AVAILABLE:
+    def _ship_step(speed, direction, pos_x):
+        """Compute ship velocities and edge reversals."""
+        flip = np.where((pos_x <= 50) & (direction < 0), 1,
+                        np.where((pos_x >= 750) & (direction > 0), -1, 0))
+        return speed * direction, flip
+
+    def _turtle_step(timer):
+        """Compute the defensive sway velocity of idle turtles."""
+        # Scale and transform in place to avoid extra temporaries
+        vel_x = np.multiply(timer, 0.5)
+        np.sin(vel_x, out=vel_x)
+        vel_x *= 30
+        vel_y = np.multiply(timer, 0.3)
+        np.cos(vel_y, out=vel_y)
+        vel_y *= 20
+        return vel_x, vel_y
+
+    def _fish_step(timer, interval, pos_x, pos_y):
+        """Reset due wander timers in place and find fish outside the bounds."""
+        due = timer >= interval
+        timer[due] = 0.0
+        return due, (pos_x < 50) | (pos_x > 750), (pos_y < 50) | (pos_y > 550)
+
+
+def warm_up_kernels() -> None:
+    """
+    Compile the Numba kernels, or load them from the cache, ahead of time.
+
+    Numba compiles a kernel on its first call, which would otherwise stall
+    the first gameplay frame. Does nothing when Numba is unavailable.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    _ship_step(np.zeros(1), np.ones(1), np.zeros(1))
+    _turtle_step(np.zeros(1))
+    _fish_step(np.zeros(1), np.ones(1), np.zeros(1), np.zeros(1))
+
+
+class AISystem:
+    """
+    Updates every AIComponent once per frame instead of per entity.
+
+    Components of the same AI type are grouped and their per-entity state
+    (positions, directions, timers) is gathered into parallel NumPy arrays
+    so the numeric work runs as vectorized operations. Behavior state stays
+    on the components, so code reading ``ai.direction`` or
+    ``ai.wander_direction`` keeps working. The numeric kernels are compiled
+    with Numba when it is installed. Gathering the arrays and writing the
+    results back only pays off for large groups, so smaller groups, AI
+    types without a batch kernel, and every type when NumPy is unavailable
+    fall back to the component's own handler.
+    """
+
+    # Groups with fewer components than this use the components' handlers
+    VECTORIZE_MIN_GROUP = 256
+
+    def __init__(self):
+        """Initialize the AI system."""
+        # entity_id -> AIComponent driven by this system
+        self.components: Dict[str, AIComponent] = {}
+
+        # ai_type -> batch update kernel
+        self._kernels = {}
+        if NUMPY_AVAILABLE:
+            self._kernels = {
+                "ship": self._update_ships,
+                "turtle": self._update_turtles,
+                "fish": self._update_fish,
+            }
+
+    def on_entity_added(self, entity) -> None:
+        """
+        Start driving an entity's AI component.
+
+        Args:
+            entity: The entity that was added to the entity manager
+        """
+        ai = entity.get_component("ai")
+        if isinstance(ai, AIComponent):
+            ai.batched = True
+            self.components[entity.entity_id] = ai
+
+    def on_entity_removed(self, entity) -> None:
+        """
+        Stop driving an entity's AI component.
+
+        Args:
+            entity: The entity that was removed from the entity manager
+        """
+        ai = self.components.pop(entity.entity_id, None)
+        if ai:
+            ai.batched = False
+
+    def clear(self) -> None:
+        """Release all tracked components."""
+        for ai in self.components.values():
+            ai.batched = False
+        self.components.clear()
+
+    def update(self, dt: float) -> None:
+        """
+        Update all tracked AI components.
+
+        Args:
+            dt: Delta time in seconds since the last update
+        """
+        # Group live components by AI type
+        groups: Dict[str, List[AIComponent]] = {}
+        for ai in self.components.values():
+            entity = ai.entity
+            if not ai.has_behavior or not ai.enabled or entity is None or not entity.active:
+                continue
+            ai.state_timer += dt
+            groups.setdefault(ai.ai_type, []).append(ai)
+
+        for ai_type, group in groups.items():
+            kernel = self._kernels.get(ai_type)
+            if kernel and len(group) >= self.VECTORIZE_MIN_GROUP:
+                # Handlers bail out early without physics and transform
+                ready = [ai for ai in group if ai._physics and ai._transform]
+                if ready:
+                    kernel(ready, dt)
+            else:
+                for ai in group:
+                    ai._update_fn(dt)
+
+    def _update_ships(self, group: List[AIComponent], dt: float) -> None:
+        """Move ships horizontally and reverse them at the screen edges."""
+        n = len(group)
+        speed = np.fromiter((ai.ship_speed for ai in group), dtype=np.float64, count=n)
+        direction = np.fromiter((ai.direction for ai in group), dtype=np.float64, count=n)
+        pos_x = np.fromiter((ai._transform.position.x for ai in group), dtype=np.float64, count=n)
+
+        vel_x, flip = _ship_step(speed, direction, pos_x)
+
+        for ai, vx, new_direction in zip(group, vel_x.tolist(), flip.tolist()):
+            ai._physics.velocity.update(vx, 0)
+
+            # Reverse direction at the screen boundaries
+            if new_direction:
+                ai.direction = new_direction
+
+    def _update_turtles(self, group: List[AIComponent], dt: float) -> None:
+        """Sway idle turtles in their defensive pattern and keep shields up."""
+        idle = [ai for ai in group if ai.state == "idle"]
+        if idle:
+            n = len(idle)
+            timer = np.fromiter((ai.state_timer for ai in idle), dtype=np.float64, count=n) + dt
+            vel_x, vel_y = _turtle_step(timer)
+            for ai, t, vx, vy in zip(idle, timer.tolist(), vel_x.tolist(), vel_y.tolist()):
+                ai.state_timer = t
+                ai._physics.velocity.update(vx, vy)
+
+        # Keep shield active
+        for ai in group:
+            shield = ai._shield
+            if shield and not shield.active:
+                shield.activate()
+
+    def _update_fish(self, group: List[AIComponent], dt: float) -> None:
+        """Wander fish in random directions and bounce them off the screen edges."""
+        n = len(group)
+        timer = np.fromiter((ai.wander_timer for ai in group), dtype=np.float64, count=n) + dt
+        interval = np.fromiter((ai.wander_change_interval for ai in group), dtype=np.float64, count=n)
+        pos_x = np.fromiter((ai._transform.position.x for ai in group), dtype=np.float64, count=n)
+        pos_y = np.fromiter((ai._transform.position.y for ai in group), dtype=np.float64, count=n)
+
+        due, flip_x, flip_y = _fish_step(timer, interval, pos_x, pos_y)
+
+        for ai, t, change, fx, fy in zip(group, timer.tolist(), due.tolist(),
+                                         flip_x.tolist(), flip_y.tolist()):
+            ai.wander_timer = t
+
+            # Change direction periodically
+            if change:
+                ai._choose_wander_direction()
+
+            # Apply wandering velocity
+            ai._physics.velocity.update(ai.wander_direction)
+
+            # Keep fish within screen bounds
+            if fx:
+                ai.wander_direction[0] *= -1
+            if fy:
+                ai.wander_direction[1] *= -1
@@ -1,9 +1,75 @@
 """Asset manager for loading and managing game assets."""
 
 import os
+import io
+import json
+import mmap
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import pygame
 from typing import Dict, Optional, Tuple
 
+# Assets loaded by preload_assets: (name, path relative to the asset type's directory)
+_PRELOAD_IMAGES = (
+    # Player images
+    ("octopus", "player/octopus.png"),
+    
+    # Enemy images
+    ("ship_small", "enemies/ship_small.png"),
+    ("ship_medium", "enemies/ship_medium.png"),
+    ("ship_large", "enemies/ship_large.png"),
+    ("captain", "enemies/captain.png"),
+    ("turtle", "enemies/turtle.png"),
+    ("fish", "enemies/fish.png"),
+    
+    # Projectile images
+    ("ink_blue", "projectiles/ink_blue.png"),
+    ("ink_purple", "projectiles/ink_purple.png"),
+    ("ink_green", "projectiles/ink_green.png"),
+    ("ink_red", "projectiles/ink_red.png"),
+    ("ink_rainbow", "projectiles/ink_rainbow.png"),
+)
+
+_PRELOAD_SOUNDS = (
+    ("shoot", "effects/shoot.wav"),
+    ("hit", "effects/hit.wav"),
+    ("sink", "effects/sink.wav"),
+)
+
+# Upper bound on the threads decoding files during preload
+_PRELOAD_WORKERS = 8
+
+# Image files smaller than this are read into memory in one call before decoding
+_READ_WHOLE_MAX_BYTES = 4 * 1024 * 1024
+
+# Length prefix of the JSON header at the start of the preload cache file
+_CACHE_HEADER = struct.Struct('<I')
+
+# Recognized file extensions per asset type
+_IMAGE_EXTS = ('.png', '.jpg', '.jpeg', '.bmp')
+_SOUND_EXTS = ('.wav', '.ogg', '.mp3')
+_FONT_EXTS = ('.ttf', '.otf')
+
+
+@lru_cache(maxsize=512)
+def _resolve(base_path: str, file_path: str, default_ext: str, valid_exts: Tuple[str, ...]) -> str:
+    """
+    Join an asset path onto its directory, adding the default extension if it has none.
+    
+    Args:
+        base_path: Directory of the asset type
+        file_path: Path to the asset file relative to base_path
+        default_ext: Extension appended when file_path has none of valid_exts
+        valid_exts: Recognized extensions for the asset type
+        
+    Returns:
+        Full path of the asset file
+    """
+    if not file_path.endswith(valid_exts):
+        file_path += default_ext
+    return os.path.join(base_path, file_path)
+
 
 class AssetManager:
     """
@@ -27,6 +93,9 @@ class AssetManager:
         self.sound_path = os.path.join(self.base_path, "sounds")
         self.font_path = os.path.join(self.base_path, "fonts")
         
+        # Decoded pixels of the preloaded images, reused across launches
+        self._cache_path = os.path.join(self.base_path, ".cache", "preload.bin")
+        
         # Ensure asset directories exist
         os.makedirs(self.image_path, exist_ok=True)
         os.makedirs(self.sound_path, exist_ok=True)
@@ -50,35 +119,97 @@ class AssetManager:
         if name in self.images:
             return self.images[name]
             
+        # Load the image
+        full_path = self._get_image_path(name, file_path)
+        try:
+            return self._finalize_image(name, self._read_image(full_path), colorkey)
+        except pygame.error as e:
+            return self._store_placeholder_image(name, full_path, e)
+            
+    def _get_image_path(self, name: str, file_path: Optional[str]) -> str:
+        """
+        Resolve the full path of an image file.
+        
+        Args:
+            name: Identifier for the image
+            file_path: Path to the image file (relative to assets/images/)
+                       If None, uses name as the file path
+                       
+        Returns:
+            Full path of the image file
+        """
         # Determine file path
         if file_path is None:
             file_path = name
             
-        # Ensure file has extension
-        if not any(file_path.endswith(ext) for ext in ['.png', '.jpg', '.jpeg', '.bmp']):
-            file_path += '.png'  # Default to PNG
+        return _resolve(self.image_path, file_path, '.png', _IMAGE_EXTS)
+        
+    @staticmethod
+    def _read_image(full_path: str) -> pygame.Surface:
+        """
+        Read and decode an image file.
+        
+        Only decodes the file, so it is safe to call from a worker thread.
+        Small files are read with a single read call and decoded from memory
+        rather than through SDL's buffered file reads.
+        
+        Args:
+            full_path: Full path of the image file
             
-        # Load the image
-        full_path = os.path.join(self.image_path, file_path)
-        try:
-            image = pygame.image.load(full_path).convert_alpha()
+        Returns:
+            Decoded image surface in its file's pixel format
+        """
+        if os.path.getsize(full_path) < _READ_WHOLE_MAX_BYTES:
+            with open(full_path, 'rb') as f:
+                data = f.read()
+            return pygame.image.load(io.BytesIO(data), full_path)
+        return pygame.image.load(full_path)
+        
+    def _finalize_image(self, name: str, image: pygame.Surface,
+                        colorkey: Optional[Tuple[int, int, int]] = None) -> pygame.Surface:
+        """
+        Convert a decoded image to the display format and store it.
+        
+        Must run on the main thread, as it converts against the display surface.
+        
+        Args:
+            name: Identifier for the image
+            image: Decoded image surface
+            colorkey: Color to use as transparency (if any)
             
-            # Apply colorkey if specified
-            if colorkey is not None:
-                if colorkey == -1:
-                    colorkey = image.get_at((0, 0))
-                image.set_colorkey(colorkey, pygame.RLEACCEL)
-                
-            # Store and return
-            self.images[name] = image
-            return image
-        except pygame.error as e:
-            print(f"Error loading image {full_path}: {e}")
-            # Return a placeholder image (small purple square)
-            placeholder = pygame.Surface((32, 32))
-            placeholder.fill((255, 0, 255))  # Purple
-            self.images[name] = placeholder
-            return placeholder
+        Returns:
+            The stored image surface
+        """
+        image = image.convert_alpha()
+        
+        # Apply colorkey if specified
+        if colorkey is not None:
+            if colorkey == -1:
+                colorkey = image.get_at((0, 0))
+            image.set_colorkey(colorkey, pygame.RLEACCEL)
+            
+        # Store and return
+        self.images[name] = image
+        return image
+        
+    def _store_placeholder_image(self, name: str, full_path: str, error: Exception) -> pygame.Surface:
+        """
+        Report a failed image load and store a placeholder in its place.
+        
+        Args:
+            name: Identifier for the image
+            full_path: Full path of the image file
+            error: The error raised while loading
+            
+        Returns:
+            The placeholder surface
+        """
+        print(f"Error loading image {full_path}: {error}")
+        # Return a placeholder image (small purple square)
+        placeholder = pygame.Surface((32, 32))
+        placeholder.fill((255, 0, 255))  # Purple
+        self.images[name] = placeholder
+        return placeholder
             
     def load_sound(self, name: str, file_path: Optional[str] = None) -> Optional[pygame.mixer.Sound]:
         """
@@ -96,16 +227,8 @@ class AssetManager:
         if name in self.sounds:
             return self.sounds[name]
             
-        # Determine file path
-        if file_path is None:
-            file_path = name
-            
-        # Ensure file has extension
-        if not any(file_path.endswith(ext) for ext in ['.wav', '.ogg', '.mp3']):
-            file_path += '.wav'  # Default to WAV
-            
         # Load the sound
-        full_path = os.path.join(self.sound_path, file_path)
+        full_path = self._get_sound_path(name, file_path)
         try:
             sound = pygame.mixer.Sound(full_path)
             self.sounds[name] = sound
@@ -114,6 +237,24 @@ class AssetManager:
             print(f"Error loading sound {full_path}: {e}")
             return None
             
+    def _get_sound_path(self, name: str, file_path: Optional[str]) -> str:
+        """
+        Resolve the full path of a sound file.
+        
+        Args:
+            name: Identifier for the sound
+            file_path: Path to the sound file (relative to assets/sounds/)
+                       If None, uses name as the file path
+                       
+        Returns:
+            Full path of the sound file
+        """
+        # Determine file path
+        if file_path is None:
+            file_path = name
+            
+        return _resolve(self.sound_path, file_path, '.wav', _SOUND_EXTS)
+            
     def load_font(self, name: str, size: int, file_path: Optional[str] = None) -> pygame.font.Font:
         """
         Load a font asset.
@@ -139,12 +280,8 @@ class AssetManager:
         if file_path is None:
             file_path = name
             
-        # Ensure file has extension
-        if not any(file_path.endswith(ext) for ext in ['.ttf', '.otf']):
-            file_path += '.ttf'  # Default to TTF
-            
         # Load the font
-        full_path = os.path.join(self.font_path, file_path)
+        full_path = _resolve(self.font_path, file_path, '.ttf', _FONT_EXTS)
         try:
             # Try to load custom font
             font = pygame.font.Font(full_path, size)
@@ -171,7 +308,7 @@ class AssetManager:
             colorkey: Color to use as transparency (if any)
             
         Returns:
-            List of animation frames (surfaces)
+            List of animation frames (surfaces), which share pixels with the sheet
         """
         # Check if already loaded
         if name in self.animations:
@@ -180,12 +317,17 @@ class AssetManager:
         # Load the sprite sheet
         sheet = self.load_image(sprite_sheet, colorkey=colorkey)
         
-        # Extract frames
+        # Extract frames as subsurfaces sharing the sheet's pixels; frames
+        # that run off the sheet (e.g. a placeholder) are copied and clipped
         frames = []
+        sheet_rect = sheet.get_rect()
         for i in range(frame_count):
-            x = i * frame_width
-            frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-            frame.blit(sheet, (0, 0), (x, 0, frame_width, frame_height))
+            rect = pygame.Rect(i * frame_width, 0, frame_width, frame_height)
+            if sheet_rect.contains(rect):
+                frame = sheet.subsurface(rect)
+            else:
+                frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
+                frame.blit(sheet, (0, 0), rect)
             frames.append(frame)
             
         # Store and return
@@ -244,30 +386,143 @@ class AssetManager:
         return self.animations.get(name)
         
     def preload_assets(self) -> None:
-        """Preload commonly used assets to avoid loading delays during gameplay."""
-        # Preload player images
-        self.load_image("octopus", "player/octopus.png")
-        
-        # Preload enemy images
-        self.load_image("ship_small", "enemies/ship_small.png")
-        self.load_image("ship_medium", "enemies/ship_medium.png")
-        self.load_image("ship_large", "enemies/ship_large.png")
-        self.load_image("captain", "enemies/captain.png")
-        self.load_image("turtle", "enemies/turtle.png")
-        self.load_image("fish", "enemies/fish.png")
-        
-        # Preload projectile images
-        self.load_image("ink_blue", "projectiles/ink_blue.png")
-        self.load_image("ink_purple", "projectiles/ink_purple.png")
-        self.load_image("ink_green", "projectiles/ink_green.png")
-        self.load_image("ink_red", "projectiles/ink_red.png")
-        self.load_image("ink_rainbow", "projectiles/ink_rainbow.png")
-        
-        # Preload sound effects
-        self.load_sound("shoot", "effects/shoot.wav")
-        self.load_sound("hit", "effects/hit.wav")
-        self.load_sound("sink", "effects/sink.wav")
+        """
+        Preload commonly used assets to avoid loading delays during gameplay.
+        
+        Preloaded images are taken from the decoded-pixel cache written by
+        an earlier launch while their source files are unchanged. The rest,
+        and the sounds, are read and decoded on a pool of worker threads,
+        which pygame lets run in parallel, and the cache is rewritten if it
+        was stale. Images are converted to the display format on this
+        thread, in the order they are listed, since that conversion needs
+        the display surface.
+        """
+        images = [
+            (name, self._get_image_path(name, file_path))
+            for name, file_path in _PRELOAD_IMAGES if name not in self.images
+        ]
+        sounds = [
+            (name, self._get_sound_path(name, file_path))
+            for name, file_path in _PRELOAD_SOUNDS if name not in self.sounds
+        ]
+        
+        sources = self._get_cache_sources([
+            (name, self._get_image_path(name, file_path)) for name, file_path in _PRELOAD_IMAGES
+        ])
+        cached = self._load_from_cache(sources)
+        stale = cached is None
+        if stale:
+            cached = {}
+        
+        workers = min(_PRELOAD_WORKERS, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            image_loads = [(name, full_path, None if name in cached else
+                            executor.submit(self._read_image, full_path))
+                           for name, full_path in images]
+            sound_loads = [(name, full_path, executor.submit(pygame.mixer.Sound, full_path))
+                           for name, full_path in sounds]
+            
+            decoded = []
+            for name, full_path, load in image_loads:
+                if load is None:
+                    self._finalize_image(name, cached[name])
+                    continue
+                try:
+                    self._finalize_image(name, load.result())
+                    decoded.append(name)
+                except pygame.error as e:
+                    self._store_placeholder_image(name, full_path, e)
+                    
+            for name, full_path, load in sound_loads:
+                try:
+                    self.sounds[name] = load.result()
+                except pygame.error as e:
+                    print(f"Error loading sound {full_path}: {e}")
+        
+        if decoded or stale:
+            self._write_cache(sources, list(cached) + decoded)
         
         # Preload fonts
         self.load_font("main", 24)
-        self.load_font("title", 48)
\ No newline at end of file
+        self.load_font("title", 48)
+        
+    @staticmethod
+    def _get_cache_sources(images: list) -> Dict[str, Optional[int]]:
+        """
+        Stamp the source files of the preloaded images for cache invalidation.
+        
+        Args:
+            images: List of (name, full path) pairs
+            
+        Returns:
+            Dictionary of image name -> modification time in nanoseconds of
+            its source file, or None if the file does not exist
+        """
+        sources = {}
+        for name, full_path in images:
+            try:
+                sources[name] = os.stat(full_path).st_mtime_ns
+            except OSError:
+                sources[name] = None
+        return sources
+        
+    def _load_from_cache(self, sources: Dict[str, Optional[int]]) -> Optional[Dict[str, pygame.Surface]]:
+        """
+        Read the preloaded images' pixels from the cache file.
+        
+        The cache file starts with a length-prefixed JSON header holding the
+        stamps of the source files it was built from and, for each image,
+        the offset and size of its RGBA pixels in the data that follows.
+        
+        Args:
+            sources: Current source file stamps from _get_cache_sources
+            
+        Returns:
+            Dictionary of image name -> decoded surface, or None if the cache
+            is missing, unreadable or was built from different source files
+        """
+        try:
+            with open(self._cache_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                header_size, = _CACHE_HEADER.unpack_from(mm, 0)
+                data_start = _CACHE_HEADER.size + header_size
+                header = json.loads(mm[_CACHE_HEADER.size:data_start])
+                if header["sources"] != sources:
+                    return None
+                
+                images = {}
+                for name, (offset, width, height) in header["images"].items():
+                    start = data_start + offset
+                    pixels = mm[start:start + width * height * 4]
+                    images[name] = pygame.image.frombuffer(pixels, (width, height), 'RGBA')
+                return images
+        except (OSError, ValueError, KeyError, TypeError, struct.error, pygame.error):
+            return None
+        
+    def _write_cache(self, sources: Dict[str, Optional[int]], names: list) -> None:
+        """
+        Write the pixels of loaded images to the cache file.
+        
+        Args:
+            sources: Source file stamps from _get_cache_sources
+            names: Names of the loaded images to cache
+        """
+        index = {}
+        chunks = []
+        offset = 0
+        for name in names:
+            image = self.images[name]
+            pixels = pygame.image.tobytes(image, 'RGBA')
+            index[name] = (offset, image.get_width(), image.get_height())
+            chunks.append(pixels)
+            offset += len(pixels)
+            
+        header = json.dumps({"sources": sources, "images": index}).encode()
+        try:
+            os.makedirs(os.path.dirname(self._cache_path), exist_ok=True)
+            with open(self._cache_path, 'wb') as f:
+                f.write(_CACHE_HEADER.pack(len(header)))
+                f.write(header)
+                f.writelines(chunks)
+        except OSError as e:
+            print(f"Warning: Could not write asset cache {self._cache_path}: {e}")
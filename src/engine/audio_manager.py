@@ -5,14 +5,49 @@ Handles loading and playing sound effects and music.
 
 import pygame
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
+# Default game sounds: (sound_id, file path, category)
+_DEFAULT_SOUNDS = (
+    # Player sounds
+    ("player_shoot", "assets/sounds/ink_shoot.wav", "player"),
+    ("player_hit", "assets/sounds/player_hit.wav", "player"),
+    
+    # Enemy sounds
+    ("ship_hit", "assets/sounds/ship_hit.wav", "enemy"),
+    ("ship_sink", "assets/sounds/ship_sink.wav", "enemy"),
+    ("captain_panic", "assets/sounds/captain_panic.wav", "enemy"),
+    ("head_explosion", "assets/sounds/head_explosion.wav", "enemy"),
+    
+    # UI sounds
+    ("button_click", "assets/sounds/button_click.wav", "ui"),
+    ("menu_select", "assets/sounds/menu_select.wav", "ui"),
+    ("level_complete", "assets/sounds/level_complete.wav", "ui"),
+    ("game_over", "assets/sounds/game_over.wav", "ui"),
+    ("high_score", "assets/sounds/high_score.wav", "ui"),
+    ("menu_open", "assets/sounds/menu_open.wav", "ui"),
+    
+    # Environment sounds
+    ("splash", "assets/sounds/splash.wav", "environment"),
+    ("bubble", "assets/sounds/bubble.wav", "environment"),
+    ("ink_splat", "assets/sounds/ink_splat.wav", "environment"),
+    ("ink_splat_special", "assets/sounds/ink_splat_special.wav", "environment"),
+    ("explosion", "assets/sounds/explosion.wav", "environment"),
+)
+
+# Default sounds played throughout gameplay, loaded up front by
+# load_default_sounds so their first play does not decode a file mid-frame
+_EAGER_SOUNDS = frozenset({"player_shoot", "ink_splat", "ink_splat_special"})
+
+# Upper bound on the threads decoding sound files in load_sounds
+_LOAD_WORKERS = 4
+
 
 class AudioManager:
     """Manages sound effects and background music for the game."""
     
-    _instance = None
-    
     @staticmethod
     def get_instance():
         """
@@ -21,9 +56,7 @@ class AudioManager:
         Returns:
             The AudioManager instance
         """
-        if AudioManager._instance is None:
-            AudioManager._instance = AudioManager()
-        return AudioManager._instance
+        return _audio_manager_singleton()
     
     def __init__(self):
         """Initialize the audio manager."""
@@ -33,6 +66,9 @@ class AudioManager:
         # Sound effects dictionary
         self.sound_effects: Dict[str, pygame.mixer.Sound] = {}
         
+        # Sounds loaded on first play: sound_id -> (file path, category)
+        self._sound_registry: Dict[str, Tuple[str, Optional[str]]] = {}
+        
         # Music tracks dictionary
         self.music_tracks: Dict[str, str] = {}
         
@@ -51,6 +87,12 @@ class AudioManager:
             "environment": []
         }
         
+        # Reverse index of sound_categories: sound_id -> category
+        self._sound_to_category: Dict[str, str] = {}
+        
+        # Volume last applied to each loaded sound
+        self._effective_volumes: Dict[str, float] = {}
+        
         # Category volume multipliers
         self.category_volumes: Dict[str, float] = {
             "player": 1.0,
@@ -80,19 +122,76 @@ class AudioManager:
                 print(f"Warning: Sound file not found: {file_path}")
                 return False
                 
-            sound = pygame.mixer.Sound(file_path)
-            sound.set_volume(self.sound_volume)
-            self.sound_effects[sound_id] = sound
-            
-            # Add to category if specified
-            if category and category in self.sound_categories:
-                self.sound_categories[category].append(sound_id)
-                
+            self._store_sound(sound_id, pygame.mixer.Sound(file_path), category)
             return True
         except Exception as e:
             print(f"Error loading sound {sound_id} from {file_path}: {e}")
             return False
     
+    def register_sound(self, sound_id: str, file_path: str, category: str = None):
+        """
+        Register a sound effect to be loaded the first time it is played.
+        
+        Args:
+            sound_id: Unique identifier for the sound
+            file_path: Path to the sound file
+            category: Optional category for group volume control
+        """
+        self._sound_registry[sound_id] = (file_path, category)
+    
+    def load_sounds(self, sounds) -> None:
+        """
+        Load several sound effects, decoding the files on worker threads.
+        
+        The loaded sounds are stored on this thread in the order they are
+        listed. A sound that fails to load is retried with load_sound, which
+        reports the error.
+        
+        Args:
+            sounds: Iterable of (sound_id, file path, category) tuples
+        """
+        sounds = list(sounds)
+        workers = min(_LOAD_WORKERS, len(sounds), os.cpu_count() or 1)
+        if workers < 1:
+            return
+            
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            loads = []
+            for sound_id, file_path, category in sounds:
+                if not os.path.exists(file_path):
+                    print(f"Warning: Sound file not found: {file_path}")
+                    continue
+                loads.append((sound_id, file_path, category,
+                              executor.submit(pygame.mixer.Sound, file_path)))
+                
+            for sound_id, file_path, category, load in loads:
+                try:
+                    sound = load.result()
+                except Exception:
+                    self.load_sound(sound_id, file_path, category)
+                    continue
+                self._store_sound(sound_id, sound, category)
+    
+    def _store_sound(self, sound_id: str, sound: pygame.mixer.Sound, category: str = None):
+        """
+        Store a loaded sound effect and apply its volume.
+        
+        Args:
+            sound_id: Unique identifier for the sound
+            sound: The loaded sound
+            category: Optional category for group volume control
+        """
+        self.sound_effects[sound_id] = sound
+        
+        # Add to category if specified
+        if category and category in self.sound_categories:
+            self.sound_categories[category].append(sound_id)
+            self._sound_to_category[sound_id] = category
+            
+        # A freshly loaded sound always needs its volume applied
+        self._effective_volumes.pop(sound_id, None)
+        self._recompute_effective(sound_id)
+    
     def load_music(self, music_id: str, file_path: str) -> bool:
         """
         Register a music track.
@@ -131,23 +230,18 @@ class AudioManager:
         if self.muted:
             return False
             
+        # Load registered sounds on first play
+        if sound_id not in self.sound_effects and sound_id in self._sound_registry:
+            file_path, category = self._sound_registry.pop(sound_id)
+            self.load_sound(sound_id, file_path, category)
+            
         if sound_id not in self.sound_effects:
             print(f"Warning: Sound {sound_id} not loaded")
             return False
             
         try:
-            # Get the sound and play it
-            sound = self.sound_effects[sound_id]
-            
-            # Calculate effective volume based on category
-            effective_volume = self.sound_volume
-            for category, sounds in self.sound_categories.items():
-                if sound_id in sounds:
-                    effective_volume *= self.category_volumes[category]
-                    break
-            
-            sound.set_volume(effective_volume)
-            sound.play(loops, maxtime, fade_ms)
+            # The effective volume is already applied by the volume setters
+            self.sound_effects[sound_id].play(loops, maxtime, fade_ms)
             return True
         except Exception as e:
             print(f"Error playing sound {sound_id}: {e}")
@@ -246,8 +340,8 @@ class AudioManager:
         self.sound_volume = max(0.0, min(1.0, volume))
         
         # Update all loaded sound effects
-        for sound in self.sound_effects.values():
-            sound.set_volume(self.sound_volume)
+        for sound_id in self.sound_effects:
+            self._recompute_effective(sound_id)
     
     def set_music_volume(self, volume: float):
         """
@@ -273,9 +367,20 @@ class AudioManager:
             # Update all sounds in this category
             for sound_id in self.sound_categories.get(category, []):
                 if sound_id in self.sound_effects:
-                    self.sound_effects[sound_id].set_volume(
-                        self.sound_volume * self.category_volumes[category]
-                    )
+                    self._recompute_effective(sound_id)
+    
+    def _recompute_effective(self, sound_id: str):
+        """
+        Apply a loaded sound's global and category volume if it has changed.
+        
+        Args:
+            sound_id: ID of a loaded sound
+        """
+        category = self._sound_to_category.get(sound_id)
+        volume = self.sound_volume * self.category_volumes.get(category, 1.0)
+        if self._effective_volumes.get(sound_id) != volume:
+            self.sound_effects[sound_id].set_volume(volume)
+            self._effective_volumes[sound_id] = volume
     
     def mute(self):
         """Mute all audio."""
@@ -300,34 +405,23 @@ class AudioManager:
             self.mute()
     
     def load_default_sounds(self):
-        """Load default game sounds."""
-        # Player sounds
-        self.load_sound("player_shoot", "assets/sounds/ink_shoot.wav", "player")
-        self.load_sound("player_hit", "assets/sounds/player_hit.wav", "player")
-        
-        # Enemy sounds
-        self.load_sound("ship_hit", "assets/sounds/ship_hit.wav", "enemy")
-        self.load_sound("ship_sink", "assets/sounds/ship_sink.wav", "enemy")
-        self.load_sound("captain_panic", "assets/sounds/captain_panic.wav", "enemy")
-        self.load_sound("head_explosion", "assets/sounds/head_explosion.wav", "enemy")
-        
-        # UI sounds
-        self.load_sound("button_click", "assets/sounds/button_click.wav", "ui")
-        self.load_sound("menu_select", "assets/sounds/menu_select.wav", "ui")
-        self.load_sound("level_complete", "assets/sounds/level_complete.wav", "ui")
-        self.load_sound("game_over", "assets/sounds/game_over.wav", "ui")
-        self.load_sound("high_score", "assets/sounds/high_score.wav", "ui")
-        self.load_sound("menu_open", "assets/sounds/menu_open.wav", "ui")
-        
-        # Environment sounds
-        self.load_sound("splash", "assets/sounds/splash.wav", "environment")
-        self.load_sound("bubble", "assets/sounds/bubble.wav", "environment")
-        self.load_sound("ink_splat", "assets/sounds/ink_splat.wav", "environment")
-        self.load_sound("ink_splat_special", "assets/sounds/ink_splat_special.wav", "environment")
-        self.load_sound("explosion", "assets/sounds/explosion.wav", "environment")
+        """
+        Load the default game sounds played throughout gameplay and register
+        the rest, which are loaded the first time they are played.
+        """
+        self.load_sounds(sound for sound in _DEFAULT_SOUNDS if sound[0] in _EAGER_SOUNDS)
+        for sound_id, file_path, category in _DEFAULT_SOUNDS:
+            if sound_id not in _EAGER_SOUNDS:
+                self.register_sound(sound_id, file_path, category)
         
         # Music tracks
         self.load_music("main_menu", "assets/sounds/main_menu_music.mp3")
         self.load_music("gameplay", "assets/sounds/gameplay_music.mp3")
         self.load_music("boss_battle", "assets/sounds/boss_battle_music.mp3")
-        self.load_music("game_over", "assets/sounds/game_over_music.mp3")
\ No newline at end of file
+        self.load_music("game_over", "assets/sounds/game_over_music.mp3")
+
+
+@lru_cache(maxsize=1)
+def _audio_manager_singleton() -> AudioManager:
+    """Create the AudioManager on first use and return the same one afterwards."""
+    return AudioManager()
@@ -0,0 +1,162 @@
+"""Collision system for batched AABB overlap tests."""
+
+from itertools import chain
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pygame
+
+# Try to import numpy, but make it optional
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class CollisionSystem:
+    """
+    Tests groups of entities against each other in one pass.
+
+    Rectangles are stacked into ``(N, 4)`` arrays of left, top, right and
+    bottom edges so the overlap tests run as vectorized comparisons instead
+    of a ``colliderect`` call per pair. The x axis is tested first and the y
+    test only runs on the pairs that survive it. Smaller batches, where the
+    array setup costs more than it saves, and every batch when NumPy is
+    unavailable, test each rectangle of the first group against the whole
+    second group with one ``Rect.collidelistall`` call.
+    """
+
+    # Batches with fewer pairs than this use Rect.collidelistall
+    VECTORIZE_MIN_PAIRS = 8192
+
+    @staticmethod
+    def get_rect(entity) -> Optional[pygame.Rect]:
+        """
+        Build an entity's collision rectangle, centered on its position.
+
+        Args:
+            entity: The entity
+
+        Returns:
+            The collision rectangle, or None if the entity has no transform
+            or no collision component
+        """
+        transform = entity.get_component("transform")
+        collision = entity.get_component("collision")
+        if not transform or not collision:
+            return None
+
+        return pygame.Rect(
+            transform.position.x - collision.width / 2,
+            transform.position.y - collision.height / 2,
+            collision.width,
+            collision.height
+        )
+
+    def find_overlaps(self, entities_a: Sequence, entities_b: Sequence,
+                      rect_cache: Optional[Dict[str, Optional[pygame.Rect]]] = None) -> List[List]:
+        """
+        Find the entities of the second group that each entity of the first overlaps.
+
+        Args:
+            entities_a: First group of entities
+            entities_b: Second group of entities
+            rect_cache: Optional dictionary of entity_id -> collision rectangle,
+                filled in and reused across calls made while nothing moves
+
+        Returns:
+            For each entity of ``entities_a``, the entities of ``entities_b``
+            whose rectangles overlap it, in the order they appear in
+            ``entities_b``; empty for entities without a rectangle
+        """
+        overlaps = [[] for _ in entities_a]
+        rows, rects_a = self._get_rects(entities_a, rect_cache)
+        cols, rects_b = self._get_rects(entities_b, rect_cache)
+        for i, j in self.check_batch(rects_a, rects_b):
+            overlaps[rows[i]].append(entities_b[cols[j]])
+        return overlaps
+
+    def _get_rects(self, entities: Sequence,
+                   rect_cache: Optional[Dict[str, Optional[pygame.Rect]]]) -> Tuple[List[int], List[pygame.Rect]]:
+        """
+        Get the collision rectangles of the entities that have one.
+
+        Args:
+            entities: Entities to get rectangles for
+            rect_cache: Optional dictionary of entity_id -> collision rectangle
+
+        Returns:
+            Tuple of the indices of the entities with a rectangle and their rectangles
+        """
+        indices = []
+        rects = []
+        for index, entity in enumerate(entities):
+            if rect_cache is None:
+                rect = self.get_rect(entity)
+            elif entity.entity_id in rect_cache:
+                rect = rect_cache[entity.entity_id]
+            else:
+                rect = rect_cache[entity.entity_id] = self.get_rect(entity)
+            if rect is not None:
+                indices.append(index)
+                rects.append(rect)
+        return indices, rects
+
+    def check_batch(self, rects_a: Sequence[pygame.Rect], rects_b: Sequence[pygame.Rect]) -> List[Tuple[int, int]]:
+        """
+        Find every overlapping pair between two groups of rectangles.
+
+        Args:
+            rects_a: First group of rectangles
+            rects_b: Second group of rectangles
+
+        Returns:
+            List of (index in rects_a, index in rects_b) pairs that overlap,
+            ordered by the first index, then by the second
+        """
+        if not rects_a or not rects_b:
+            return []
+
+        if not NUMPY_AVAILABLE or len(rects_a) * len(rects_b) < self.VECTORIZE_MIN_PAIRS:
+            return [
+                (i, j)
+                for i, rect_a in enumerate(rects_a)
+                for j in rect_a.collidelistall(rects_b)
+            ]
+
+        a = self._bounds(rects_a)
+        b = self._bounds(rects_b)
+
+        # Empty rectangles never collide, as with colliderect
+        valid_a = (a[:, 0] < a[:, 2]) & (a[:, 1] < a[:, 3])
+        valid_b = (b[:, 0] < b[:, 2]) & (b[:, 1] < b[:, 3])
+
+        # Overlap on the x axis
+        x_overlap = (
+            (a[:, None, 0] < b[None, :, 2]) &
+            (b[None, :, 0] < a[:, None, 2]) &
+            valid_a[:, None] &
+            valid_b[None, :]
+        )
+        rows, cols = np.nonzero(x_overlap)
+        if rows.size == 0:
+            return []
+
+        # Overlap on the y axis, only for pairs that overlap on x
+        y_overlap = (a[rows, 1] < b[cols, 3]) & (b[cols, 1] < a[rows, 3])
+        return list(zip(rows[y_overlap].tolist(), cols[y_overlap].tolist()))
+
+    @staticmethod
+    def _bounds(rects: Sequence[pygame.Rect]) -> 'np.ndarray':
+        """
+        Stack rectangles into an (N, 4) array of left, top, right, bottom.
+
+        Args:
+            rects: Sequence of pygame.Rect
+
+        Returns:
+            Integer array of rectangle edges
+        """
+        count = len(rects)
+        edges = chain.from_iterable((rect.left, rect.top, rect.right, rect.bottom) for rect in rects)
+        return np.fromiter(edges, dtype=np.int32, count=count * 4).reshape(count, 4)
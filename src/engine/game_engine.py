@@ -35,12 +35,19 @@ class GameEngine:
         # Entity system
         self.entity_manager = None
         self.entity_factory = None
+        self.transform_system = None
+        self.ai_system = None
+        self.health_system = None
+        self.physics_system = None
+        self.input_system = None
         
         # Game managers
         self.scene_manager = None
         self.input_manager = None
         self.asset_manager = None
         self.physics_engine = None
+        self.shield_system = None
+        self.collision_system = None
         self.audio_manager = None
         self.ui_manager = None
         
@@ -91,6 +98,37 @@ class GameEngine:
         self.entity_factory = EntityFactory()
         self.entity_factory.set_entity_manager(self.entity_manager)
         
+        # Record previous positions before the other systems move anything
+        from src.engine.transform_system import TransformSystem
+        self.transform_system = TransformSystem()
+        self.entity_manager.add_system(self.transform_system)
+        
+        # Poll the keyboard once per frame for all input components
+        from src.engine.input_system import InputSystem
+        self.input_system = InputSystem()
+        self.entity_manager.add_system(self.input_system)
+        
+        # Batch AI updates across all entities
+        from src.engine.ai_system import AISystem
+        self.ai_system = AISystem()
+        self.entity_manager.add_system(self.ai_system)
+        
+        # Batch health invulnerability timers across all entities
+        from src.engine.health_system import HealthSystem
+        self.health_system = HealthSystem()
+        self.entity_manager.add_system(self.health_system)
+        
+        # Batch physics integration across all entities
+        from src.engine.physics_system import PhysicsSystem
+        self.physics_system = PhysicsSystem()
+        self.entity_manager.add_system(self.physics_system)
+
+        # Compile the Numba kernels now so the first gameplay frame doesn't stall
+        from src.engine import ai_system, health_system
+        from src.components import effect_component, weapon_component
+        for module in (ai_system, health_system, effect_component, weapon_component):
+            module.warm_up_kernels()
+
         # Initialize Level System
         from src.levels.level_manager import LevelManager
         from src.levels.level_generator import LevelGenerator
@@ -103,6 +141,8 @@ class GameEngine:
         from src.engine.input_manager import InputManager
         from src.engine.asset_manager import AssetManager
         from src.engine.physics_engine import PhysicsEngine
+        from src.engine.shield_system import ShieldSystem
+        from src.engine.collision_system import CollisionSystem
         from src.engine.audio_manager import AudioManager
         from src.engine.ui_manager import UIManager
         
@@ -110,6 +150,8 @@ class GameEngine:
         self.input_manager = InputManager()
         self.asset_manager = AssetManager()
         self.physics_engine = PhysicsEngine()
+        self.shield_system = ShieldSystem()
+        self.collision_system = CollisionSystem()
         self.audio_manager = AudioManager.get_instance()
         self.ui_manager = UIManager((width, height))
         
@@ -161,6 +203,11 @@ class GameEngine:
             
             # Process events
             events = pygame.event.get()
+            
+            # Poll the keyboard once, before the scene and entities act on it
+            if self.input_system:
+                self.input_system.poll()
+            
             for event in events:
                 if event.type == pygame.QUIT:
                     self.running = False
@@ -690,6 +737,9 @@ class GameEngine:
             # Get all projectiles
             projectiles = self.entity_manager.get_entities_with_tag("projectile")
             
+            # Collision rectangles, built once per entity for this pass
+            rects = {}
+            
             # Check projectile collisions with potential targets using spatial grid
             for projectile in projectiles:
                 if not projectile.active:
@@ -704,13 +754,18 @@ class GameEngine:
                 # Get potential collision targets from spatial grid
                 potential_targets = self.spatial_grid.get_potential_collisions(projectile)
                 
+                # Test the projectile against all of its targets in one batch
+                overlapping = self.collision_system.find_overlaps([projectile], potential_targets, rects)[0]
+                self.spatial_grid.actual_collisions += len(overlapping)
+                hit_ids = {entity.entity_id for entity in overlapping}
+                
                 # Check collision with ships
                 for entity in potential_targets:
                     if not entity.active:
                         continue
                         
                     # Handle ship collisions
-                    if "ship" in entity.tags and self.spatial_grid.check_collision(projectile, entity):
+                    if "ship" in entity.tags and entity.entity_id in hit_ids:
                         ship = entity
                         # Get ink slime component for damage and color
                         ink_slime = projectile.get_component("ink_slime")
@@ -764,7 +819,7 @@ class GameEngine:
                             break
                     
                     # Handle fish collisions
-                    elif "fish" in entity.tags and self.spatial_grid.check_collision(projectile, entity):
+                    elif "fish" in entity.tags and entity.entity_id in hit_ids:
                         fish = entity
                         # Get level component for scoring multiplier
                         level_comp = self.player.get_component("level")
@@ -782,7 +837,7 @@ class GameEngine:
                         break
                     
                     # Handle floating captain collisions
-                    elif "captain" in entity.tags and self.spatial_grid.check_collision(projectile, entity):
+                    elif "captain" in entity.tags and entity.entity_id in hit_ids:
                         captain = entity
                         captain_comp = captain.get_component("captain")
                         if captain_comp and captain_comp.state == "floating":
@@ -824,8 +879,12 @@ class GameEngine:
         # Get all projectiles
         projectiles = self.entity_manager.get_entities_with_tag("projectile")
         
+        # Find the turtles covering each projectile in one batched query
+        turtles = self.entity_manager.get_entities_with_tag("turtle")
+        blockers = self.shield_system.find_blockers(turtles, projectiles)
+        
         # Check projectile collisions with enemies
-        for projectile in projectiles:
+        for projectile, blocking_turtles in zip(projectiles, blockers):
             if not projectile.active:
                 continue
                 
@@ -862,8 +921,8 @@ class GameEngine:
                     
             # Check collision with turtles (they block shots)
             if projectile.active:
-                turtles = self.entity_manager.get_entities_with_tag("turtle")
-                for turtle in turtles:
+                for turtle in blocking_turtles:
+                    # A shield may have gone down earlier in this pass
                     if turtle.can_block_projectile((proj_transform.position.x, proj_transform.position.y)):
                         turtle.on_projectile_blocked()
                         projectile.destroy()
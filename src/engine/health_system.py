@@ -0,0 +1,126 @@
+"""Health system that batches HealthComponent invulnerability timers."""
+
+from typing import Dict
+
+# Try to import numpy, but make it optional
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Try to import numba, but make it optional
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+from src.components.health_component import HealthComponent
+
+
+# Counts the gathered invulnerability timers down in place and returns the
+# mask of timers that ran out
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _tick_invulnerability(timers, dt):
+        """Count invulnerability timers down, returning the expired ones."""
+        n = timers.shape[0]
+        expired = np.empty(n, np.bool_)
+        for i in range(n):
+            timers[i] -= dt
+            expired[i] = timers[i] <= 0
+        return expired
+
+elif NUMPY_AVAILABLE:
+    def _tick_invulnerability(timers, dt):
+        """Count invulnerability timers down, returning the expired ones."""
+        timers -= dt
+        return timers <= 0
+
+
+def warm_up_kernels() -> None:
+    """
+    Compile the Numba kernel, or load it from the cache, ahead of time.
+
+    Numba compiles a kernel on its first call, which would otherwise stall
+    the first gameplay frame. Does nothing when Numba is unavailable.
+    """
+    if NUMBA_AVAILABLE:
+        _tick_invulnerability(np.ones(1), 0.0)
+
+
+class HealthSystem:
+    """
+    Ticks the invulnerability timers of every HealthComponent once per frame.
+
+    The timers of the currently invulnerable components are gathered into a
+    NumPy array, counted down in one vector operation and written back, with
+    expired components dropping their invulnerability. Health state stays on
+    the components, so ``health.is_invulnerable`` and ``take_damage`` keep
+    working unchanged. The countdown is compiled with Numba when it is
+    installed. Without NumPy the timers are ticked one by one.
+    """
+
+    def __init__(self):
+        """Initialize the health system."""
+        # entity_id -> HealthComponent driven by this system
+        self.components: Dict[str, HealthComponent] = {}
+
+    def on_entity_added(self, entity) -> None:
+        """
+        Start driving an entity's health component.
+
+        Args:
+            entity: The entity that was added to the entity manager
+        """
+        health = entity.get_component("health")
+        if isinstance(health, HealthComponent):
+            health.batched = True
+            self.components[entity.entity_id] = health
+
+    def on_entity_removed(self, entity) -> None:
+        """
+        Stop driving an entity's health component.
+
+        Args:
+            entity: The entity that was removed from the entity manager
+        """
+        health = self.components.pop(entity.entity_id, None)
+        if health:
+            health.batched = False
+
+    def clear(self) -> None:
+        """Release all tracked components."""
+        for health in self.components.values():
+            health.batched = False
+        self.components.clear()
+
+    def update(self, dt: float) -> None:
+        """
+        Count down the invulnerability of all tracked components.
+
+        Args:
+            dt: Delta time in seconds since the last update
+        """
+        ticking = [
+            health for health in self.components.values()
+            if health.is_invulnerable and health.invulnerability_time > 0 and health.enabled
+            and health.entity is not None and health.entity.active
+        ]
+        if not ticking:
+            return
+
+        if not NUMPY_AVAILABLE:
+            for health in ticking:
+                health.update_invulnerability(dt)
+            return
+
+        timers = np.fromiter((health.invulnerability_time for health in ticking),
+                             dtype=np.float64, count=len(ticking))
+        expired = _tick_invulnerability(timers, dt)
+
+        for health, timer, done in zip(ticking, timers.tolist(), expired.tolist()):
+            health.invulnerability_time = timer
+            if done:
+                health.is_invulnerable = False
@@ -0,0 +1,71 @@
+"""Input system that polls the keyboard once per frame for all InputComponents."""
+
+from typing import Dict
+
+import pygame
+
+from src.components.input_component import InputComponent
+
+
+class InputSystem:
+    """
+    Polls the keyboard state once per frame and shares it with every InputComponent.
+
+    ``poll`` reads ``pygame.key.get_pressed()`` a single time and hands the
+    snapshot to each tracked component, so the number of SDL calls no longer
+    grows with the number of input-driven entities. It is called just before
+    the entities update so they act on the freshest state. Components that
+    are not tracked poll pygame themselves.
+    """
+
+    def __init__(self):
+        """Initialize the input system."""
+        # entity_id -> InputComponent driven by this system
+        self.components: Dict[str, InputComponent] = {}
+
+        # Keyboard state from the last poll
+        self.keys = None
+
+    def on_entity_added(self, entity) -> None:
+        """
+        Start sharing the keyboard state with an entity's input component.
+
+        Args:
+            entity: The entity that was added to the entity manager
+        """
+        input_component = entity.get_component("input")
+        if isinstance(input_component, InputComponent):
+            input_component.keys = self.keys
+            self.components[entity.entity_id] = input_component
+
+    def on_entity_removed(self, entity) -> None:
+        """
+        Stop sharing the keyboard state with an entity's input component.
+
+        Args:
+            entity: The entity that was removed from the entity manager
+        """
+        input_component = self.components.pop(entity.entity_id, None)
+        if input_component:
+            input_component.keys = None
+
+    def clear(self) -> None:
+        """Release all tracked components."""
+        for input_component in self.components.values():
+            input_component.keys = None
+        self.components.clear()
+
+    def poll(self) -> None:
+        """Read the keyboard state and share it with all tracked components."""
+        keys = pygame.key.get_pressed()
+        self.keys = keys
+        for input_component in self.components.values():
+            input_component.keys = keys
+
+    def update(self, dt: float) -> None:
+        """
+        Nothing to do after the entities update; input is read in ``poll``.
+
+        Args:
+            dt: Delta time in seconds since the last update
+        """
@@ -0,0 +1,63 @@
+"""Physics system that batches PhysicsComponent integration across all entities."""
+
+from typing import Dict
+
+from src.components.physics_component import PhysicsComponent
+
+
+class PhysicsSystem:
+    """
+    Integrates the velocity of every PhysicsComponent once per frame.
+
+    One loop over the tracked components calls ``integrate`` on each moving
+    body instead of going through every entity's component update. A NumPy
+    gather/kernel/write-back pass was measured slower than this loop at
+    every body count up to 2000, since writing the results back to the
+    components' vectors costs as much as the integration itself.
+    """
+
+    def __init__(self):
+        """Initialize the physics system."""
+        # entity_id -> PhysicsComponent driven by this system
+        self.components: Dict[str, PhysicsComponent] = {}
+
+    def on_entity_added(self, entity) -> None:
+        """
+        Start driving an entity's physics component.
+
+        Args:
+            entity: The entity that was added to the entity manager
+        """
+        physics = entity.get_component("physics")
+        if isinstance(physics, PhysicsComponent):
+            physics.batched = True
+            self.components[entity.entity_id] = physics
+
+    def on_entity_removed(self, entity) -> None:
+        """
+        Stop driving an entity's physics component.
+
+        Args:
+            entity: The entity that was removed from the entity manager
+        """
+        physics = self.components.pop(entity.entity_id, None)
+        if physics:
+            physics.batched = False
+
+    def clear(self) -> None:
+        """Release all tracked components."""
+        for physics in self.components.values():
+            physics.batched = False
+        self.components.clear()
+
+    def update(self, dt: float) -> None:
+        """
+        Integrate all tracked physics components.
+
+        Args:
+            dt: Delta time in seconds since the last update
+        """
+        for physics in self.components.values():
+            entity = physics.entity
+            if physics.enabled and entity is not None and entity.active:
+                physics.integrate(dt)
@@ -0,0 +1,48 @@
+"""Render system that batches placeholder blits across entities."""
+
+from typing import Iterable
+
+import pygame
+
+
+class RenderSystem:
+    """
+    Renders entities in order, batching consecutive placeholder shapes.
+
+    Entities without a sprite are drawn as pre-drawn placeholder surfaces
+    shared by every entity with the same shape, color and size. Runs of such
+    entities are handed to ``Surface.blits`` in one call instead of two draw
+    calls each. Any other entity flushes the pending run before rendering
+    itself, so the draw order, and with it the layering, is unchanged.
+    """
+
+    def render(self, surface: pygame.Surface, entities: Iterable) -> None:
+        """
+        Render entities in the given order.
+
+        Args:
+            surface: The surface to render to
+            entities: Entities to render, back to front
+        """
+        pending = []
+        for entity in entities:
+            if not entity.active:
+                continue
+
+            render_component = entity.get_component("render")
+            if not render_component or not render_component.enabled:
+                continue
+
+            blit = render_component.get_placeholder_blit(surface)
+            if blit:
+                pending.append(blit)
+                continue
+
+            # Draw the batched placeholders first to keep the layering
+            if pending:
+                surface.blits(pending, False)
+                pending = []
+            entity.render(surface)
+
+        if pending:
+            surface.blits(pending, False)
@@ -0,0 +1,90 @@
+"""Shield system for batched shield/projectile block queries."""
+
+from typing import List, Sequence
+
+# Try to import numpy, but make it optional
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class ShieldSystem:
+    """
+    Tests every projectile against every shield in one pass.
+
+    Shield centers and squared block radii are gathered into arrays and the
+    projectile positions are broadcast against them, so the S x P distance
+    tests run as a single vectorized comparison instead of a
+    ``can_block_projectile`` call per pair. Inactive or missing shields get
+    a negative squared radius and never block. Smaller batches, where the
+    array setup costs more than it saves, and every batch when NumPy is
+    unavailable, have each shield test the whole batch with
+    ``ShieldComponent.can_block_many``.
+    """
+
+    # Batches with fewer shield/projectile pairs than this use can_block_many
+    VECTORIZE_MIN_PAIRS = 512
+
+    def find_blockers(self, shielded: Sequence, projectiles: Sequence) -> List[List]:
+        """
+        Find the shielded entities covering each projectile.
+
+        Shields can go down while hits are being resolved, so callers should
+        still confirm a candidate with ``can_block_projectile`` before using it.
+
+        Args:
+            shielded: Entities that may carry a ShieldComponent
+            projectiles: Projectile entities
+
+        Returns:
+            For each projectile, the entities whose active shield covers it, in
+            the order they appear in ``shielded``; empty for projectiles
+            without a transform
+        """
+        blockers = [[] for _ in projectiles]
+        if not shielded or not projectiles:
+            return blockers
+
+        # Projectiles without a transform are never blocked
+        points = []
+        rows = []
+        for row, projectile in enumerate(projectiles):
+            transform = projectile.get_component("transform")
+            if transform:
+                points.append((transform.position.x, transform.position.y))
+                rows.append(row)
+        if not points:
+            return blockers
+
+        if not NUMPY_AVAILABLE or len(shielded) * len(points) < self.VECTORIZE_MIN_PAIRS:
+            for entity in shielded:
+                shield = entity.get_component("shield")
+                if not shield:
+                    continue
+                for row, blocked in zip(rows, shield.can_block_many(points)):
+                    if blocked:
+                        blockers[row].append(entity)
+            return blockers
+
+        count = len(shielded)
+        centers = np.zeros((count, 2))
+        radii_sq = np.full(count, -1.0)
+        for i, entity in enumerate(shielded):
+            shield = entity.get_component("shield")
+            transform = shield._transform if shield else None
+            if shield and shield.active and transform:
+                centers[i] = (transform.position.x, transform.position.y)
+                radii_sq[i] = shield._block_radius_sq
+
+        positions = np.array(points, dtype=np.float64)
+        dx = positions[:, None, 0] - centers[None, :, 0]
+        dy = positions[:, None, 1] - centers[None, :, 1]
+        blocked = dx * dx + dy * dy <= radii_sq[None, :]
+
+        # Pairs come out ordered by projectile, then by shield
+        hit_points, hit_shields = np.nonzero(blocked)
+        for p, s in zip(hit_points.tolist(), hit_shields.tolist()):
+            blockers[rows[p]].append(shielded[s])
+        return blockers
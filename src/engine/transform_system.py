@@ -0,0 +1,65 @@
+"""Transform system that records the previous position of every TransformComponent."""
+
+from typing import Dict
+
+from src.components.transform_component import TransformComponent
+
+
+class TransformSystem:
+    """
+    Stores the previous position of every TransformComponent once per frame.
+
+    The per-frame work of a transform is a single position copy, so one
+    loop over the tracked components replaces a component update per
+    entity. Positions stay in the components' ``Vector2`` objects, which the
+    rest of the game reads and mutates directly. The system is registered
+    before the other systems, so the copy is taken before AI and physics
+    move the entities for the frame.
+    """
+
+    def __init__(self):
+        """Initialize the transform system."""
+        # entity_id -> TransformComponent driven by this system
+        self.components: Dict[str, TransformComponent] = {}
+
+    def on_entity_added(self, entity) -> None:
+        """
+        Start driving an entity's transform component.
+
+        Args:
+            entity: The entity that was added to the entity manager
+        """
+        transform = entity.get_component("transform")
+        if isinstance(transform, TransformComponent):
+            transform.batched = True
+            transform.previous_position.update(transform.position)
+            self.components[entity.entity_id] = transform
+
+    def on_entity_removed(self, entity) -> None:
+        """
+        Stop driving an entity's transform component.
+
+        Args:
+            entity: The entity that was removed from the entity manager
+        """
+        transform = self.components.pop(entity.entity_id, None)
+        if transform:
+            transform.batched = False
+
+    def clear(self) -> None:
+        """Release all tracked components."""
+        for transform in self.components.values():
+            transform.batched = False
+        self.components.clear()
+
+    def update(self, dt: float) -> None:
+        """
+        Copy each tracked transform's position into its previous position.
+
+        Args:
+            dt: Delta time in seconds since the last update
+        """
+        for transform in self.components.values():
+            entity = transform.entity
+            if transform.enabled and entity is not None and entity.active:
+                transform.previous_position.update(transform.position)
@@ -25,6 +25,7 @@ class Entity:
         self.entity_id = entity_id or str(uuid.uuid4())
         self.name = name
         self.components: Dict[str, 'Component'] = {}
+        self._updating: Optional[List['Component']] = None  # Components that need update, rebuilt on change
         self.tags: List[str] = []
         self.active = True
         self.marked_for_destruction = False
@@ -43,8 +44,10 @@ class Entity:
             self.remove_component(component.component_type)
             
         self.components[component.component_type] = component
+        self._updating = None
         component.entity = self
         component.on_add()
+        self._notify_components_changed(component)
         return component
         
     def get_component(self, component_type: str) -> Optional['Component']:
@@ -80,10 +83,22 @@ class Entity:
         """
         component = self.components.pop(component_type, None)
         if component:
+            self._updating = None
             component.on_remove()
             component.entity = None
+            self._notify_components_changed(component)
         return component
         
+    def _notify_components_changed(self, changed: 'Component') -> None:
+        """Let the other components know the component set has changed.
+        
+        Args:
+            changed: The component that was added or removed
+        """
+        for component in list(self.components.values()):
+            if component is not changed:
+                component.on_components_changed()
+        
     def add_tag(self, tag: str) -> None:
         """Add a tag to the entity.
         
@@ -124,8 +139,13 @@ class Entity:
         if not self.active:
             return
             
-        # Update all enabled components
-        for component in list(self.components.values()):
+        # Update all enabled components, skipping those with nothing to update
+        components = self._updating
+        if components is None:
+            components = self._updating = [
+                component for component in self.components.values() if component.NEEDS_UPDATE
+            ]
+        for component in components:
             if component.enabled:
                 component.update(dt)
                 
@@ -156,6 +176,7 @@ class Entity:
         for component in list(self.components.values()):
             component.on_remove()
         self.components.clear()
+        self._updating = None
         
     def set_active(self, active: bool) -> None:
         """Set the active state of the entity.
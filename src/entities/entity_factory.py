@@ -1,6 +1,6 @@
 """Entity Factory for creating game entities with predefined component configurations."""
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Sequence, Tuple
 from src.entities.entity import Entity
 from src.entities.entity_manager import EntityManager
 from src.components.transform_component import TransformComponent
@@ -132,7 +132,7 @@ class EntityFactory:
         
         # Add weapon component for shooting at player
         weapon = WeaponComponent()
-        weapon.fire_rate = 1.0  # 1 shot per second
+        weapon.set_fire_rate(1.0)  # 1 shot per second
         weapon.projectile_speed = 300
         captain.add_component(weapon)
         
@@ -213,7 +213,7 @@ class EntityFactory:
         return fish
         
     def create_ink_slime(self, x: float, y: float, direction: pygame.math.Vector2,
-                        color: str = "dark_blue") -> Entity:
+                        color: str = "dark_blue", damage_multiplier: float = 1.0) -> Entity:
         """Create an ink slime projectile entity.
         
         Args:
@@ -221,6 +221,7 @@ class EntityFactory:
             y: Initial y position
             direction: Direction vector for the projectile
             color: Color of the ink ("dark_blue", "purple", "green", etc.)
+            damage_multiplier: Factor applied to the color's base ink damage
             
         Returns:
             The created ink slime entity
@@ -228,13 +229,43 @@ class EntityFactory:
         from src.entities.ink_slime import InkSlime
         
         # Create the ink slime entity
-        ink = InkSlime(x, y, direction, color)
+        ink = InkSlime(x, y, direction, color, damage_multiplier=damage_multiplier)
         
         if self.entity_manager:
             self.entity_manager.add_entity(ink)
             
         return ink
         
+    def create_ink_slimes(self, positions: Sequence[Tuple[float, float]],
+                          directions: Sequence[pygame.math.Vector2], color: str = "dark_blue",
+                          damage_multipliers: Optional[Sequence[float]] = None) -> List[Entity]:
+        """Create several ink slime projectiles and register them together.
+        
+        Args:
+            positions: Initial (x, y) position of each projectile
+            directions: Direction vector of each projectile
+            color: Color of the ink shared by all projectiles
+            damage_multipliers: Factor applied to the base ink damage of each
+                projectile (defaults to 1.0 for all)
+            
+        Returns:
+            The created ink slime entities, in order
+        """
+        from src.entities.ink_slime import InkSlime
+        
+        if damage_multipliers is None:
+            damage_multipliers = [1.0] * len(positions)
+            
+        inks = [
+            InkSlime(x, y, direction, color, damage_multiplier=damage_multiplier)
+            for (x, y), direction, damage_multiplier in zip(positions, directions, damage_multipliers)
+        ]
+        
+        if self.entity_manager:
+            self.entity_manager.add_entities(inks)
+            
+        return inks
+        
     def create_enemy_projectile(self, x: float, y: float, 
                                direction: pygame.math.Vector2) -> Entity:
         """Create an enemy projectile entity.
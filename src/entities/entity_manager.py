@@ -2,6 +2,7 @@
 
 from typing import Dict, List, Optional, Set
 from src.entities.entity import Entity
+from src.engine.render_system import RenderSystem
 
 
 class EntityManager:
@@ -21,6 +22,22 @@ class EntityManager:
         self.entities_to_add: List[Entity] = []
         self.entities_to_remove: List[str] = []
         self.tag_index: Dict[str, Set[str]] = {}  # tag -> set of entity_ids
+        self.systems: List = []  # Systems that batch-update components
+        self.render_system = RenderSystem()
+        
+    def add_system(self, system) -> None:
+        """Register a system that updates components across all entities.
+        
+        Systems are notified through ``on_entity_added``/``on_entity_removed``
+        as entities enter and leave the manager, and are updated once per
+        frame after the entities themselves.
+        
+        Args:
+            system: The system to add
+        """
+        self.systems.append(system)
+        for entity in self.entities.values():
+            system.on_entity_added(entity)
         
     def add_entity(self, entity: Entity) -> None:
         """Add an entity to the manager.
@@ -33,6 +50,17 @@ class EntityManager:
         """
         self.entities_to_add.append(entity)
         
+    def add_entities(self, entities: List[Entity]) -> None:
+        """Add several entities to the manager at once.
+        
+        Like ``add_entity``, the entities are added at the end of the
+        current frame.
+        
+        Args:
+            entities: The entities to add
+        """
+        self.entities_to_add.extend(entities)
+        
     def remove_entity(self, entity_id: str) -> None:
         """Remove an entity from the manager.
         
@@ -130,6 +158,10 @@ class EntityManager:
             if entity.marked_for_destruction:
                 self.remove_entity(entity.entity_id)
                 
+        # Update batched systems
+        for system in self.systems:
+            system.update(dt)
+            
         # Remove pending entities
         self._process_entity_removals()
         
@@ -151,9 +183,7 @@ class EntityManager:
         entities_list.sort(key=get_sort_key)
         
         # Render all active entities
-        for entity in entities_list:
-            if entity.active:
-                entity.render(surface)
+        self.render_system.render(surface, entities_list)
                 
     def clear(self) -> None:
         """Remove all entities from the manager."""
@@ -161,6 +191,10 @@ class EntityManager:
         for entity in self.entities.values():
             entity.destroy()
             
+        # Release components held by systems
+        for system in self.systems:
+            system.clear()
+            
         # Clear all data structures
         self.entities.clear()
         self.entities_to_add.clear()
@@ -178,6 +212,9 @@ class EntityManager:
                     self.tag_index[tag] = set()
                 self.tag_index[tag].add(entity.entity_id)
                 
+            for system in self.systems:
+                system.on_entity_added(entity)
+                
         self.entities_to_add.clear()
         
     def _process_entity_removals(self) -> None:
@@ -192,6 +229,9 @@ class EntityManager:
                         if not self.tag_index[tag]:
                             del self.tag_index[tag]
                             
+                for system in self.systems:
+                    system.on_entity_removed(entity)
+                    
         self.entities_to_remove.clear()
         
     def get_entity_count(self) -> int:
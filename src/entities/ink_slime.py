@@ -17,7 +17,8 @@ class InkSlime(Entity):
     """
     
     def __init__(self, x: float, y: float, direction: pygame.math.Vector2, 
-                 color: str = "dark_blue", speed: float = 500.0):
+                 color: str = "dark_blue", speed: float = 500.0,
+                 damage_multiplier: float = 1.0):
         """Initialize the InkSlime entity.
         
         Args:
@@ -26,6 +27,7 @@ class InkSlime(Entity):
             direction: Direction vector (will be normalized)
             color: Ink color
             speed: Projectile speed in pixels per second
+            damage_multiplier: Factor applied to the color's base ink damage
         """
         super().__init__(name=f"InkSlime_{color}")
         
@@ -39,7 +41,7 @@ class InkSlime(Entity):
         self._setup_render(color)
         self._setup_physics(direction, speed)
         self._setup_collision()
-        self._setup_ink_slime(color)
+        self._setup_ink_slime(color, damage_multiplier)
         
     def _setup_transform(self, x: float, y: float, direction: pygame.math.Vector2) -> None:
         """Set up the transform component."""
@@ -90,7 +92,7 @@ class InkSlime(Entity):
         collision.collision_type = "projectile"
         self.add_component(collision)
         
-    def _setup_ink_slime(self, color: str) -> None:
+    def _setup_ink_slime(self, color: str, damage_multiplier: float = 1.0) -> None:
         """Set up the ink slime component."""
         # Different colors might have different ink damage
         ink_damage_map = {
@@ -102,6 +104,6 @@ class InkSlime(Entity):
             "black": 10
         }
         
-        ink_damage = ink_damage_map.get(color, 10)
+        ink_damage = int(ink_damage_map.get(color, 10) * damage_multiplier)
         ink_slime = InkSlimeComponent(ink_color=color, ink_damage=ink_damage)
         self.add_component(ink_slime)
\ No newline at end of file
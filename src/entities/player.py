@@ -32,8 +32,8 @@ class OctopusRenderComponent(RenderComponent):
         # Draw arms first (behind body)
         if weapon:
             arm_positions = weapon.get_arm_positions()
-            for i, arm_pos in enumerate(arm_positions):
-                arm = weapon.arms[i]
+            for i, (arm_x, arm_y) in enumerate(arm_positions):
+                cooldown = weapon.arm_cooldowns[i]
                 arm_role = weapon.get_arm_role(i)
                 
                 # Set arm line color and thickness based on role
@@ -53,11 +53,11 @@ class OctopusRenderComponent(RenderComponent):
                 # Draw arm line from body center to arm tip
                 pygame.draw.line(surface, line_color,
                                (int(position.x), int(position.y)),
-                               (int(arm_pos.x), int(arm_pos.y)), line_thickness)
+                               (int(arm_x), int(arm_y)), line_thickness)
                 
                 # Draw arm tip circle
                 # Color arm tips based on role and cooldown
-                if arm["cooldown"] > 0:
+                if cooldown > 0:
                     # Red when on cooldown (darker for inactive arms)
                     if arm_role == "inactive":
                         tip_color = (100, 25, 25)  # Dark red
@@ -75,7 +75,7 @@ class OctopusRenderComponent(RenderComponent):
                         tip_size = 6 if arm_role == "center" else 5
                 
                 pygame.draw.circle(surface, tip_color,
-                                 (int(arm_pos.x), int(arm_pos.y)), tip_size)
+                                 (int(arm_x), int(arm_y)), tip_size)
         
         # Draw octopus body (on top of arms)
         super().render(surface)
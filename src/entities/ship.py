@@ -78,7 +78,7 @@ class Ship(Entity):
         
         # Physics component
         physics = PhysicsComponent()
-        physics.velocity = (self.config["speed"] * direction, 0)
+        physics.velocity.update(self.config["speed"] * direction, 0)
         self.add_component(physics)
         
         # Render component (placeholder until sprites are available)
@@ -10,6 +10,8 @@ from typing import Dict, Any, Optional
 from src.states.game_state import GameState
 from src.levels.level_manager import LevelManager
 from src.levels.level_generator import LevelGenerator
+from src.engine.shield_system import ShieldSystem
+from src.engine.collision_system import CollisionSystem
 
 
 class GameplayState(GameState):
@@ -34,6 +36,12 @@ class GameplayState(GameState):
         self.level_manager = game_engine.level_manager
         self.level_generator = game_engine.level_generator
         
+        # Batched shield/projectile block queries
+        self.shield_system = ShieldSystem()
+        
+        # Batched projectile/target overlap tests
+        self.collision_system = CollisionSystem()
+        
         # Game state
         self.score = 0
         self.paused = False
@@ -242,29 +250,42 @@ class GameplayState(GameState):
         if not self.entity_manager:
             return
             
-        # Get all projectiles
-        projectiles = self.entity_manager.get_entities_with_tag("projectile")
+        # Only active ink slime projectiles with a transform and collision can hit
+        projectiles = [
+            projectile for projectile in self.entity_manager.get_entities_with_tag("projectile")
+            if projectile.active
+            and projectile.get_component("transform")
+            and projectile.get_component("collision")
+            and projectile.get_component("ink_slime")
+        ]
+        if not projectiles:
+            return
+        
+        # Find the turtles covering each projectile in one batched query
+        turtles = self.entity_manager.get_entities_with_tag("turtle")
+        blockers = self.shield_system.find_blockers(turtles, projectiles)
+        
+        # Find the ships, fish and captains each projectile overlaps in one
+        # batched test per group; nothing moves while hits are resolved, so
+        # each rectangle is built once and shared between the groups
+        rects = {}
+        ships = self.entity_manager.get_entities_with_tag("ship")
+        fish_entities = self.entity_manager.get_entities_with_tag("fish")
+        captains = self.entity_manager.get_entities_with_tag("captain")
+        ship_hits = self.collision_system.find_overlaps(projectiles, ships, rects)
+        fish_hits = self.collision_system.find_overlaps(projectiles, fish_entities, rects)
+        captain_hits = self.collision_system.find_overlaps(projectiles, captains, rects)
         
         # Check projectile collisions with enemies
-        for projectile in projectiles:
-            if not projectile.active:
-                continue
-                
+        for projectile, blocking_turtles, hit_ships, hit_fish, hit_captains in zip(
+                projectiles, blockers, ship_hits, fish_hits, captain_hits):
             proj_transform = projectile.get_component("transform")
-            proj_collision = projectile.get_component("collision")
-            
-            if not proj_transform or not proj_collision:
-                continue
-                
-            # Get ink slime component for damage and color
             ink_slime = projectile.get_component("ink_slime")
-            if not ink_slime:
-                continue
                 
             # Check collision with ships
-            ships = self.entity_manager.get_entities_with_tag("ship")
-            for ship in ships:
-                if self._check_collision(projectile, ship):
+            for ship in hit_ships:
+                # Entities destroyed earlier in this pass no longer collide
+                if ship.get_component("collision"):
                     # Ship hit by ink
                     ship.on_ink_hit(ink_slime.ink_color, ink_slime.ink_damage)
                     
@@ -281,8 +302,8 @@ class GameplayState(GameState):
                     
             # Check collision with turtles (they block shots)
             if projectile.active:
-                turtles = self.entity_manager.get_entities_with_tag("turtle")
-                for turtle in turtles:
+                for turtle in blocking_turtles:
+                    # A shield may have gone down earlier in this pass
                     if turtle.can_block_projectile((proj_transform.position.x, proj_transform.position.y)):
                         turtle.on_projectile_blocked()
                         projectile.destroy()
@@ -290,9 +311,8 @@ class GameplayState(GameState):
                         
             # Check collision with fish
             if projectile.active:
-                fish_entities = self.entity_manager.get_entities_with_tag("fish")
-                for fish in fish_entities:
-                    if self._check_collision(projectile, fish):
+                for fish in hit_fish:
+                    if fish.get_component("collision"):
                         # Get level component for scoring multiplier
                         level_comp = self.player.get_component("level")
                         score_multiplier = level_comp.get_scoring_multiplier() if level_comp else 1.0
@@ -307,11 +327,10 @@ class GameplayState(GameState):
                         
             # Check collision with floating captains
             if projectile.active:
-                captains = self.entity_manager.get_entities_with_tag("captain")
-                for captain in captains:
+                for captain in hit_captains:
                     captain_comp = captain.get_component("captain")
                     if captain_comp and captain_comp.state == "floating":
-                        if self._check_collision(projectile, captain):
+                        if captain.get_component("collision"):
                             # Get level component for scoring multiplier
                             level_comp = self.player.get_component("level")
                             score_multiplier = level_comp.get_scoring_multiplier() if level_comp else 1.0
@@ -324,41 +343,6 @@ class GameplayState(GameState):
                             projectile.destroy()
                             break
                             
-    def _check_collision(self, entity1, entity2) -> bool:
-        """Check if two entities are colliding.
-        
-        Args:
-            entity1: First entity
-            entity2: Second entity
-            
-        Returns:
-            True if entities are colliding
-        """
-        transform1 = entity1.get_component("transform")
-        collision1 = entity1.get_component("collision")
-        transform2 = entity2.get_component("transform")
-        collision2 = entity2.get_component("collision")
-        
-        if not all([transform1, collision1, transform2, collision2]):
-            return False
-            
-        # Simple AABB collision detection
-        rect1 = pygame.Rect(
-            transform1.position.x - collision1.width / 2,
-            transform1.position.y - collision1.height / 2,
-            collision1.width,
-            collision1.height
-        )
-        
-        rect2 = pygame.Rect(
-            transform2.position.x - collision2.width / 2,
-            transform2.position.y - collision2.height / 2,
-            collision2.width,
-            collision2.height
-        )
-        
-        return rect1.colliderect(rect2)
-        
     def _update_captains_on_ships(self) -> None:
         """Update captain positions to follow their ships."""
         if not self.entity_manager:
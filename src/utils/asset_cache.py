@@ -43,6 +43,9 @@ class AssetCache:
         # Sprite sheet cache: filename -> Dict[str, Surface]
         self.sprite_sheets: Dict[str, Dict[str, pygame.Surface]] = {}
         
+        # Tinted sprite cache: (source Surface, color) -> tinted Surface
+        self.tinted: Dict[Tuple[pygame.Surface, Tuple[int, int, int]], pygame.Surface] = {}
+        
         # Base paths for asset types
         self.base_paths = {
             "images": "assets/images",
@@ -292,6 +295,31 @@ class AssetCache:
             # Return empty dictionary
             return {}
             
+    def get_tinted(self, surface: pygame.Surface, color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Get a color-multiplied copy of a surface, tinting it only once.
+        
+        The returned surface is shared, so callers must not modify it.
+        
+        Args:
+            surface: Source surface
+            color: Tint color multiplied into the surface's RGB channels
+            
+        Returns:
+            The tinted surface
+        """
+        key = (surface, color)
+        tinted = self.tinted.get(key)
+        if tinted is not None:
+            self.cache_hits += 1
+            return tinted
+            
+        self.cache_misses += 1
+        tinted = surface.copy()
+        tinted.fill(color, special_flags=pygame.BLEND_MULT)
+        self.tinted[key] = tinted
+        return tinted
+        
     def preload_assets(self, asset_list: Dict[str, List[str]]):
         """
         Preload a list of assets to ensure they're in the cache.
@@ -329,8 +357,8 @@ class AssetCache:
         Clear the asset cache.
         
         Args:
-            asset_type: Type of assets to clear ("images", "sounds", "fonts", "animations", "sprite_sheets"),
-                       or None to clear all
+            asset_type: Type of assets to clear ("images", "sounds", "fonts", "animations", "sprite_sheets",
+                       "tinted"), or None to clear all
         """
         if asset_type is None or asset_type == "images":
             self.images.clear()
@@ -347,6 +375,9 @@ class AssetCache:
         if asset_type is None or asset_type == "sprite_sheets":
             self.sprite_sheets.clear()
             
+        if asset_type is None or asset_type == "tinted":
+            self.tinted.clear()
+            
     def get_stats(self) -> Dict[str, Any]:
         """
         Get statistics about the asset cache.
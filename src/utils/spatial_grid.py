@@ -3,7 +3,7 @@ Spatial partitioning system for efficient collision detection.
 This system divides the game world into a grid to reduce the number of collision checks needed.
 """
 
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 import pygame
 from src.entities.entity import Entity
 
@@ -38,7 +38,7 @@ class SpatialGrid:
         self.grid: Dict[Tuple[int, int], List[Entity]] = {}
         
         # Entity to cell mapping for quick lookups
-        self.entity_cells: Dict[int, Set[Tuple[int, int]]] = {}
+        self.entity_cells: Dict[int, List[Tuple[int, int]]] = {}
         
         # Debug information
         self.collision_checks = 0
@@ -54,11 +54,22 @@ class SpatialGrid:
         """
         Update the grid with the current positions of all entities.
         
+        Cell lists are emptied and refilled rather than reallocated, so
+        a grid over a stable play area stops allocating after warm-up.
+        
         Args:
             entities: List of all active entities
         """
-        # Clear the grid
-        self.clear()
+        grid = self.grid
+        entity_cells = self.entity_cells
+        cell_size = self.cell_size
+        last_col = self.cols - 1
+        last_row = self.rows - 1
+        
+        # Empty the cells, keeping their lists for reuse
+        for cell in grid.values():
+            cell.clear()
+        entity_cells.clear()
         
         # Add each entity to the appropriate grid cells
         for entity in entities:
@@ -75,30 +86,31 @@ class SpatialGrid:
             # Calculate entity bounds
             x = transform.position.x
             y = transform.position.y
-            width = collision.width
-            height = collision.height
+            half_width = collision.width / 2
+            half_height = collision.height / 2
             
             # Calculate grid cells that the entity overlaps
-            min_col = max(0, int((x - width / 2) / self.cell_size))
-            max_col = min(self.cols - 1, int((x + width / 2) / self.cell_size))
-            min_row = max(0, int((y - height / 2) / self.cell_size))
-            max_row = min(self.rows - 1, int((y + height / 2) / self.cell_size))
+            min_col = max(0, int((x - half_width) / cell_size))
+            max_col = min(last_col, int((x + half_width) / cell_size))
+            min_row = max(0, int((y - half_height) / cell_size))
+            max_row = min(last_row, int((y + half_height) / cell_size))
             
             # Add entity to each overlapping cell
-            entity_id = entity.entity_id
-            self.entity_cells[entity_id] = set()
-            
+            cells = []
             for col in range(min_col, max_col + 1):
                 for row in range(min_row, max_row + 1):
                     cell_key = (col, row)
                     
                     # Create cell if it doesn't exist
-                    if cell_key not in self.grid:
-                        self.grid[cell_key] = []
+                    cell = grid.get(cell_key)
+                    if cell is None:
+                        cell = grid[cell_key] = []
                         
                     # Add entity to cell
-                    self.grid[cell_key].append(entity)
-                    self.entity_cells[entity_id].add(cell_key)
+                    cell.append(entity)
+                    cells.append(cell_key)
+                    
+            entity_cells[entity.entity_id] = cells
                     
     def get_potential_collisions(self, entity: Entity) -> List[Entity]:
         """
@@ -232,7 +244,7 @@ class SpatialGrid:
             Dictionary with grid statistics
         """
         return {
-            "cells": len(self.grid),
+            "cells": sum(1 for cell in self.grid.values() if cell),
             "entities": len(self.entity_cells),
             "collision_checks": self.collision_checks,
             "potential_collisions": self.potential_collisions,